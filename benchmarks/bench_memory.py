@@ -0,0 +1,35 @@
+""" Memory used per instance by Salary and Numeric objects
+
+Usage:
+    python benchmarks/bench_memory.py [count]
+"""
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wage import Numeric, Salary  # noqa: E402
+
+
+def measure(label, factory, count):
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(i) for i in range(count)]
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    per_object = (current - sys.getsizeof(objects)) / count
+    print(f'{label:40}: {current / 2 ** 20:9.1f} MiB  ({per_object:7.1f} bytes/instance)')
+    return objects
+
+
+def main(count=1000000):
+    periods = ('hour', 'day', 'month', 'year')
+    measure('Numeric', lambda i: Numeric(i), count)
+    measure('Salary', lambda i: Salary(i, periods[i % 4]), count)
+    measure('Salary with custom calendar', lambda i: Salary(i, periods[i % 4], hours=1500 + i % 10), count)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,40 @@
+""" Timings for Salary conversion and serialization
+
+Usage:
+    python benchmarks/bench_salary.py [count]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from wage import Salary  # noqa: E402
+
+
+def timed(label, func, salaries):
+    start = time.perf_counter()
+    for salary in salaries:
+        func(salary)
+    elapsed = time.perf_counter() - start
+    print(f'{label:40}: {elapsed:8.4f}s  ({elapsed / len(salaries) * 1e6:8.2f} us/salary)')
+
+
+def main(count=10000):
+    def population():
+        return [Salary(15 + i % 100, ('hour', 'day', 'month', 'year')[i % 4], hours=2080 - i % 7)
+                for i in range(count)]
+
+    salaries = population()
+    timed('per_period_summary (first call)', lambda s: s.per_period_summary, salaries)
+    timed('per_period_summary (repeat call)', lambda s: s.per_period_summary, salaries)
+    salaries = population()
+    timed('serialize (first call)', lambda s: s.serialize(), salaries)
+    timed('serialize (repeat call)', lambda s: s.serialize(), salaries)
+    salaries = population()
+    timed('hourly..yearly properties (first call)', lambda s: [
+        s.hourly, s.daily, s.weekly, s.fortnightly, s.monthly, s.quarterly, s.semesterly, s.yearly], salaries)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
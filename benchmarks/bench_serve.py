@@ -0,0 +1,105 @@
+""" Load generator for `wage serve`
+
+Starts the service in a subprocess, sends requests over keep-alive
+connections and reports p50/p99 latency and requests per second.
+
+Usage:
+    python benchmarks/bench_serve.py [--requests 5000] [--connections 16] [--workers N]
+                                     [--executor process|thread] [--batch N]
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def request_bytes(batch):
+    if batch:
+        body = json.dumps([{'amount': 15 + i, 'period': 'hour', 'hours': 1500} for i in range(batch)]).encode()
+        target = '/convert/batch'
+    else:
+        body = json.dumps({'amount': 15, 'period': 'hour', 'hours': 1500}).encode()
+        target = '/convert'
+    return (f'POST {target} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n'.encode() + body)
+
+
+async def connection(port, payload, count, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(payload)
+            await writer.drain()
+            head = await reader.readuntil(b'\r\n\r\n')
+            length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def load(port, requests, connections, batch):
+    payload = request_bytes(batch)
+    latencies = []
+    per_connection = [requests // connections + (i < requests % connections) for i in range(connections)]
+    start = time.perf_counter()
+    await asyncio.gather(*[connection(port, payload, count, latencies) for count in per_connection])
+    return latencies, time.perf_counter() - start
+
+
+def wait_until_ready(port, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError('Server did not start')
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Load test the wage HTTP service')
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--connections', type=int, default=16)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--executor', default='process', choices=['process', 'thread'])
+    parser.add_argument('--batch', type=int, default=0, help='items per /convert/batch request (0: single /convert)')
+    options = parser.parse_args(args)
+
+    port = free_port()
+    command = [sys.executable, '-m', 'wage.interface', 'serve', f'port={port}', f'executor={options.executor}']
+    if options.workers:
+        command.append(f'workers={options.workers}')
+    server = subprocess.Popen(command, cwd=str(ROOT), stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(port)
+        latencies, elapsed = asyncio.run(load(port, options.requests, options.connections, options.batch))
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    items = options.requests * (options.batch or 1)
+    print(f'requests: {options.requests}  connections: {options.connections}  batch: {options.batch}')
+    print(f'p50: {p50 * 1000:.2f} ms  p99: {p99 * 1000:.2f} ms')
+    print(f'requests/sec: {options.requests / elapsed:.0f}  conversions/sec: {items / elapsed:.0f}')
+
+
+if __name__ == '__main__':
+    main()
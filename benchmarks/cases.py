@@ -0,0 +1,127 @@
+""" Benchmark cases for the wage package
+
+Each case is a function taking a population size and returning a
+(setup, run) pair: setup builds fresh inputs for one timed round and run
+performs the work being measured on them.
+"""
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+from wage import Numeric, Salary
+from wage.interface import salary_report
+from wage.report import render
+
+ROOT = Path(__file__).resolve().parent.parent
+
+periods = ('hour', 'day', 'week', 'fortnight', 'month', 'quarter', 'semester', 'year')
+properties = ('hourly', 'daily', 'weekly', 'fortnightly', 'monthly', 'quarterly', 'semesterly', 'yearly')
+
+
+def salary_args(size):
+    return [(10 + (i * 7919) % 100000 / 100, periods[i % len(periods)], 1500 + i % 600) for i in range(size)]
+
+
+def population(size, backend='decimal'):
+    return [Salary(amount, period, hours=hours, backend=backend) for amount, period, hours in salary_args(size)]
+
+
+def salary_construction(size):
+    def run(args):
+        for amount, period, hours in args:
+            Salary(amount, period, hours=hours)
+    return lambda: salary_args(size), run
+
+
+def salary_property(name):
+    def case(size):
+        def run(salaries):
+            for salary in salaries:
+                getattr(salary, name)
+        return lambda: population(size), run
+    return case
+
+
+def per_period_summary(backend):
+    def case(size):
+        def run(salaries):
+            for salary in salaries:
+                salary.per_period_summary
+        return lambda: population(size, backend), run
+    return case
+
+
+def serialize(backend):
+    def case(size):
+        def run(salaries):
+            for salary in salaries:
+                salary.serialize()
+        return lambda: population(size, backend), run
+    return case
+
+
+def serialize_by_period(size):
+    def run(salaries):
+        for salary in salaries:
+            for period in periods:
+                salary.serialize_by_period(period)
+    return lambda: population(size), run
+
+
+def numeric_dollars(size):
+    def run(values):
+        for value in values:
+            Numeric(value).dollars
+    return lambda: [amount for amount, _, _ in salary_args(size)], run
+
+
+def numeric_format_dollars_many(size):
+    def run(values):
+        Numeric.format_dollars_many(values)
+    return lambda: [amount for amount, _, _ in salary_args(size)], run
+
+
+def interface_salary_report(size):
+    def run(salaries):
+        out = io.StringIO()
+        for salary in salaries:
+            out.write(salary_report(salary))
+    return lambda: population(size), run
+
+
+def report_render(fmt):
+    def case(size):
+        def run(salaries):
+            render(salaries, io.StringIO(), fmt)
+        return lambda: population(size), run
+    return case
+
+
+def cli_startup(size):
+    """ Cold start of the command line interface (size independent) """
+    command = [sys.executable, '-m', 'wage.interface', '15', 'hour']
+
+    def run(_):
+        subprocess.run(command, cwd=str(ROOT), check=True, stdout=subprocess.DEVNULL)
+    return lambda: None, run
+
+
+cases = {
+    'salary_construction': salary_construction,
+    **{f'property_{name}': salary_property(name) for name in properties},
+    'per_period_summary': per_period_summary('decimal'),
+    'per_period_summary_fixed': per_period_summary('fixed'),
+    'serialize': serialize('decimal'),
+    'serialize_fixed': serialize('fixed'),
+    'serialize_by_period': serialize_by_period,
+    'numeric_dollars': numeric_dollars,
+    'numeric_format_dollars_many': numeric_format_dollars_many,
+    'interface_salary_report': interface_salary_report,
+    **{f'report_render_{fmt}': report_render(fmt) for fmt in ('table', 'csv', 'text')},
+}
+
+# Cases whose cost does not depend on the population size, run once per suite
+fixed_cases = {
+    'cli_startup': cli_startup,
+}
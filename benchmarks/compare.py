@@ -0,0 +1,48 @@
+""" Compare two benchmark result files written by benchmarks/run.py
+
+Usage:
+    python benchmarks/compare.py baseline.json candidate.json [--threshold 0.10]
+
+Exits with status 1 when any case is slower than the baseline by more than
+the threshold (a fraction of the baseline minimum time).
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as fp:
+        suite = json.load(fp)
+    return {(r['case'], r['size']): r for r in suite['results']}
+
+
+def compare(baseline, candidate, threshold=0.10):
+    """ Yield (case, size, baseline min, candidate min, ratio, regressed) for shared results """
+    for key in sorted(set(baseline) & set(candidate)):
+        before = baseline[key]['min']
+        after = candidate[key]['min']
+        ratio = after / before if before else float('inf')
+        yield key[0], key[1], before, after, ratio, ratio > 1 + threshold
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Compare two wage benchmark runs')
+    parser.add_argument('baseline')
+    parser.add_argument('candidate')
+    parser.add_argument('--threshold', type=float, default=0.10)
+    options = parser.parse_args(args)
+
+    regressions = 0
+    for case, size, before, after, ratio, regressed in compare(
+            load(options.baseline), load(options.candidate), options.threshold):
+        flag = 'REGRESSION' if regressed else ''
+        print(f'{case:30} {size:>8}  {before:10.6f}s -> {after:10.6f}s  x{ratio:6.2f}  {flag}')
+        regressions += regressed
+    if regressions:
+        print(f'{regressions} regression(s) above {options.threshold:.0%}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
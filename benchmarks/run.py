@@ -0,0 +1,84 @@
+""" Run the wage benchmark suite and save the results as JSON
+
+Usage:
+    python benchmarks/run.py [--sizes 100 1000 10000] [--repeat 5] [--case NAME ...] [--output results.json]
+
+Compare two saved runs with benchmarks/compare.py.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.cases import cases, fixed_cases  # noqa: E402
+
+
+def measure(case, size, repeat):
+    setup, run = case(size)
+    timings = []
+    for _ in range(repeat):
+        data = setup()
+        start = time.perf_counter()
+        run(data)
+        timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'per_item': min(timings) / size,
+    }
+
+
+def run_suite(sizes, repeat=5, names=None, report=print):
+    results = []
+    for name, case in cases.items():
+        if names and name not in names:
+            continue
+        for size in sizes:
+            result = dict(case=name, size=size, **measure(case, size, repeat))
+            report(format_result(result))
+            results.append(result)
+    for name, case in fixed_cases.items():
+        if names and name not in names:
+            continue
+        result = dict(case=name, size=1, **measure(case, 1, repeat))
+        report(format_result(result))
+        results.append(result)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def format_result(result):
+    return (f"{result['case']:30} {result['size']:>8}  min {result['min']:10.6f}s  "
+            f"median {result['median']:10.6f}s  {result['per_item'] * 1e6:10.2f} us/item")
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Run the wage benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--case', dest='cases', action='append', help='only run the named case(s)')
+    parser.add_argument('--output', help='write results to this JSON file')
+    options = parser.parse_args(args)
+
+    suite = run_suite(options.sizes, options.repeat, options.cases)
+    if options.output:
+        with open(options.output, 'w') as fp:
+            json.dump(suite, fp, indent=2)
+    return suite
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,5 @@
 #!/bin/bash
-tests="test/test_formatters.py test/test_salary.py"
+tests="test/test_formatters.py test/test_salary.py test/test_batch.py test/test_streaming.py test/test_parallel.py test/test_fixedpoint.py test/test_paycalendar.py test/test_benchmarks.py test/test_instrumentation.py test/test_server.py test/test_interface.py test/test_startup.py test/test_columnar.py test/test_aggregate.py test/test_population.py test/test_report.py test/test_cache.py test/test_aio.py test/test_sweep.py test/test_currency.py test/test_parsing.py test/test_businessdays.py test/test_projection.py"
 for t in $tests
 do
     echo ""
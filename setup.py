@@ -8,6 +8,9 @@ setup(
     packages=find_packages(),
     python_requires='>=3.7',
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     author='Marcus Bowman',
     author_email='miliarch.mb@gmail.com',
     description='A python module for modeling and converting salary/income information',
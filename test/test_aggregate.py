@@ -0,0 +1,169 @@
+import io
+import json
+import random
+import unittest
+import unittest.mock
+from contextlib import redirect_stderr, redirect_stdout
+from wage import Salary
+from wage import streaming
+from wage.aggregate import PeriodStats, PopulationStats, QuantileSketch
+from wage.interface import main
+
+rows_csv = 'amount,period,hours\n15,hour,\n15,hour,1500\n60000,year,\n5000,month,\n'
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def test_invalid_accuracy(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(0)
+        with self.assertRaises(ValueError):
+            QuantileSketch().quantile(1.5)
+
+    def test_empty(self):
+        self.assertIsNone(QuantileSketch().quantile(0.5))
+
+    def test_quantiles_within_accuracy(self):
+        rng = random.Random(1)
+        values = sorted(rng.lognormvariate(11, 0.5) for _ in range(10000))
+        sketch = QuantileSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        for q in (0, 0.1, 0.5, 0.9, 0.99, 1):
+            exact = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q) / exact, 1, delta=0.01)
+
+    def test_zero_and_negative(self):
+        sketch = QuantileSketch()
+        for value in (-100, 0, 0, 100):
+            sketch.add(value)
+        self.assertAlmostEqual(sketch.quantile(0), -100, delta=1)
+        self.assertEqual(sketch.quantile(0.5), 0)
+        self.assertAlmostEqual(sketch.quantile(1), 100, delta=1)
+
+    def test_bounded_buckets(self):
+        sketch = QuantileSketch(0.01, max_buckets=50)
+        for exponent in range(-2, 10):
+            sketch.add(10 ** exponent)
+            sketch.add(3 * 10 ** exponent)
+        self.assertLessEqual(len(list(sketch.buckets())), 50)
+        self.assertEqual(len(sketch), 24)
+        self.assertAlmostEqual(sketch.quantile(1) / 3e9, 1, delta=0.01)
+
+    def test_merge(self):
+        rng = random.Random(2)
+        values = [rng.uniform(1, 1000) for _ in range(1000)]
+        whole, first, second = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (first if i % 2 else second).add(value)
+        first.merge(second)
+        self.assertEqual(list(first.buckets()), list(whole.buckets()))
+        with self.assertRaises(ValueError):
+            first.merge(QuantileSketch(0.05))
+
+
+class TestPopulationStats(unittest.TestCase):
+
+    def test_period_stats(self):
+        stats = PeriodStats()
+        for value in (10, 20, 30, 40):
+            stats.add(value)
+        self.assertEqual((stats.count, stats.sum, stats.min, stats.max, stats.mean), (4, 100, 10, 40, 25))
+        self.assertEqual(stats.quantile(0), 10)
+        self.assertEqual(stats.quantile(1), 40)
+        histogram = stats.histogram(3)
+        self.assertEqual(histogram[0][0], 10)
+        self.assertEqual(histogram[-1][1], 40)
+        self.assertEqual(sum(count for _, _, count in histogram), 4)
+        self.assertEqual(PeriodStats().histogram(), [])
+        self.assertIsNone(PeriodStats().mean)
+
+    def test_salaries_rows_and_converted_rows_agree(self):
+        rows = list(streaming.read_rows(io.StringIO(rows_csv)))
+        from_salaries = PopulationStats().update(streaming.row_salary(row) for row in rows)
+        from_rows = PopulationStats().update(rows)
+        from_converted = PopulationStats().update(streaming.convert_rows(rows))
+        self.assertEqual(from_salaries.to_dict(), from_rows.to_dict())
+        self.assertEqual(from_salaries.to_dict(), from_converted.to_dict())
+        self.assertEqual(len(from_rows), 4)
+        yearly = from_rows['yearly']
+        self.assertEqual(yearly.min, Salary(15, 'hour', hours=1500).yearly.float)
+        self.assertEqual(yearly.max, 60000)
+        self.assertAlmostEqual(yearly.sum, 31200 + 22500 + 60000 + 60000)
+
+    def test_merge(self):
+        rows = list(streaming.read_rows(io.StringIO(rows_csv)))
+        whole = PopulationStats().update(rows)
+        merged = PopulationStats().update(rows[:2]).merge(PopulationStats().update(rows[2:]))
+        self.assertEqual(merged.to_dict(), whole.to_dict())
+
+    def test_invalid_rows(self):
+        rows = [{'amount': '15', 'period': 'hour'}, {'amount': '15a', 'period': 'hour'}]
+        with self.assertRaises(ValueError):
+            PopulationStats().update(rows)
+        skipped = []
+        stats = PopulationStats().update(rows, errors='skip', on_error=lambda n, row, err: skipped.append(n))
+        self.assertEqual(skipped, [2])
+        self.assertEqual(len(stats), 1)
+
+    def test_non_finite_rows(self):
+        for value in ('inf', 'nan', float('inf')):
+            with self.assertRaises(ValueError):
+                PeriodStats().add(value)
+        rows = [{'amount': 'Infinity', 'period': 'hour'}, {'amount': 'NaN', 'period': 'hour'},
+                {'amount': '1e400', 'period': 'year'}, {'amount': '1e999999', 'period': 'hour'},
+                {'amount': '15', 'period': 'hour'}]
+        skipped = []
+        stats = PopulationStats().update(rows, errors='skip', on_error=lambda n, row, err: skipped.append(n))
+        self.assertEqual(skipped, [1, 2, 3, 4])
+        self.assertEqual({field: period.count for field, period in stats.periods.items()},
+                         dict.fromkeys(stats.fields, 1))
+        self.assertEqual(stats['yearly'].sum, 31200)
+
+    def test_cli_stats_skips_non_finite_rows(self):
+        out, err = io.StringIO(), io.StringIO()
+        rows = 'amount,period\nInfinity,hour\nNaN,hour\n15,hour\n'
+        with redirect_stdout(out), redirect_stderr(err), unittest.mock.patch('sys.stdin', io.StringIO(rows)):
+            main(['stats', 'errors=skip'])
+        obj = json.loads(out.getvalue(), parse_constant=self.fail)
+        self.assertEqual(obj['yearly']['count'], 1)
+        self.assertEqual(len(err.getvalue().splitlines()), 2)
+
+    def test_to_dict(self):
+        stats = PopulationStats().update([Salary(15, 'hour')])
+        obj = json.loads(json.dumps(stats.to_dict(percentiles=(50, 99.9))))
+        self.assertEqual(set(obj), set(streaming.period_fields))
+        self.assertEqual(obj['yearly']['percentiles'], {'p50': 31200.0, 'p99.9': 31200.0})
+
+    def test_cli_stats(self):
+        out = io.StringIO()
+        with redirect_stdout(out), unittest.mock.patch('sys.stdin', io.StringIO(rows_csv)):
+            main(['stats', 'percentiles=50'])
+        obj = json.loads(out.getvalue())
+        self.assertEqual(obj['yearly']['count'], 4)
+        self.assertEqual(list(obj['yearly']['percentiles']), ['p50'])
+
+    def test_update_skips_malformed_jsonl(self):
+        fp = io.StringIO('{"amount": 15, "period": "hour"}\nnot json\n[1, 2]\n')
+        skipped = []
+        stats = PopulationStats().update(streaming.read_rows(fp, 'jsonl'), 'skip', lambda *e: skipped.append(e[0]))
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(skipped, [2, 3])
+
+    def test_cli_stats_invalid_percentiles(self):
+        for percentiles in ('150', '-1', 'nan', '50,x'):
+            with self.assertRaises(ValueError):
+                main(['stats', f'percentiles={percentiles}'])
+
+    def test_cli_stats_reports_skipped_rows(self):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err), \
+                unittest.mock.patch('sys.stdin', io.StringIO(rows_csv + '15a,hour,\n')):
+            main(['stats', 'errors=skip'])
+        self.assertEqual(json.loads(out.getvalue())['yearly']['count'], 4)
+        self.assertEqual(err.getvalue(), 'Skipped row 5: Value not numeric: 15a\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import asyncio
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from wage import Salary
+from wage.aio import aconvert
+
+
+async def collect(items, **kwargs):
+    return [result async for result in aconvert(items, **kwargs)]
+
+
+async def agen(items, delay=0):
+    for item in items:
+        if delay:
+            await asyncio.sleep(delay)
+        yield item
+
+
+def items(n):
+    return [{'amount': 10 + i, 'period': 'hour'} for i in range(n)]
+
+
+class TestAconvert(unittest.TestCase):
+
+    def test_sync_iterable_in_order(self):
+        results = asyncio.run(collect(items(200), chunk_size=16))
+        self.assertEqual([r['amount']['float'] for r in results], [10.0 + i for i in range(200)])
+        self.assertEqual(results[0], Salary(10, 'hour').to_dict())
+
+    def test_async_iterable(self):
+        results = asyncio.run(collect(agen(items(20)), window=2, chunk_size=3))
+        self.assertEqual(len(results), 20)
+        self.assertEqual(results[-1]['amount']['float'], 29.0)
+
+    def test_slow_source_is_not_delayed_by_chunking(self):
+        results = asyncio.run(collect(agen(items(3), delay=0.01), chunk_size=1000))
+        self.assertEqual(len(results), 3)
+
+    def test_calendar_kwargs_and_errors(self):
+        results = asyncio.run(collect([{'amount': 15, 'period': 'hour', 'hours': 1500}, {'amount': '1a', 'period': 'hour'},
+                                       {'amount': 15, 'period': 'invalid'}, None]))
+        self.assertEqual(results[0]['per_period_summary']['year']['float'], 22500.0)
+        self.assertEqual(results[1], {'error': 'Value not numeric: 1a'})
+        self.assertIn('error', results[2])
+        self.assertIn('error', results[3])
+
+    def test_executors(self):
+        with ThreadPoolExecutor(2) as executor:
+            self.assertEqual(len(asyncio.run(collect(items(50), executor=executor, chunk_size=8))), 50)
+        with ProcessPoolExecutor(2) as executor:
+            results = asyncio.run(collect(items(50), executor=executor, chunk_size=8))
+        self.assertEqual(results[-1]['amount']['float'], 59.0)
+
+    def test_custom_convert(self):
+        results = asyncio.run(collect(range(5), convert=lambda chunk: [n * 2 for n in chunk]))
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+
+    def test_backpressure(self):
+        produced = []
+
+        async def source():
+            for i in range(10000):
+                produced.append(i)
+                yield {'amount': i, 'period': 'hour'}
+
+        async def consume():
+            results = aconvert(source(), window=2, chunk_size=10)
+            await results.__anext__()
+            await asyncio.sleep(0.05)
+            count = len(produced)
+            await results.aclose()
+            return count
+
+        count = asyncio.run(consume())
+        # Queue (window * chunk_size) plus chunks in flight, never the whole source
+        self.assertLessEqual(count, 2 * 10 + 2 * 10 + 1)
+
+    def test_source_error_after_results(self):
+        async def source():
+            yield {'amount': 1, 'period': 'hour'}
+            raise RuntimeError('broken source')
+
+        async def consume():
+            out = []
+            with self.assertRaises(RuntimeError):
+                async for result in aconvert(source()):
+                    out.append(result)
+            return out
+
+        self.assertEqual(len(asyncio.run(consume())), 1)
+
+    def test_invalid_window(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(collect([], window=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
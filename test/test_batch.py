@@ -0,0 +1,94 @@
+import random
+import unittest
+from decimal import Decimal
+from wage import Salary
+
+try:
+    import numpy
+    from wage.batch import SalaryBatch
+    from wage.paycalendar import PayCalendar
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestSalaryBatch(unittest.TestCase):
+
+    def test_invalid_input_invalid_amount(self):
+        with self.assertRaises(ValueError):
+            SalaryBatch(['15a'], ['hour'])
+
+    def test_invalid_input_invalid_period(self):
+        with self.assertRaises(ValueError):
+            SalaryBatch([15, 15], ['hour', 'invalid'])
+
+    def test_invalid_input_invalid_kwarg_value(self):
+        with self.assertRaises(ValueError):
+            SalaryBatch([15], ['hour'], hours=['1a'])
+
+    def test_invalid_input_non_positive_kwarg_value(self):
+        with self.assertRaises(ValueError):
+            SalaryBatch([15, 15], 'hour', hours=[0, 2080])
+        with self.assertRaises(ValueError):
+            SalaryBatch([15, 15], 'hour', weeks=-52)
+
+    def test_shared_period(self):
+        b = SalaryBatch([15, 20], 'hour')
+        self.assertEqual(len(b), 2)
+        self.assertEqual(list(b.yearly), [31200.0, 41600.0])
+
+    def test_period_codes(self):
+        b = SalaryBatch([15, 31200], [0, 7])
+        self.assertEqual(list(b.hourly), [15.0, 15.0])
+
+    def test_salary_period_calculations(self):
+        b = SalaryBatch([15, 15600], ['hour', 'year'], hours=[2080, 1040], months=[12, 10])
+        self.assertEqual(list(b.hourly), [15.0, 15.0])
+        self.assertEqual(list(b.daily), [120.0, 60.0])
+        self.assertEqual(list(b.weekly), [600.0, 300.0])
+        self.assertEqual(list(b.fortnightly), [1200.0, 600.0])
+        self.assertEqual(list(b.monthly), [2600.0, 1560.0])
+        self.assertEqual(list(b.quarterly), [7800.0, 3900.0])
+        self.assertEqual(list(b.semesterly), [15600.0, 7800.0])
+        self.assertEqual(list(b.yearly), [31200.0, 15600.0])
+
+    def test_custom_period_value_int_casting(self):
+        b = SalaryBatch([15], ['hour'], hours=2075.5)
+        self.assertEqual(b.times_per_year[0, 0], 2075)
+
+    def test_custom_periods_in_year_year_ineffective(self):
+        b = SalaryBatch([15], ['hour'], years=3)
+        self.assertEqual(b.times_per_year[0, 7], 1)
+
+    def test_rounding_ties_half_even(self):
+        b = SalaryBatch([0.125, 0.135], ['hour', 'hour'])
+        self.assertEqual(list(b.quantized()[:, 0]), [12, 14])
+        self.assertEqual(Salary('0.125', 'hour').hourly.dollars, '$0.12')
+        self.assertEqual(Salary('0.135', 'hour').hourly.dollars, '$0.14')
+
+    def test_shared_calendar(self):
+        b = SalaryBatch([15, 31200], ['hour', 'year'], calendar=PayCalendar(hours=1500), days=200)
+        self.assertIs(b.calendar, PayCalendar(hours=1500, days=200))
+        self.assertEqual(list(b.rounded()[:, 1]), [112.5, 156.0])
+        self.assertIsNone(SalaryBatch([15, 15], 'hour', hours=[1500, 2080]).calendar)
+
+    def test_matches_scalar_to_the_cent(self):
+        rng = random.Random(1234)
+        periods = list(SalaryBatch.periods)
+        amounts, rows, hours, weeks = [], [], [], []
+        for _ in range(500):
+            amounts.append(Decimal(rng.randint(100, 50000000)) / 100)
+            rows.append(rng.choice(periods))
+            hours.append(rng.randint(1000, 2600))
+            weeks.append(rng.randint(48, 52))
+        b = SalaryBatch([float(a) for a in amounts], rows, hours=hours, weeks=weeks)
+        rounded = b.rounded()
+        for i, amount in enumerate(amounts):
+            s = Salary(amount, rows[i], hours=hours[i], weeks=weeks[i])
+            for j, period in enumerate(periods):
+                expected = s.per_period(s.yearly.decimal, period).dollars
+                self.assertEqual(f'${rounded[i, j]:,.2f}', expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from benchmarks import compare, run
+from benchmarks.cases import cases
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_run_suite(self):
+        suite = run.run_suite([2, 3], repeat=1, names=['salary_construction', 'serialize'], report=lambda line: None)
+        self.assertIn('python', suite['meta'])
+        self.assertEqual([(r['case'], r['size']) for r in suite['results']],
+                         [('salary_construction', 2), ('salary_construction', 3), ('serialize', 2), ('serialize', 3)])
+        for result in suite['results']:
+            self.assertLessEqual(result['min'], result['median'])
+
+    def test_every_case_runs(self):
+        for name, case in cases.items():
+            setup, func = case(2)
+            func(setup())
+
+    def test_compare(self):
+        baseline = {('serialize', 10): {'min': 1.0}, ('salary_construction', 10): {'min': 1.0}}
+        candidate = {('serialize', 10): {'min': 1.05}, ('salary_construction', 10): {'min': 1.5}, ('new', 10): {'min': 1}}
+        rows = list(compare.compare(baseline, candidate, threshold=0.1))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual([(r[0], r[5]) for r in rows], [('salary_construction', True), ('serialize', False)])
+
+
+if __name__ == '__main__':
+    unittest.main()
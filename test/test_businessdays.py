@@ -0,0 +1,101 @@
+import itertools
+import unittest
+from datetime import date
+from wage import Salary
+from wage.businessdays import BusinessCalendar
+from wage.paycalendar import PayCalendar
+from wage.population import Population
+
+
+class TestBusinessCalendar(unittest.TestCase):
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            BusinessCalendar('daily')
+        with self.assertRaises(ValueError):
+            BusinessCalendar(roll='nearest')
+        with self.assertRaises(ValueError):
+            BusinessCalendar(hours_per_day=0)
+        with self.assertRaises(ValueError):
+            BusinessCalendar(weekend=range(7))
+
+    def test_working_days(self):
+        business = BusinessCalendar()
+        self.assertEqual(len(business.working_days(2026)), 261)
+        self.assertEqual(len(business.working_days(2024)), 262)
+        self.assertEqual(len(business.working_days(2023)), 260)
+        days = business.working_days(2026)
+        self.assertEqual((days[0], days[-1]), (date(2026, 1, 1), date(2026, 12, 31)))
+        self.assertTrue(all(day.weekday() < 5 for day in days))
+        self.assertIs(business.working_days(2026), days)
+        self.assertEqual(len(BusinessCalendar(weekend=(4, 5)).working_days(2026)), 261)
+
+    def test_holidays(self):
+        holidays = [date(2026, 1, 1), date(2026, 7, 4), date(2026, 12, 25), date(2027, 1, 1)]
+        business = BusinessCalendar(holidays=holidays)
+        # 2026-07-04 falls on a Saturday
+        self.assertEqual(business.holidays(2026), {date(2026, 1, 1), date(2026, 12, 25)})
+        self.assertEqual(len(business.working_days(2026)), 259)
+        self.assertFalse(business.is_working_day(date(2026, 12, 25)))
+        self.assertTrue(business.is_working_day(date(2026, 12, 24)))
+        recurring = BusinessCalendar(holidays=lambda year: [date(year, 1, 1), date(year, 12, 25)])
+        self.assertEqual(recurring.working_days(2026), business.working_days(2026))
+        self.assertEqual(len(recurring.working_days(2027)), 261 - 1)
+
+    def test_pay_dates(self):
+        weekly = BusinessCalendar('weekly').pay_dates(2026)
+        self.assertEqual(len(weekly), 52)
+        self.assertEqual(weekly[:2], (date(2026, 1, 2), date(2026, 1, 9)))
+        self.assertEqual(len(BusinessCalendar('weekly').pay_dates(2027)), 53)
+        fortnightly = BusinessCalendar('fortnightly', anchor=date(2026, 1, 9)).pay_dates(2026)
+        self.assertEqual(len(fortnightly), 26)
+        self.assertEqual(fortnightly[0], date(2026, 1, 9))
+        self.assertEqual(len(BusinessCalendar('semi-monthly').pay_dates(2026)), 24)
+        monthly = BusinessCalendar('monthly').pay_dates(2026)
+        self.assertEqual(len(monthly), 12)
+        # 2026-01-31 is a Saturday
+        self.assertEqual(monthly[0], date(2026, 1, 30))
+        following = BusinessCalendar('monthly', roll='following').pay_dates(2026)
+        self.assertEqual(following[0], date(2026, 2, 2))
+
+    def test_pay_dates_skip_holidays(self):
+        business = BusinessCalendar('weekly', holidays=[date(2026, 12, 25), date(2026, 12, 24)])
+        self.assertIn(date(2026, 12, 23), business.pay_dates(2026))
+        self.assertNotIn(date(2026, 12, 25), business.pay_dates(2026))
+
+    def test_iter_pay_dates(self):
+        business = BusinessCalendar('monthly')
+        dates = business.iter_pay_dates(2026)
+        self.assertEqual(list(itertools.islice(dates, 13))[-1], date(2027, 1, 29))
+        self.assertNotIn(2028, business._pay_dates)
+        self.assertEqual(len(list(business.iter_pay_dates(2026, 2029))), 36)
+        self.assertEqual(list(business.iter_pay_dates(2026, 2026)), [])
+
+    def test_occurrences(self):
+        business = BusinessCalendar('weekly', hours_per_day=7)
+        self.assertEqual(business.occurrences(2027), {'hours': 261 * 7, 'days': 261, 'weeks': 53})
+        self.assertEqual(BusinessCalendar().occurrences(2026), {'hours': 2088, 'days': 261})
+        business.occurrences(2027).clear()
+        self.assertEqual(len(business.occurrences(2027)), 3)
+
+    def test_pay_calendar(self):
+        business = BusinessCalendar('fortnightly')
+        calendar = business.pay_calendar(2026)
+        self.assertIs(calendar, PayCalendar(hours=2088, days=261, fortnights=26))
+        self.assertIs(business.pay_calendar(2026), calendar)
+        self.assertEqual(business.pay_calendar(2026, PayCalendar(months=13))['month'], 13)
+
+    def test_salary(self):
+        business = BusinessCalendar(holidays=[date(2026, 1, 1)])
+        salary = Salary(31200, 'year', **business.occurrences(2026))
+        self.assertEqual((salary.days_in_year, salary.hours_in_year), (260, 2080))
+        salaries = [Salary(amount, 'hour', **business.occurrences(2024)) for amount in range(10, 20)]
+        self.assertEqual(len({id(salary.calendar) for salary in salaries}), 1)
+        population = Population(salaries)
+        population.set_calendar(**business.occurrences(2026))
+        self.assertIs(salaries[0].calendar, business.pay_calendar(2026))
+        self.assertEqual(salaries[0].yearly.value, 10 * 2080)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import threading
+import unittest
+from decimal import Decimal
+from wage import Numeric, Salary
+from wage.cache import ConversionCache
+from wage.paycalendar import PayCalendar
+
+
+class TestConversionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = Salary.conversion_cache = ConversionCache(maxsize=2)
+
+    def tearDown(self):
+        Salary.conversion_cache = None
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            ConversionCache(0)
+        with self.assertRaises(ValueError):
+            ConversionCache(policy='random')
+
+    def test_shared_conversions(self):
+        s1 = Salary(15, 'hour')
+        s2 = Salary(15, 'hour')
+        self.assertIs(s1.yearly, s2.yearly)
+        self.assertIs(s1.weekly, s2.weekly)
+        self.assertEqual(s1.per_period_summary, s2.per_period_summary)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+
+    def test_distinct_keys(self):
+        s1 = Salary(15, 'hour')
+        s2 = Salary(15, 'hour', hours=1500)
+        s3 = Salary(15, 'day')
+        s4 = Salary(15, 'hour', backend='fixed')
+        self.assertEqual(s1.yearly.decimal, Decimal(31200))
+        self.assertEqual(s2.yearly.decimal, Decimal(22500))
+        self.assertEqual(s3.yearly.decimal, Decimal(3900))
+        self.assertEqual(type(s4.yearly).__name__, 'FixedPoint')
+        self.assertEqual(self.cache.stats()['misses'], 4)
+
+    def test_equal_amounts_with_different_exponents(self):
+        amounts = ('15', '15.00', '1.5E+1', '-0', '0')
+        cached = [repr(Salary(amount, 'hour').yearly) for amount in amounts]
+        Salary.conversion_cache = None
+        self.assertEqual(cached, [repr(Salary(amount, 'hour').yearly) for amount in amounts])
+        self.assertEqual(cached[1], "Numeric(Decimal('31200.00'))")
+
+    def test_results_match_uncached(self):
+        cached = [Salary(a, p, hours=h).per_period_summary for a, p, h in ((15, 'hour', 1500), (31200, 'year', 2080))]
+        Salary.conversion_cache = None
+        uncached = [Salary(a, p, hours=h).per_period_summary for a, p, h in ((15, 'hour', 1500), (31200, 'year', 2080))]
+        self.assertEqual(cached, uncached)
+
+    def test_invalidation_does_not_leak(self):
+        s1 = Salary(31200, 'year')
+        s2 = Salary(31200, 'year')
+        self.assertEqual(s2.hourly.decimal, Decimal(15))
+        s1.hours_in_year = 1950
+        s1.amount = Numeric(62400)
+        self.assertEqual(s1.hourly.decimal, Decimal(32))
+        self.assertEqual(s2.hourly.decimal, Decimal(15))
+        self.assertEqual(Salary(31200, 'year').hourly.decimal, Decimal(15))
+
+    def test_calendar_change_keeps_shared_entry(self):
+        s1 = Salary(31200, 'year')
+        s2 = Salary(31200, 'year')
+        weekly = s1.weekly
+        s1.calendar = PayCalendar(hours=1950)
+        self.assertIs(s1.weekly, weekly)
+        self.assertEqual(s1.hourly.decimal, Decimal(16))
+        self.assertEqual(s2.hourly.decimal, Decimal(15))
+
+    def test_lru_eviction(self):
+        Salary(1, 'hour').yearly
+        Salary(2, 'hour').yearly
+        Salary(1, 'hour').yearly
+        Salary(3, 'hour').yearly
+        self.assertEqual(self.cache.stats(), {'hits': 1, 'misses': 3, 'evictions': 1, 'size': 2, 'maxsize': 2,
+                                              'hit_rate': 0.25})
+        Salary(1, 'hour').yearly
+        self.assertEqual(self.cache.hits, 2)
+
+    def test_fifo_eviction(self):
+        self.cache = Salary.conversion_cache = ConversionCache(maxsize=2, policy='fifo')
+        for amount in (1, 2, 1, 3, 1):
+            Salary(amount, 'hour').yearly
+        self.assertEqual((self.cache.hits, self.cache.misses, self.cache.evictions), (1, 4, 2))
+
+    def test_clear(self):
+        Salary(1, 'hour').yearly
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+        self.assertEqual(self.cache.stats()['hit_rate'], 0.0)
+
+    def test_thread_safety(self):
+        self.cache = Salary.conversion_cache = ConversionCache(maxsize=8)
+        results = []
+
+        def convert():
+            for i in range(500):
+                results.append(Salary(i % 16, 'hour').yearly.decimal)
+
+        threads = [threading.Thread(target=convert) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 2000)
+        self.assertEqual(stats['misses'] - stats['evictions'], stats['size'])
+        self.assertEqual(sorted(set(results)), [Decimal(i * 2080) for i in range(16)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from decimal import Decimal
+from wage import Salary
+from wage import streaming
+
+try:
+    import numpy
+    from wage.columnar import ColumnarFile, ColumnarWriter
+    from wage.interface import main
+    from wage.paycalendar import PayCalendar
+except ImportError:
+    numpy = None
+
+rows_csv = 'amount,period,hours\n15,hour,\n15,hour,1500\n31200.005,year,\n2600.015,month,1500\n'
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestColumnar(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'salaries.wagec')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write_csv(self, text=rows_csv, **kwargs):
+        with ColumnarWriter(self.path) as writer:
+            writer.write_rows(streaming.read_rows(io.StringIO(text)), **kwargs)
+
+    def test_round_trip_rows(self):
+        self.write_csv()
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(len(columns), 4)
+            self.assertEqual(columns.amounts.tolist(), [1500, 1500, 3120000, 260002])
+            self.assertEqual(columns.period_codes.tolist(), [0, 0, 7, 4])
+            self.assertEqual(columns.calendar_ids.tolist(), [0, 1, 0, 1])
+            self.assertEqual(columns.calendars, (PayCalendar(), PayCalendar(hours=1500)))
+
+    def test_extra_columns_ignored(self):
+        self.write_csv('name,amount,period,hours,years\nAda,15,hour,1500,3\nBo,20,hour,,\n')
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(columns.amounts.tolist(), [1500, 2000])
+            self.assertEqual(columns.calendars, (PayCalendar(hours=1500), PayCalendar()))
+
+    def test_out_of_range_amounts(self):
+        rows = 'amount,period\n1e30,hour\n92233720368547758.08,year\n-92233720368547758.08,year\n15,hour\n'
+        skipped = []
+        self.write_csv(rows, errors='skip', on_error=lambda number, row, err: skipped.append((number, str(err))))
+        self.assertEqual(skipped, [(1, 'Value out of range: 1e30'), (2, 'Value out of range: 92233720368547758.08')])
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(columns.amounts.tolist(), [-2 ** 63, 1500])
+        with self.assertRaisesRegex(ValueError, 'Invalid row 1: Value out of range: 1e30'):
+            self.write_csv(rows)
+
+    def test_views_are_zero_copy(self):
+        self.write_csv()
+        with ColumnarFile(self.path) as columns:
+            for column in (columns.amounts, columns.period_codes, columns.calendar_ids):
+                self.assertFalse(column.flags.owndata)
+                self.assertFalse(column.flags.writeable)
+
+    def test_batch_matches_salary(self):
+        self.write_csv()
+        with ColumnarFile(self.path) as columns:
+            rounded = columns.batch().rounded()
+        for i, row in enumerate(streaming.read_rows(io.StringIO(rows_csv))):
+            salary = streaming.row_salary(row)
+            salary.amount = Decimal(row['amount']).quantize(Decimal('0.01'))
+            expected = [float(round(getattr(salary, f).decimal, 2)) for f in streaming.period_fields]
+            self.assertEqual(rounded[i].tolist(), expected)
+
+    def test_batch_single_calendar_slice(self):
+        with ColumnarWriter(self.path) as writer:
+            writer.write([1500, 3120000, 100], [0, 7, 0])
+        with ColumnarFile(self.path) as columns:
+            batch = columns.batch(1, 3)
+            self.assertEqual(batch.calendar, PayCalendar())
+            self.assertEqual(batch.yearly.tolist(), [31200.0, 2080.0])
+
+    def test_write_arrays_chunks(self):
+        calendar = PayCalendar(hours=1500)
+        with ColumnarWriter(self.path) as writer:
+            calendar_id = writer.calendar_id(calendar)
+            writer.write(numpy.arange(3), 0, calendar_id)
+            writer.write(numpy.arange(3, 5), [1, 2], [calendar_id, calendar_id])
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(columns.amounts.tolist(), [0, 1, 2, 3, 4])
+            self.assertEqual(columns.period_codes.tolist(), [0, 0, 0, 1, 2])
+            self.assertEqual(columns.calendars, (calendar,))
+
+    def test_empty(self):
+        with ColumnarWriter(self.path):
+            pass
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(len(columns), 0)
+            self.assertEqual(len(columns.batch()), 0)
+
+    def test_invalid_rows(self):
+        text = 'amount,period\n15,hour\n15a,hour\n15,invalid\n20,hour\n'
+        with self.assertRaises(ValueError):
+            self.write_csv(text)
+        skipped = []
+        self.write_csv(text, errors='skip', on_error=lambda number, row, err: skipped.append(number))
+        self.assertEqual(skipped, [2, 3])
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(columns.amounts.tolist(), [1500, 2000])
+
+    def test_invalid_codes(self):
+        with ColumnarWriter(self.path) as writer:
+            with self.assertRaises(ValueError):
+                writer.write([1], [8])
+            with self.assertRaises(ValueError):
+                writer.write([1], [0], [1])
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as fp:
+            fp.write(b'amount,period\n')
+        with self.assertRaises(ValueError):
+            ColumnarFile(self.path)
+
+    def test_cli_pack(self):
+        source = os.path.join(self.directory, 'salaries.csv')
+        with open(source, 'w') as fp:
+            fp.write(rows_csv)
+        main(['pack', source, self.path])
+        with ColumnarFile(self.path) as columns:
+            self.assertEqual(len(columns), 4)
+            self.assertEqual(columns.batch().yearly[0], Salary(15, 'hour').yearly.float)
+
+
+if __name__ == '__main__':
+    unittest.main()
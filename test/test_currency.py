@@ -0,0 +1,117 @@
+import io
+import json
+import random
+import unittest
+from decimal import Decimal
+from wage import Numeric, Salary
+from wage.currency import MoneyFormat, formats, get_format, register
+from wage.fixedpoint import FixedPoint
+from wage.interface import salary_report
+from wage.report import render
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestCurrency(unittest.TestCase):
+
+    def tearDown(self):
+        Numeric.money_format = formats['en_US']
+        formats.pop('test', None)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            MoneyFormat(position='middle')
+        with self.assertRaises(ValueError):
+            MoneyFormat(decimals=-1)
+        with self.assertRaises(ValueError):
+            get_format('xx_XX')
+        with self.assertRaises(TypeError):
+            register('test', '$')
+
+    def test_builtin_formats(self):
+        value = Decimal('-1234567.125')
+        self.assertEqual(get_format('en_US').format(value), Numeric.format_dollars(value))
+        self.assertEqual(get_format('en_GB').format(value), '£-1,234,567.12')
+        self.assertEqual(get_format('de_DE').format(value), '-1.234.567,12 €')
+        self.assertEqual(get_format('fr_FR').format(value), '-1 234 567,12 €')
+        self.assertEqual(get_format('de_CH').format(value), 'CHF -1’234’567.12')
+        self.assertEqual(get_format('ja_JP').format(value), '¥-1,234,567')
+
+    def test_custom_format(self):
+        money_format = MoneyFormat('{kr}', group='', point=',', position='suffix', space=True)
+        register('test', money_format)
+        self.assertIs(get_format('test'), money_format)
+        self.assertIs(get_format(money_format), money_format)
+        self.assertEqual(money_format.format(1234.5), '1234,50 {kr}')
+
+    def test_format_many(self):
+        values = [1, 1.5, Decimal('1234.5612'), -3]
+        for money_format in formats.values():
+            self.assertEqual(money_format.format_many(values), [money_format.format(v) for v in values])
+        self.assertEqual(formats['en_US'].format_many(values), Numeric.format_dollars_many(values))
+        Numeric.money_format = formats['de_DE']
+        self.assertEqual(Numeric.format_dollars_many(values), formats['de_DE'].format_many(values))
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_format_many_array(self):
+        values = numpy.array([1.0, 2600.005, 1234567.891])
+        self.assertEqual(formats['de_DE'].format_many(values), [formats['de_DE'].format(v) for v in values.tolist()])
+
+    def test_format_units_matches_format(self):
+        rng = random.Random(3)
+        # Around 2 ** 51 format_units switches from float to exact formatting
+        edges = [2 ** 51 - 1, 2 ** 51, 1 - 2 ** 51, 2 ** 70]
+        for money_format in formats.values():
+            for units in [0, -5, 99, 100, -123456789] + edges + [rng.randint(-10 ** 10, 10 ** 10) for _ in range(50)]:
+                self.assertEqual(money_format.format_units(units, 2), money_format.format(Decimal(units).scaleb(-2)))
+
+    def test_numeric_money_format(self):
+        n = Numeric('1234.5')
+        self.assertEqual(n.format_money('de_DE'), '1.234,50 €')
+        self.assertEqual(n.format_money(), '$1,234.50')
+        Numeric.money_format = get_format('de_DE')
+        self.assertEqual(Numeric('1234.5').dollars, '1.234,50 €')
+        self.assertEqual(FixedPoint('1234.5').dollars, '1.234,50 €')
+        self.assertEqual(FixedPoint('1234.5').format_money('ja_JP'), '¥1,234')
+        self.assertEqual(json.loads(Salary(15, 'hour').serialize())['per_period_summary']['year']['dollars'],
+                         '31.200,00 €')
+
+    def test_switching_money_format_after_caching(self):
+        for backend in ('decimal', 'fixed'):
+            salary = Salary(15, 'hour', backend=backend)
+            self.assertEqual(json.loads(salary.serialize())['amount']['dollars'], '$15.00')
+            Numeric.money_format = get_format('de_DE')
+            obj = json.loads(salary.serialize())
+            self.assertEqual(obj['amount']['dollars'], '15,00 €')
+            self.assertEqual(obj['per_period_summary']['hour']['dollars'], '15,00 €')
+            self.assertEqual(salary.yearly.dollars, '31.200,00 €')
+            Numeric.money_format = formats['en_US']
+
+    def test_salary_serialize_money_format(self):
+        for backend in ('decimal', 'fixed'):
+            salary = Salary(15, 'hour', backend=backend)
+            obj = json.loads(salary.serialize('fr_FR'))
+            self.assertEqual(obj['amount']['dollars'], '15,00 €')
+            self.assertEqual(obj['per_period_summary']['year']['dollars'], '31\u202f200,00 €')
+            self.assertEqual(salary.to_dict(get_format('ja_JP'))['per_period_summary']['year']['dollars'], '¥31,200')
+            self.assertEqual(salary.to_dict()['per_period_summary']['year']['dollars'], '$31,200.00')
+            self.assertEqual(salary.amount.serialize('de_DE'), '{"dollars": "15,00 \\u20ac", "float": 15.0}')
+
+    def test_salary_report_money_format(self):
+        report = salary_report(Salary(15, 'hour'), 'fr_FR')
+        self.assertEqual(report.splitlines()[-1], 'Yearly         : 31 200,00 €')
+        self.assertEqual(salary_report(Salary(15, 'hour')).splitlines()[-1], 'Yearly         : $31,200.00')
+
+    def test_render_money_format(self):
+        out = io.StringIO()
+        render([Salary(15, 'hour')], out, 'table', money_format='de_CH')
+        lines = out.getvalue().splitlines()
+        self.assertTrue(lines[2].endswith('CHF 31’200.00'))
+        self.assertEqual(len(set(map(len, lines))), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import random
+import unittest
+from decimal import Decimal
+from wage import Numeric, Salary
+from wage.fixedpoint import FixedPoint
+
+
+class TestFixedPoint(unittest.TestCase):
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            FixedPoint('1a')
+        with self.assertRaises(ValueError):
+            FixedPoint('Infinity')
+
+    def test_units(self):
+        self.assertEqual(FixedPoint(15).units, 1500)
+        self.assertEqual(FixedPoint('15.1').units, 1510)
+        self.assertEqual(FixedPoint(15.1).units, 1510)
+        self.assertEqual(FixedPoint.from_units(1510).decimal, Decimal('15.10'))
+
+    def test_rounding_half_even_on_construction(self):
+        self.assertEqual(FixedPoint('15.125').units, 1512)
+        self.assertEqual(FixedPoint('15.135').units, 1514)
+        self.assertEqual(FixedPoint('-15.125').units, -1512)
+
+    def test_rounding_half_even_on_division(self):
+        self.assertEqual((FixedPoint('0.25') / 2).units, 12)
+        self.assertEqual((FixedPoint('0.35') / 2).units, 18)
+        self.assertEqual((FixedPoint('-0.25') / 2).units, -12)
+        self.assertEqual((FixedPoint(22500) / 260).units, 8654)
+        self.assertEqual((FixedPoint(1) / -3).units, -33)
+
+    def test_multiplication_exact(self):
+        self.assertEqual((FixedPoint('15.01') * 2080).units, 3122080)
+
+    def test_formats(self):
+        n = FixedPoint('-1234.5')
+        self.assertEqual(n.dollars, '$-1,234.50')
+        self.assertEqual(FixedPoint('0.05').dollars, '$0.05')
+        self.assertEqual(FixedPoint('-0.05').dollars, Numeric('-0.05').dollars)
+        self.assertEqual(n.float, -1234.5)
+        self.assertEqual(n.int, -1234)
+        self.assertIsInstance(n.decimal, Decimal)
+        self.assertEqual(n.to_dict(), {'dollars': '$-1,234.50', 'float': -1234.5})
+        self.assertEqual(repr(n), "FixedPoint(Decimal('-1234.50'))")
+
+    def test_numeric_conversion(self):
+        self.assertEqual(Numeric(FixedPoint('1.5')).decimal, Decimal('1.50'))
+        self.assertEqual(FixedPoint(Numeric('1.505')).units, 150)
+
+    def test_salary_backend_per_call(self):
+        s = Salary(15, 'hour', backend='fixed')
+        self.assertIsInstance(s.amount, FixedPoint)
+        self.assertIsInstance(s.daily, FixedPoint)
+        self.assertEqual(s.daily.units, 12000)
+        self.assertEqual(repr(s), "Salary(15.00, 'hour', backend='fixed')")
+        self.assertIsInstance(Salary(15, 'hour').daily, Numeric)
+        self.assertNotIsInstance(Salary(15, 'hour').daily, FixedPoint)
+
+    def test_salary_backend_global(self):
+        Salary.default_backend = 'fixed'
+        try:
+            self.assertIsInstance(Salary(15, 'hour').amount, FixedPoint)
+            self.assertNotIsInstance(Salary(15, 'hour', backend='decimal').amount, FixedPoint)
+        finally:
+            Salary.default_backend = 'decimal'
+
+    def test_salary_backend_invalid(self):
+        with self.assertRaises(ValueError):
+            Salary(15, 'hour', backend='float')
+
+    def test_salary_dollars_match_decimal_backend(self):
+        for args in [(15, 'hour'), (31200, 'year'), (1234.56, 'month')]:
+            fixed = Salary(*args, hours=1500, backend='fixed').per_period_summary
+            exact = Salary(*args, hours=1500).per_period_summary
+            self.assertEqual({k: v['dollars'] for k, v in fixed.items()},
+                             {k: v['dollars'] for k, v in exact.items()})
+
+
+class TestFixedPointDifferences(unittest.TestCase):
+    """ How far the fixed backend can differ from the decimal backend """
+
+    periods = list(Salary._period_yearly_defaults)
+
+    def population(self, decimals, count=2000):
+        rng = random.Random(decimals)
+        for _ in range(count):
+            amount = Decimal(rng.randint(1, 10 ** (6 + decimals))).scaleb(-decimals)
+            yield amount, rng.choice(self.periods), rng.randint(1000, 2600), rng.randint(48, 52)
+
+    def test_cent_inputs_match_to_the_cent(self):
+        for amount, period, hours, weeks in self.population(2):
+            fixed = Salary(amount, period, hours=hours, weeks=weeks, backend='fixed')
+            exact = Salary(amount, period, hours=hours, weeks=weeks)
+            for target in self.periods:
+                self.assertEqual(fixed.per_period(fixed.yearly, target).dollars,
+                                 exact.per_period(exact.yearly, target).dollars)
+
+    def test_summary_fast_path_matches_conversions(self):
+        for amount, period, hours, weeks in self.population(2):
+            salary = Salary(-amount if hours % 2 else amount, period, hours=hours, weeks=weeks, backend='fixed')
+            expected = {target: salary.per_period(salary.yearly, target).to_dict() for target in self.periods}
+            self.assertEqual(salary.per_period_summary, expected)
+        self.assertEqual(Salary(2 ** 60, 'hour', backend='fixed').per_period_summary['year']['dollars'],
+                         Salary(2 ** 60, 'hour').yearly.dollars)
+
+    def test_sub_cent_inputs_bounded_difference(self):
+        # The amount is off by at most half a cent, scaled by the conversion
+        # ratio, plus half a cent from rounding the converted value.
+        half_cent = Decimal('0.005')
+        for amount, period, hours, weeks in self.population(4):
+            fixed = Salary(amount, period, hours=hours, weeks=weeks, backend='fixed')
+            exact = Salary(amount, period, hours=hours, weeks=weeks)
+            times = exact.times_per_year
+            for target in self.periods:
+                bound = half_cent * times[period] / times[target] + half_cent
+                difference = abs(fixed.per_period(fixed.yearly, target).decimal
+                                 - exact.per_period(exact.yearly, target).decimal)
+                self.assertLessEqual(difference, bound)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,11 @@ import unittest
 from decimal import Decimal
 from wage import Numeric
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestFormatters(unittest.TestCase):
 
@@ -100,6 +105,38 @@ class TestFormatters(unittest.TestCase):
         self.assertEqual(obj['dollars'], "$1.00")
         self.assertEqual(obj['float'], 1.0)
 
+    def test_to_dict(self):
+        n = Numeric(1234.5)
+        self.assertEqual(n.to_dict(), {'dollars': '$1,234.50', 'float': 1234.5})
+        self.assertEqual(n.to_dict(), json.loads(n.serialize()))
+
+    def test_numeric_lazy_cached_dollars(self):
+        n = Numeric(1234.5)
+        self.assertIsNone(n._dollars)
+        self.assertIs(n.dollars, n.dollars)
+        n.value = Decimal(5)
+        self.assertEqual(n.dollars, '$5.00')
+
+    def test_numeric_decimal_not_copied(self):
+        n = Numeric('1.5')
+        self.assertIs(n.decimal, n.value)
+
+    def test_iter_lazy(self):
+        items = iter(Numeric(1))
+        self.assertEqual(next(items), ('value', Decimal(1)))
+        self.assertEqual(dict(Numeric(1)), Numeric(1).__dict__)
+
+    def test_numeric_format_dollars_many(self):
+        values = [1, 1.5, Decimal('1234.5612'), -3]
+        self.assertEqual(Numeric.format_dollars_many(values), ['$1.00', '$1.50', '$1,234.56', '$-3.00'])
+        self.assertEqual(Numeric.format_dollars_many(values), [Numeric.format_dollars(v) for v in values])
+        self.assertEqual(Numeric.format_dollars_many(()), [])
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_numeric_format_dollars_many_array(self):
+        values = numpy.array([1.0, 2600.005, 1234567.891])
+        self.assertEqual(Numeric.format_dollars_many(values), [Numeric.format_dollars(v) for v in values.tolist()])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,88 @@
+import io
+import json
+import threading
+import unittest
+from wage import Numeric, Salary, instrumentation
+from wage.interface import salary_report
+from wage.salary import dump_salaries
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled_by_default_records_nothing(self):
+        s = Salary(15, 'hour')
+        s.serialize()
+        salary_report(s)
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_profile_counts_numeric_and_per_period(self):
+        with instrumentation.profile() as stats:
+            Salary(15, 'hour').per_period_summary
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['numeric.init']['count'], 10)
+        self.assertEqual(snapshot['salary.per_period.hour']['count'], 2)
+        self.assertEqual(snapshot['salary.per_period.day']['count'], 1)
+        self.assertGreaterEqual(snapshot['salary.per_period.day']['seconds'], 0)
+        self.assertFalse(instrumentation.enabled)
+
+    def test_serialize_bytes(self):
+        s = Salary(15, 'hour')
+        with instrumentation.profile() as stats:
+            out = s.serialize()
+            by_period = s.serialize_by_period('day')
+            Numeric(1).serialize()
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['salary.serialize'], {
+            'count': 1, 'seconds': snapshot['salary.serialize']['seconds'], 'bytes': len(out)})
+        self.assertEqual(snapshot['salary.serialize_by_period']['bytes'], len(by_period))
+        self.assertEqual(snapshot['numeric.serialize']['count'], 1)
+
+    def test_dump_salaries_and_report(self):
+        out = io.StringIO()
+        with instrumentation.profile() as stats:
+            dump_salaries([Salary(15, 'hour'), Salary(20, 'day')], out)
+            report = salary_report(Salary(15, 'hour'))
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot['salary.dump_salaries']['count'], 2)
+        self.assertEqual(snapshot['salary.dump_salaries']['bytes'], len(out.getvalue()))
+        self.assertEqual(snapshot['interface.salary_report']['bytes'], len(report))
+
+    def test_global_switch_and_json(self):
+        instrumentation.enable()
+        Numeric(1)
+        instrumentation.disable()
+        Numeric(1)
+        self.assertEqual(json.loads(instrumentation.to_json())['numeric.init']['count'], 1)
+
+    def test_profile_reset(self):
+        with instrumentation.profile():
+            Numeric(1)
+        with instrumentation.profile(reset=False) as stats:
+            Numeric(1)
+        self.assertEqual(stats.snapshot()['numeric.init']['count'], 2)
+
+    def test_thread_safe(self):
+        stats = instrumentation.Stats()
+
+        def work():
+            for _ in range(1000):
+                stats.record('work', 0.5, 2)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(stats.snapshot()['work'], {'count': 4000, 'seconds': 2000.0, 'bytes': 8000})
+
+
+if __name__ == '__main__':
+    unittest.main()
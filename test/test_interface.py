@@ -0,0 +1,83 @@
+import io
+import json
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+from wage.interface import build_salary, main, parse_args, salary_report, stdio
+
+
+class TestInterface(unittest.TestCase):
+
+    def test_parse_args(self):
+        self.assertEqual(parse_args(['15', 'hour', 'hours=1500']), (['15', 'hour'], {'hours': '1500'}))
+
+    def test_build_salary(self):
+        s = build_salary(['15', 'hour', 'hours=1500'])
+        self.assertEqual(s.yearly.float, 22500.0)
+
+    def test_main_report(self):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(['15', 'hour'])
+        self.assertEqual(out.getvalue(), salary_report(build_salary(['15', 'hour'])) + '\n')
+
+    def test_stdio_json(self):
+        stdin = io.StringIO('15 hour\n15 hour hours=1500\n\n15a hour\n"15 hour\n')
+        out = io.StringIO()
+        stdio([], stdin, out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(lines[0]['per_period_summary']['year']['float'], 31200.0)
+        self.assertEqual(lines[1]['per_period_summary']['year']['float'], 22500.0)
+        self.assertIn('error', lines[2])
+        self.assertEqual(lines[3], {'error': 'Value not numeric: 15a'})
+        self.assertIn('error', lines[4])
+
+    def test_stdio_survives_conversion_errors(self):
+        stdin = io.StringIO('15 hour\n9e999998 hour\n15 hour calendar=x\n20 hour\n')
+        out = io.StringIO()
+        stdio([], stdin, out)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[1], {'error': 'Value out of range: Overflow'})
+        self.assertIn('error', lines[2])
+        self.assertEqual(lines[3]['per_period_summary']['hour']['float'], 20.0)
+        out = io.StringIO()
+        stdio(['format=report'], io.StringIO('9e999998 hour\n20 hour\n'), out)
+        self.assertTrue(out.getvalue().startswith('Error: Value out of range: Overflow\n'))
+        self.assertIn('$20.00', out.getvalue())
+
+    def test_stdio_report(self):
+        out = io.StringIO()
+        stdio(['format=report'], io.StringIO('15 hour\n'), out)
+        self.assertEqual(out.getvalue(), salary_report(build_salary(['15', 'hour'])) + '\n')
+
+    def test_stdio_invalid_format(self):
+        with self.assertRaises(ValueError):
+            stdio(['format=xml'], io.StringIO(''), io.StringIO())
+
+    def test_main_stdio(self):
+        out = io.StringIO()
+        with redirect_stdout(out), patch('sys.stdin', io.StringIO('15 hour\n')):
+            main(['--stdio'])
+        self.assertEqual(json.loads(out.getvalue())['period'], 'hour')
+
+    def test_stdio_coprocess_flushes(self):
+        process = subprocess.Popen([sys.executable, '-m', 'wage.interface', '--stdio'],
+                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE, universal_newlines=True)
+        try:
+            for amount in (15, 20):
+                process.stdin.write(f'{amount} hour\n')
+                process.stdin.flush()
+                response = json.loads(process.stdout.readline())
+                self.assertEqual(response['amount']['float'], float(amount))
+        finally:
+            process.stdin.close()
+            process.wait()
+            process.stdout.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from wage import parallel, streaming
+from wage.interface import main
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(fd, 'w') as fp:
+            fp.write('amount,period,hours\n')
+            for i in range(1, 301):
+                fp.write(f'{i}.25,{("hour", "day", "month", "year")[i % 4]},{1500 if i % 3 else ""}\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def serial(self, output='csv'):
+        out = io.StringIO()
+        with open(self.path, newline='') as fp:
+            rows = streaming.convert_rows(streaming.read_rows(fp, 'csv'))
+            streaming.write_rows(rows, out, output)
+        return out.getvalue()
+
+    def test_chunk_ranges(self):
+        ranges = parallel.chunk_ranges(self.path, chunk_size=100)
+        self.assertGreater(len(ranges), 1)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.path))
+        with open(self.path, 'rb') as fp:
+            data = fp.read()
+        for start, end in ranges:
+            self.assertTrue(start == 0 or data[start - 1:start] == b'\n')
+            self.assertEqual(data[end - 1:end], b'\n')
+
+    def test_chunk_ranges_contiguous(self):
+        ranges = parallel.chunk_ranges(self.path, chunk_size=64, start=20)
+        self.assertEqual(ranges[0][0], 20)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+
+    def test_chunk_ranges_keep_quoted_line_breaks(self):
+        with open(self.path, 'w', newline='') as fp:
+            fp.write('name,amount,period\n')
+            for i in range(20):
+                fp.write(f'"Line one\nline ""{i}"" two",{i}.5,hour\n')
+        ranges = parallel.chunk_ranges(self.path, chunk_size=30, start=len('name,amount,period\n'))
+        self.assertEqual(len(ranges), 20)
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, workers=2, chunk_size=30)
+        self.assertEqual(out.getvalue(), self.serial())
+        self.assertEqual(len(out.getvalue().splitlines()), 21)
+
+    def test_convert_file_encoding(self):
+        with open(self.path, 'w', encoding='cp1252', newline='') as fp:
+            fp.write('name,amount,period\n')
+            for i in range(50):
+                fp.write(f'Zoë {i},{i},hour\n')
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, workers=2, chunk_size=64, encoding='cp1252')
+        self.assertEqual(len(out.getvalue().splitlines()), 51)
+        with self.assertRaises(UnicodeDecodeError):
+            parallel.convert_file(self.path, io.StringIO(), workers=2, chunk_size=64, encoding='utf-8')
+
+    def test_convert_file_out_of_range_rows(self):
+        with open(self.path, 'a') as fp:
+            fp.write('1e999999,hour,\nsNaN,hour,\n')
+        skipped = []
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, workers=2, chunk_size=256, errors='skip',
+                              on_error=lambda number, row, message: skipped.append((number, message)))
+        self.assertEqual(skipped, [(301, 'Value out of range: Overflow'), (302, 'Value out of range: InvalidOperation')])
+        self.assertEqual(len(out.getvalue().splitlines()), 301)
+        with self.assertRaisesRegex(ValueError, 'Invalid row 301: Value out of range'):
+            parallel.convert_file(self.path, io.StringIO(), workers=2, chunk_size=256)
+
+    def test_convert_file_matches_serial(self):
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, workers=2, chunk_size=256)
+        self.assertEqual(out.getvalue(), self.serial())
+
+    def test_convert_file_jsonl_output(self):
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, output='jsonl', workers=2, chunk_size=512)
+        self.assertEqual(out.getvalue(), self.serial('jsonl'))
+
+    def test_convert_file_skip_errors(self):
+        with open(self.path, 'a') as fp:
+            fp.write('15a,hour,\n')
+        skipped = []
+        out = io.StringIO()
+        parallel.convert_file(self.path, out, workers=2, chunk_size=256, errors='skip',
+                              on_error=lambda *args: skipped.append(args))
+        self.assertEqual(skipped, [(301, {'amount': '15a', 'period': 'hour', 'hours': ''}, 'Value not numeric: 15a')])
+        self.assertEqual(len(out.getvalue().splitlines()), 301)
+
+    def test_convert_file_row_numbers_match_serial(self):
+        with open(self.path) as fp:
+            lines = fp.readlines()
+        lines[201] = '15a,hour,\n'
+        lines[251] = '16a,hour,\n'
+        with open(self.path, 'w') as fp:
+            fp.writelines(lines)
+        with self.assertRaises(ValueError) as serial:
+            self.serial()
+        with self.assertRaises(ValueError) as parallel_error:
+            parallel.convert_file(self.path, io.StringIO(), workers=2, chunk_size=256)
+        self.assertEqual(str(parallel_error.exception), str(serial.exception))
+        self.assertEqual(str(serial.exception), 'Invalid row 201: Value not numeric: 15a')
+        skipped = []
+        parallel.convert_file(self.path, io.StringIO(), workers=2, chunk_size=256, errors='skip',
+                              on_error=lambda number, row, message: skipped.append(number))
+        self.assertEqual(skipped, [201, 251])
+
+    def test_cli_reports_skipped_rows_like_serial(self):
+        with open(self.path, 'a') as fp:
+            fp.write('15a,hour,\n')
+        reports = []
+        for workers in ([], ['workers=2', 'chunk_size=256']):
+            err = io.StringIO()
+            with redirect_stdout(io.StringIO()), redirect_stderr(err):
+                main(['batch', self.path, 'errors=skip'] + workers)
+            reports.append(err.getvalue())
+        self.assertEqual(reports, ['Skipped row 301: Value not numeric: 15a\n'] * 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
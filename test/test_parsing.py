@@ -0,0 +1,114 @@
+import random
+import unittest
+from decimal import Decimal
+from wage import Numeric
+from wage.currency import formats
+from wage.fixedpoint import FixedPoint
+from wage.parsing import parse_amount, parse_amounts, parse_decimal
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestParsing(unittest.TestCase):
+
+    def test_mixed_inputs(self):
+        values = [15, 15.5, Decimal('15.125'), '15', ' 15.135 ', '+.5', '5.', FixedPoint('2.25'), Numeric('3.005')]
+        units, errors = parse_amounts(values)
+        self.assertEqual(units, [1500, 1550, 1512, 1500, 1514, 50, 500, 225, 300])
+        self.assertEqual(errors, [])
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_numpy_inputs(self):
+        self.assertEqual(parse_amounts(numpy.array([1.5, 2.25])), ([150, 225], []))
+        self.assertEqual(parse_amounts(numpy.array([1, 2])), ([100, 200], []))
+        self.assertEqual(parse_amounts(numpy.array(['$1.50', 'x'])), ([150, None], [(1, 'x', 'Value not numeric: x')]))
+        units, errors = parse_amounts([numpy.float64(1.125), numpy.int32(3), numpy.float32(0.5), numpy.float64('nan')])
+        self.assertEqual(units, [112, 300, 50, None])
+        self.assertEqual(parse_amount(numpy.int64(7)), 700)
+
+    def test_money_strings(self):
+        values = {
+            '$12,345.00': 1234500,
+            '-$1.50': -150,
+            '$-1.50': -150,
+            '(1,234.00)': -123400,
+            '($1,234.56)': -123456,
+            'USD 1,000': 100000,
+            '£ 0.99': 99,
+            '1234567.891': 123456789,
+            '$\xa015': 1500,
+        }
+        units, errors = parse_amounts(list(values))
+        self.assertEqual(units, list(values.values()))
+        self.assertEqual(errors, [])
+
+    def test_invalid_values_reported(self):
+        values = ['15', 'n/a', '', '.', '1,23', '(15', '--1', '1e', float('nan'), None, True]
+        units, errors = parse_amounts(values)
+        self.assertEqual(units, [1500] + [None] * (len(values) - 1))
+        self.assertEqual([index for index, value, message in errors], list(range(1, len(values))))
+        self.assertEqual(errors[0], (1, 'n/a', 'Value not numeric: n/a'))
+
+    def test_out_of_range_values_reported(self):
+        values = ['15', '1e999999', '1e100000', 'sNaN', 10 ** 40, 1e300, '9' * 36 + '.995', '1' * 50 + ',00 €']
+        units, errors = parse_amounts(values)
+        self.assertEqual(units, [1500] + [None] * (len(values) - 1))
+        self.assertEqual(len(errors), len(values) - 1)
+        self.assertIsNone(parse_amounts(['1' * 50 + ',00 €'], money_format='de_DE')[0][0])
+        self.assertEqual(parse_amount('0e999999'), 0)
+
+    def test_digits_kept_beyond_context_precision(self):
+        self.assertEqual(parse_amount('1234567890123456789012345678901.575'), 123456789012345678901234567890158)
+        self.assertEqual(parse_amount('9' * 36), int('9' * 36) * 100)
+
+    def test_locales(self):
+        units, errors = parse_amounts(['1.234,50 €', '-3,5 €', '1234'], money_format='de_DE')
+        self.assertEqual(units, [123450, -350, 123400])
+        units, errors = parse_amounts(['1 234,50 €', '1 234,50\xa0€', '1\xa0234 €'], money_format='fr_FR')
+        self.assertEqual(units, [123450, 123450, 123400])
+        self.assertEqual(parse_amount('¥1,234', scale=0, money_format='ja_JP'), 1234)
+
+    def test_formatted_round_trip(self):
+        rng = random.Random(5)
+        for name, money_format in formats.items():
+            scale = money_format.decimals
+            units = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(200)]
+            strings = [money_format.format_units(unit, scale) for unit in units]
+            self.assertEqual(parse_amounts(strings, scale, name), (units, []), name)
+
+    def test_scale_rounding(self):
+        self.assertEqual(parse_amount('$1.125'), 112)
+        self.assertEqual(parse_amount('$1.135'), 114)
+        self.assertEqual(parse_amount('1.125'), 112)
+        self.assertEqual(parse_amount('(0.005)'), 0)
+        self.assertEqual(parse_amount('1.5', scale=0), 2)
+        self.assertEqual(parse_amount('$12.3456', scale=4), 123456)
+        self.assertEqual(parse_amount(FixedPoint('1.23'), scale=4), 12300)
+
+    def test_parse_decimal(self):
+        self.assertEqual(parse_decimal('$12,345.678'), Decimal('12345.678'))
+        self.assertEqual(parse_decimal('(1.234,5 €)', 'de_DE'), Decimal('-1234.5'))
+        self.assertEqual(parse_decimal(2), Decimal(2))
+        for value in ['abc', float('inf'), None]:
+            with self.assertRaises(ValueError):
+                parse_decimal(value)
+        with self.assertRaises(ValueError):
+            parse_amount('abc')
+
+    def test_numeric_money_strings(self):
+        self.assertEqual(Numeric('$12,345.00').value, Decimal('12345.00'))
+        self.assertEqual(FixedPoint('(1,234.565)').units, -123456)
+        with self.assertRaises(ValueError):
+            Numeric('1a')
+        try:
+            Numeric.money_format = formats['de_DE']
+            self.assertEqual(Numeric('1.234,50 €').value, Decimal('1234.50'))
+        finally:
+            Numeric.money_format = formats['en_US']
+
+
+if __name__ == '__main__':
+    unittest.main()
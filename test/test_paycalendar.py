@@ -0,0 +1,83 @@
+import pickle
+import unittest
+from decimal import Decimal
+from wage import Numeric, Salary
+from wage.paycalendar import PayCalendar
+
+
+class TestPayCalendar(unittest.TestCase):
+
+    def test_defaults(self):
+        c = PayCalendar()
+        self.assertEqual(c.times, (2080, 260, 52, 26, 12, 4, 2, 1))
+        self.assertEqual(c['hour'], 2080)
+        self.assertEqual(c.times_per_year, Salary._period_yearly_defaults)
+        self.assertEqual(repr(c), 'PayCalendar()')
+
+    def test_interned(self):
+        self.assertIs(PayCalendar(), PayCalendar())
+        self.assertIs(PayCalendar(hours=1500), PayCalendar(hours='1500'))
+        self.assertIs(PayCalendar(hours=1500.5), PayCalendar(hours=1500))
+        self.assertIsNot(PayCalendar(hours=1500), PayCalendar())
+        self.assertIs(PayCalendar().replace(hours=1500, days=200), PayCalendar(days=200, hours=1500))
+        self.assertIs(pickle.loads(pickle.dumps(PayCalendar(weeks=50))), PayCalendar(weeks=50))
+
+    def test_hashable(self):
+        self.assertEqual(len({PayCalendar(), PayCalendar(), PayCalendar(hours=1500)}), 2)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            PayCalendar().times = (1,) * 8
+
+    def test_invalid_input(self):
+        with self.assertRaises(TypeError):
+            PayCalendar(centuries=1)
+        with self.assertRaises(ValueError):
+            PayCalendar(hours='1a')
+        with self.assertRaises(ValueError):
+            PayCalendar(hours=0)
+
+    def test_ratios(self):
+        c = PayCalendar(hours=1500)
+        self.assertEqual(len(c.ratios), 8)
+        self.assertEqual(c.ratio('hour', 'year'), Decimal(1500))
+        self.assertEqual(c.ratio('day', 'week'), Decimal(5))
+        self.assertEqual(c.ratio('year', 'month'), Decimal(1) / Decimal(12))
+        self.assertIs(c.ratios, c.ratios)
+        self.assertEqual(c.float_ratios[1][2], 5.0)
+
+    def test_convert(self):
+        c = PayCalendar()
+        self.assertEqual(c.convert(Decimal(15), 'hour', 'day'), Decimal(120))
+        self.assertEqual(round(c.convert(Decimal(31200), 'year', 'month'), 2), Decimal('2600.00'))
+        self.assertEqual(c.convert(Numeric(15), 'hour', 'year').decimal, Decimal(31200))
+
+    def test_salary_calendar(self):
+        s1 = Salary(15, 'hour', hours=1500)
+        s2 = Salary(15, 'hour', calendar=PayCalendar(hours=1500))
+        s3 = Salary(15, 'hour', calendar=PayCalendar(hours=1500), days=200)
+        self.assertIs(s1.calendar, PayCalendar(hours=1500))
+        self.assertIs(s2.calendar, s1.calendar)
+        self.assertIs(s3.calendar, PayCalendar(hours=1500, days=200))
+        self.assertEqual(s2.yearly.decimal, Decimal(22500))
+        with self.assertRaises(ValueError):
+            Salary(15, 'hour', calendar='x')
+        with self.assertRaises(ValueError):
+            s1.calendar = {'hours': 1500}
+
+    def test_changed_periods(self):
+        c = PayCalendar()
+        self.assertEqual(c.changed_periods(c), [])
+        self.assertEqual(c.changed_periods(PayCalendar(hours=1950, weeks=50)), ['hour', 'week'])
+
+    def test_salary_calendar_assignment(self):
+        s = Salary(15, 'hour')
+        self.assertEqual(s.yearly.decimal, Decimal(31200))
+        s.calendar = PayCalendar(hours=1040)
+        self.assertEqual(s.yearly.decimal, Decimal(15600))
+        s.days_in_year = 130
+        self.assertIs(s.calendar, PayCalendar(hours=1040, days=130))
+
+
+if __name__ == '__main__':
+    unittest.main()
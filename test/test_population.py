@@ -0,0 +1,71 @@
+import unittest
+from decimal import Decimal
+from wage import Salary
+from wage import instrumentation
+from wage.paycalendar import PayCalendar
+from wage.population import Population
+
+
+def summaries(population):
+    return [salary.per_period_summary for salary in population]
+
+
+class TestPopulation(unittest.TestCase):
+
+    def setUp(self):
+        self.population = Population([Salary(15, 'hour'), Salary(31200, 'year'), Salary(15, 'hour', days=200)])
+
+    def test_set_calendar_matches_new_salaries(self):
+        self.assertEqual(self.population.set_calendar(hours=1950), 2)
+        expected = [Salary(15, 'hour', hours=1950), Salary(31200, 'year', hours=1950),
+                    Salary(15, 'hour', hours=1950, days=200)]
+        self.assertEqual(summaries(self.population), summaries(expected))
+        self.assertIs(self.population[0].calendar, PayCalendar(hours=1950))
+        self.assertIs(self.population[2].calendar, PayCalendar(hours=1950, days=200))
+
+    def test_set_calendar_recomputes_dependent_conversions_only(self):
+        summaries(self.population)
+        with instrumentation.profile() as stats:
+            self.population.set_calendar(hours=1950)
+            summaries(self.population)
+        snapshot = stats.snapshot()
+        # Hour based salaries: yearly and every conversion, year based: hourly only
+        self.assertEqual(snapshot['salary.per_period.hour']['count'], 2 * 2 + 1)
+        self.assertEqual(snapshot['salary.per_period.day']['count'], 2)
+        self.assertEqual(snapshot['salary.per_period.year']['count'], 2)
+
+    def test_unchanged_calendar_keeps_cache(self):
+        yearly = self.population[1].yearly
+        self.assertEqual(self.population.set_calendar(hours=2080), 0)
+        self.assertIs(self.population[1].yearly, yearly)
+
+    def test_scenario_restores_calendars(self):
+        before = summaries(self.population)
+        with self.population.scenario(hours=1950, weeks=50) as population:
+            self.assertEqual(population[0].yearly.decimal, Decimal(29250))
+            self.assertEqual(population[1].weekly.decimal, Decimal(624))
+        self.assertEqual(summaries(self.population), before)
+        self.assertIs(self.population[0].calendar, PayCalendar())
+
+    def test_per_period(self):
+        self.assertEqual([n.decimal for n in self.population.per_period('yearly')], [31200, 31200, 31200])
+        self.assertEqual(len(self.population.per_period('hourly')), len(self.population))
+        with self.assertRaises(ValueError):
+            self.population.per_period('hours_in_year')
+
+    def test_invalid_kwarg(self):
+        with self.assertRaises(TypeError):
+            self.population.set_calendar(invalid=1)
+
+    def test_salary_calendar_change_keeps_independent_conversions(self):
+        s = Salary(31200, 'year')
+        weekly = s.weekly
+        s.hours_in_year = 1950
+        self.assertIs(s.weekly, weekly)
+        self.assertEqual(s.hourly.decimal, Decimal(16))
+        self.assertEqual(s.per_period_summary['hour']['float'], 16.0)
+        self.assertEqual(s.per_period_summary['week']['float'], 600.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
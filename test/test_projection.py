@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from datetime import date
+from wage import Salary
+from wage.population import Population
+
+try:
+    import numpy
+    from wage.batch import SalaryBatch
+    from wage.businessdays import BusinessCalendar
+    from wage.projection import Raise, project
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestProjection(unittest.TestCase):
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            Raise(date(2026, 1, 1), percent='3')
+        with self.assertRaises(ValueError):
+            Raise(date(2026, 1, 1), every=0)
+        with self.assertRaises(ValueError):
+            project([Salary(15, 'hour')], start=2026, stop=2026)
+        with self.assertRaises(ValueError):
+            project([Salary(15, 'hour')], start=2026, schedule='daily')
+        with self.assertRaises(ValueError):
+            project([Salary(15, 'hour')], [[], []], start=2026)
+        with self.assertRaises(TypeError):
+            project([Salary(15, 'hour')], [[3]], start=2026)
+
+    def test_no_raises(self):
+        salaries = [Salary(15, 'hour'), Salary(5000, 'month'), Salary(31200, 'year', hours=1500)]
+        result = project(salaries, start=2026, stop=2028)
+        self.assertEqual(result.values.shape, (3, 24))
+        self.assertEqual(len(result.dates), 24)
+        self.assertEqual(result.dates[0], date(2026, 1, 30))
+        for row, salary in enumerate(salaries):
+            numpy.testing.assert_allclose(result.values[row], salary.monthly.float)
+        self.assertEqual(result.rounded()[0, 0], 2600.0)
+
+    def test_percentage_and_flat_raises(self):
+        raises = [Raise(date(2026, 7, 1), percent=10, every=1), Raise(date(2027, 1, 1), amount=1200)]
+        result = project([Salary(31200, 'year')], raises, 2026, 2028)
+        yearly = result.values[0] * 12
+        numpy.testing.assert_allclose(yearly[:6], 31200)
+        numpy.testing.assert_allclose(yearly[6:12], 34320)
+        numpy.testing.assert_allclose(yearly[12:18], 35520)
+        numpy.testing.assert_allclose(yearly[18:], 35520 * 1.1)
+
+    def test_compound(self):
+        raises = [Raise(date(2026, 1, 1), percent=5, every=1)]
+        compound = project([Salary(1000, 'month')], raises, 2026, 2029).values[0]
+        numpy.testing.assert_allclose(compound[[0, 12, 24]], [1050, 1102.5, 1157.625])
+        raises = [Raise(date(2026, 1, 1), percent=5, compound=False, every=1)]
+        simple = project([Salary(1000, 'month')], raises, 2026, 2029).values[0]
+        numpy.testing.assert_allclose(simple[[0, 12, 24]], [1050, 1100, 1150])
+
+    def test_per_salary_schedules(self):
+        shared = [Raise(date(2026, 4, 1), percent=2)]
+        schedules = [shared, [], shared, [Raise(date(2026, 1, 1), amount=12000)]]
+        salaries = Population(Salary(amount, 'year') for amount in (30000, 40000, 50000, 60000))
+        result = project(salaries, schedules, 2026, chunk_size=3)
+        self.assertAlmostEqual(result.values[0, 2], 2500)
+        self.assertAlmostEqual(result.values[0, 3], 2550)
+        self.assertAlmostEqual(result.values[1, 11], 40000 / 12)
+        self.assertAlmostEqual(result.values[2, 11], 51000 / 12)
+        self.assertAlmostEqual(result.values[3, 0], 6000)
+        self.assertAlmostEqual(result.totals()[0], (30000 + 40000 + 50000 + 72000) / 12)
+
+    def test_pay_schedules(self):
+        result = project([Salary(600, 'week')], start=2026, stop=2028, schedule='weekly')
+        self.assertEqual(len(result.dates), 52 + 53)
+        self.assertAlmostEqual(result.values[0, 0], 600)
+        self.assertAlmostEqual(result.values[0, -1], 31200 / 53)
+        self.assertAlmostEqual(result.yearly_totals()[2027], 31200)
+        business = BusinessCalendar('monthly', holidays=[date(2026, 1, 30)])
+        result = project([Salary(31200, 'year')], [Raise(date(2026, 1, 30), percent=10)], 2026, schedule=business)
+        # The January pay date rolls back before the raise
+        self.assertEqual(result.dates[0], date(2026, 1, 29))
+        self.assertAlmostEqual(result.values[0, 0], 2600)
+        self.assertAlmostEqual(result.values[0, 1], 2860)
+
+    def test_leap_day_raise(self):
+        raises = [Raise(date(2024, 2, 29), amount=1200, every=1)]
+        result = project([Salary(0, 'year')], raises, 2025, 2026)
+        self.assertAlmostEqual(result.values[0, 1], 200)
+        self.assertAlmostEqual(result.values[0, 0], 100)
+
+    def test_salary_batch(self):
+        batch = SalaryBatch([15, 31200], ['hour', 'year'])
+        result = project(batch, [Raise(date(2026, 1, 1), percent=1)], 2026)
+        numpy.testing.assert_allclose(result.values, 31512 / 12)
+
+    def test_memory_mapped_output(self):
+        salaries = [Salary(amount, 'year') for amount in range(30000, 30100)]
+        raises = [Raise(date(2026, 7, 1), percent=3, every=1)]
+        expected = project(salaries, raises, 2026, 2029)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'forecast.npy')
+            result = project(salaries, raises, 2026, 2029, path=path, chunk_size=7)
+            self.assertIsInstance(result.values, numpy.memmap)
+            numpy.testing.assert_array_equal(result.values, expected.values)
+            numpy.testing.assert_allclose(result.totals(), expected.totals())
+            loaded = numpy.load(path, mmap_mode='r')
+            numpy.testing.assert_array_equal(loaded, expected.values)
+            del result, loaded
+
+    def test_to_rows(self):
+        result = project([Salary(15, 'hour'), Salary(1, 'hour')], start=2026, chunk_size=1)
+        rows = list(result.to_rows())
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[1]['salary'], 1)
+        self.assertEqual(rows[0]['2026-01-30'], 2600.0)
+        self.assertEqual(len(rows[0]), 13)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import csv
+import io
+import unittest
+import unittest.mock
+from contextlib import redirect_stdout
+from wage import Salary
+from wage.interface import main, salary_report
+from wage.report import column_widths, render
+
+salaries = [Salary(15, 'hour'), Salary(15, 'hour', hours=1500), Salary(1260000, 'year')]
+labels = ['Ada', 'Grace | H', 'Linus']
+
+
+def rendered(items, fmt, **kwargs):
+    out = io.StringIO()
+    render(items, out, fmt, **kwargs)
+    return out.getvalue()
+
+
+class TestReport(unittest.TestCase):
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            render(salaries, io.StringIO(), 'xml')
+
+    def test_text_matches_salary_report(self):
+        self.assertEqual(rendered(salaries, 'text'), ''.join(salary_report(s) + '\n' for s in salaries))
+
+    def test_text_labels(self):
+        out = rendered(salaries, 'text', labels=labels, chunk_size=2)
+        self.assertEqual(out, ''.join(f'{label}\n{salary_report(s)}\n' for label, s in zip(labels, salaries)))
+        out = io.StringIO()
+        with redirect_stdout(out), unittest.mock.patch('sys.stdin', io.StringIO('name,amount,period\nAda,15,hour\n')):
+            main(['report', 'output=text', 'label=name'])
+        self.assertEqual(out.getvalue().splitlines()[:2], ['Ada', 'Hourly         : $15.00'])
+
+    def test_salary_report(self):
+        self.assertEqual(salary_report(Salary(15, 'hour')).splitlines()[0], 'Hourly         : $15.00')
+        self.assertEqual(salary_report(Salary(15, 'hour')).splitlines()[-1], 'Yearly         : $31,200.00')
+
+    def test_table_aligned(self):
+        lines = rendered(salaries, 'table', labels=labels).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(len(set(map(len, lines))), 1)
+        self.assertEqual(lines[0].split(), ['Name', 'Hourly', 'Daily', 'Weekly', 'Fortnightly', 'Monthly', 'Quarterly',
+                                            'Semesterly', 'Yearly'])
+        self.assertTrue(lines[2].startswith('Ada '))
+        self.assertTrue(lines[4].endswith('$1,260,000.00'))
+
+    def test_table_streamed_chunks(self):
+        whole = rendered(salaries, 'table')
+        self.assertEqual(rendered(iter(salaries), 'table', widths=column_widths(salaries), chunk_size=1), whole)
+        # Without widths, a one-shot iterator is aligned on its first chunk
+        self.assertEqual(rendered(iter(salaries), 'table', chunk_size=3), whole)
+
+    def test_markdown(self):
+        lines = rendered(salaries, 'markdown', labels=labels).splitlines()
+        self.assertTrue(lines[0].startswith('| Name'))
+        self.assertTrue(lines[1].startswith('| :---'))
+        self.assertTrue(lines[1].endswith('---: |'))
+        self.assertIn('Grace \\| H', lines[3])
+
+    def test_csv(self):
+        rows = list(csv.reader(io.StringIO(rendered(salaries, 'csv', labels=labels))))
+        self.assertEqual(rows[0][0], 'Name')
+        self.assertEqual(rows[2], ['Grace | H', '15.00', '86.54', '432.69', '865.38', '1875.00', '5625.00',
+                                   '11250.00', '22500.00'])
+
+    def test_empty(self):
+        self.assertEqual(len(rendered([], 'table').splitlines()), 2)
+        self.assertEqual(rendered([], 'text'), '')
+
+    def test_cli_report(self):
+        out = io.StringIO()
+        with redirect_stdout(out), unittest.mock.patch('sys.stdin', io.StringIO('name,amount,period\nAda,15,hour\n')):
+            main(['report', 'output=csv', 'label=name'])
+        self.assertEqual(out.getvalue().splitlines()[1].split(',')[:2], ['Ada', '15.00'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
+import io
 import json
 import unittest
 from decimal import Decimal
-from wage import Salary
+from wage import Numeric, Salary
+from wage.salary import dump_salaries
 
 
 class TestSalary(unittest.TestCase):
@@ -335,6 +337,85 @@ class TestSalary(unittest.TestCase):
         self.assertEqual(obj['amount']['dollars'], '$31,200.00')
         self.assertEqual(obj['period'], 'year')
 
+    def test_cached_conversions(self):
+        s = Salary(15, 'hour')
+        self.assertIs(s.yearly, s.yearly)
+        self.assertIs(s.hourly, s.hourly)
+        self.assertIsNot(s.per_period_summary, s.per_period_summary)
+        self.assertEqual(s.per_period_summary, s.per_period_summary)
+
+    def test_cache_invalidation_amount(self):
+        s = Salary(15, 'hour')
+        self.assertEqual(s.daily.decimal, Decimal(120))
+        s.amount = Numeric(30)
+        self.assertEqual(s.daily.decimal, Decimal(240))
+        self.assertEqual(s.per_period_summary['day']['float'], 240.0)
+
+    def test_cache_invalidation_period(self):
+        s = Salary(15, 'hour')
+        self.assertEqual(s.yearly.decimal, Decimal(31200))
+        s.period = 'day'
+        self.assertEqual(s.yearly.decimal, Decimal(3900))
+
+    def test_cache_invalidation_periods_in_year(self):
+        s = Salary(15, 'hour')
+        self.assertEqual(s.yearly.decimal, Decimal(31200))
+        self.assertEqual(s.per_period_summary['week']['float'], 600.0)
+        s.hours_in_year = 1040
+        s.weeks_in_year = 26
+        self.assertEqual(s.yearly.decimal, Decimal(15600))
+        self.assertEqual(s.weekly.decimal, Decimal(600))
+        self.assertEqual(s.per_period_summary['year']['float'], 15600.0)
+
+    def test_summary_copy_isolated_from_cache(self):
+        s = Salary(15, 'hour')
+        s.per_period_summary['hour']['float'] = 0
+        self.assertEqual(s.per_period_summary['hour']['float'], 15.0)
+
+    def test_serialize_output(self):
+        s = Salary(15, 'hour', hours=1500)
+        self.assertEqual(s.serialize(), (
+            '{"amount": {"dollars": "$15.00", "float": 15.0}, "period": "hour", "per_period_summary": '
+            '{"hour": {"dollars": "$15.00", "float": 15.0}, "day": {"dollars": "$86.54", "float": 86.53846153846153}, '
+            '"week": {"dollars": "$432.69", "float": 432.6923076923077}, '
+            '"fortnight": {"dollars": "$865.38", "float": 865.3846153846154}, '
+            '"month": {"dollars": "$1,875.00", "float": 1875.0}, "quarter": {"dollars": "$5,625.00", "float": 5625.0}, '
+            '"semester": {"dollars": "$11,250.00", "float": 11250.0}, '
+            '"year": {"dollars": "$22,500.00", "float": 22500.0}}, "times_per_year": '
+            '{"hour": 1500, "day": 260, "week": 52, "fortnight": 26, "month": 12, "quarter": 4, "semester": 2, "year": 1}}'))
+        self.assertEqual(s.serialize_by_period('day'), (
+            '{"amount": {"dollars": "$86.54", "float": 86.53846153846153}, "period": "day", "times_per_year": 260}'))
+
+    def test_to_dict(self):
+        s = Salary(31200, 'year')
+        obj = s.to_dict()
+        self.assertEqual(obj, json.loads(s.serialize()))
+        self.assertEqual(s.to_dict_by_period('week'), json.loads(s.serialize_by_period('week')))
+
+    def test_dump_salaries(self):
+        salaries = [Salary(15, 'hour'), Salary(31200, 'year', weeks=50)]
+        out = io.StringIO()
+        dump_salaries(salaries, out)
+        self.assertEqual(out.getvalue(), ''.join(s.serialize() + '\n' for s in salaries))
+
+    def test_shared_calendar(self):
+        s1 = Salary(15, 'hour', hours=1500)
+        s2 = Salary(20, 'day', hours='1500')
+        s3 = Salary(20, 'day')
+        self.assertIs(s1.calendar, s2.calendar)
+        self.assertIsNot(s1.calendar, s3.calendar)
+        s3.hours_in_year = 1500
+        self.assertIs(s1.calendar, s3.calendar)
+        self.assertEqual(s2.hours_in_year, 1500)
+        self.assertEqual(s3.days_in_year, 260)
+
+    def test_slots(self):
+        s = Salary(15, 'hour')
+        with self.assertRaises(AttributeError):
+            s.centuries_in_year = 1
+        self.assertEqual(dict(s)['period'], 'hour')
+        self.assertEqual(repr(Salary(15, 'hour', hours=1500)), "Salary(15, 'hour', hours=1500)")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,173 @@
+import asyncio
+import json
+import unittest
+from wage.server import Server, convert, convert_many
+
+
+async def request(reader, writer, method, target, body=None, headers=''):
+    payload = json.dumps(body).encode() if body is not None else b''
+    writer.write(f'{method} {target} HTTP/1.1\r\nHost: test\r\n{headers}'
+                 f'Content-Length: {len(payload)}\r\n\r\n'.encode() + payload)
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode().split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    length = int([line for line in lines if line.lower().startswith('content-length')][0].split(':')[1])
+    return status, json.loads(await reader.readexactly(length)), head.decode()
+
+
+class TestConvert(unittest.TestCase):
+
+    def test_convert(self):
+        result = convert({'amount': 15, 'period': 'hour', 'hours': 1500})
+        self.assertEqual(result['per_period_summary']['year']['float'], 22500.0)
+
+    def test_convert_error(self):
+        self.assertIn('error', convert({'amount': '15a', 'period': 'hour'}))
+        self.assertIn('error', convert({'amount': 15}))
+        self.assertEqual(convert({'amount': '9e999998', 'period': 'hour'}), {'error': 'Value out of range: 9e999998'})
+
+    def test_convert_many(self):
+        self.assertEqual(len(convert_many([{'amount': 15, 'period': 'hour'}] * 3)), 3)
+
+
+class TestServer(unittest.TestCase):
+
+    def run_with_server(self, client, **kwargs):
+        async def main():
+            options = dict(port=0, executor='thread', workers=2)
+            options.update(kwargs)
+            server = await Server(**options).start()
+            try:
+                reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+                try:
+                    return await client(reader, writer, server)
+                finally:
+                    writer.close()
+            finally:
+                await server.close()
+        return asyncio.run(main())
+
+    def test_keep_alive_requests(self):
+        async def client(reader, writer, server):
+            responses = []
+            responses.append(await request(reader, writer, 'GET', '/health'))
+            responses.append(await request(reader, writer, 'GET', '/convert?amount=15&period=hour&hours=1500'))
+            responses.append(await request(reader, writer, 'POST', '/convert', {'amount': 31200, 'period': 'year'}))
+            return responses
+        health, get, post = self.run_with_server(client)
+        self.assertEqual(health[:2], (200, {'status': 'ok'}))
+        self.assertIn('Connection: keep-alive', health[2])
+        self.assertEqual(get[0], 200)
+        self.assertEqual(get[1]['per_period_summary']['year']['dollars'], '$22,500.00')
+        self.assertEqual(post[1]['per_period_summary']['hour']['float'], 15.0)
+
+    def test_batch(self):
+        async def client(reader, writer, server):
+            items = [{'amount': 15, 'period': 'hour'}, {'amount': 'x', 'period': 'hour'}]
+            return await request(reader, writer, 'POST', '/convert/batch', items)
+        status, body, _ = self.run_with_server(client)
+        self.assertEqual(status, 200)
+        self.assertEqual(body[0]['amount']['dollars'], '$15.00')
+        self.assertIn('error', body[1])
+
+    def test_concurrent_requests_coalesced(self):
+        async def client(reader, writer, server):
+            calls = []
+            run_in_pool = server.run_in_pool
+
+            async def counting_run_in_pool(items):
+                calls.append(len(items))
+                return await run_in_pool(items)
+            server.run_in_pool = counting_run_in_pool
+            futures = [server.batcher.submit({'amount': i + 1, 'period': 'hour'}) for i in range(10)]
+            results = await asyncio.gather(*futures)
+            return calls, results
+        calls, results = self.run_with_server(client, batch_delay=0.01)
+        self.assertEqual(calls, [10])
+        self.assertEqual([r['amount']['float'] for r in results], [float(i + 1) for i in range(10)])
+
+    def test_errors(self):
+        async def client(reader, writer, server):
+            return [
+                await request(reader, writer, 'POST', '/convert', {'amount': 15, 'period': 'bad'}),
+                await request(reader, writer, 'GET', '/missing'),
+                await request(reader, writer, 'PUT', '/convert', {}),
+                await request(reader, writer, 'POST', '/convert/batch', {'amount': 15}),
+            ]
+        statuses = [response[0] for response in self.run_with_server(client)]
+        self.assertEqual(statuses, [400, 404, 405, 400])
+
+    def test_overflow_item_coalesced(self):
+        async def client(reader, writer, server):
+            futures = [server.batcher.submit({'amount': '9e999998', 'period': 'hour'}),
+                       server.batcher.submit({'amount': 15, 'period': 'hour'})]
+            results = await asyncio.wait_for(asyncio.gather(*futures), 5)
+            response = await request(reader, writer, 'POST', '/convert', {'amount': '9e999998', 'period': 'hour'})
+            return results, response
+        results, response = self.run_with_server(client, batch_delay=0.01)
+        self.assertIn('error', results[0])
+        self.assertEqual(results[1]['amount']['float'], 15.0)
+        self.assertEqual(response[0], 400)
+
+    def test_unexpected_error(self):
+        async def client(reader, writer, server):
+            async def failing_run_in_pool(items):
+                raise RuntimeError('worker died')
+            server.run_in_pool = failing_run_in_pool
+            return [
+                await request(reader, writer, 'POST', '/convert/batch', [{'amount': 15, 'period': 'hour'}]),
+                await request(reader, writer, 'GET', '/health'),
+            ]
+        failed, health = self.run_with_server(client)
+        self.assertEqual(failed[:2], (500, {'error': 'worker died'}))
+        self.assertEqual(health[0], 200)
+
+    def test_invalid_json(self):
+        async def client(reader, writer, server):
+            writer.write(b'POST /convert HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}')
+            await writer.drain()
+            head = await reader.readuntil(b'\r\n\r\n')
+            return head.decode()
+        self.assertTrue(self.run_with_server(client).startswith('HTTP/1.1 400'))
+
+    def test_connection_close(self):
+        async def client(reader, writer, server):
+            response = await request(reader, writer, 'GET', '/health', headers='Connection: close\r\n')
+            return response, await reader.read()
+        (status, _, head), rest = self.run_with_server(client)
+        self.assertIn('Connection: close', head)
+        self.assertEqual(rest, b'')
+
+    def test_body_too_large(self):
+        async def client(reader, writer, server):
+            return await request(reader, writer, 'POST', '/convert', {'amount': 15, 'period': 'hour'})
+        status, _, head = self.run_with_server(client, max_body=4)
+        self.assertEqual(status, 413)
+        self.assertIn('Connection: close', head)
+
+    def test_process_pool(self):
+        async def client(reader, writer, server):
+            return await request(reader, writer, 'POST', '/convert', {'amount': 15, 'period': 'hour'})
+        status, body, _ = self.run_with_server(client, executor='process', workers=1)
+        self.assertEqual(status, 200)
+        self.assertEqual(body['per_period_summary']['day']['float'], 120.0)
+
+    def test_close_ends_keep_alive_connections(self):
+        async def main():
+            errors = []
+            asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+            server = await Server(port=0, executor='thread', workers=1).start()
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.port)
+            status, _, _ = await request(reader, writer, 'GET', '/health')
+            await server.close()
+            rest = await asyncio.wait_for(reader.read(), 5)
+            writer.close()
+            return errors, status, rest, server._connections
+        errors, status, rest, connections = asyncio.run(main())
+        self.assertEqual((status, rest, connections), (200, b'', {}))
+        self.assertEqual(errors, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
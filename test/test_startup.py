@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import time
+import unittest
+
+# Generous budgets, failures point at a newly eager import rather than noise
+import_budget = 0.1  # seconds, cumulative import time of wage.interface
+cold_start_budget = 0.3  # seconds, wage run time on top of a bare interpreter
+
+# Only needed by subcommands or optional features, never by a plain conversion
+deferred_modules = ('asyncio', 'concurrent.futures', 'multiprocessing', 'csv', 'json', 'numpy', 'wage.batch',
+                    'wage.parallel', 'wage.server', 'wage.streaming')
+
+
+def import_times(*args):
+    """ {module: cumulative seconds} from python -X importtime """
+    process = subprocess.run([sys.executable, '-X', 'importtime', *args],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, name = line.split('|')
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+
+def run_time(*args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+
+class TestStartup(unittest.TestCase):
+
+    def test_import_wage_is_lazy(self):
+        times = import_times('-c', 'import wage')
+        self.assertIn('wage', times)
+        self.assertNotIn('wage.salary', times)
+
+    def test_cli_defers_imports(self):
+        times = import_times('-m', 'wage', '15', 'hour')
+        self.assertIn('wage.salary', times)
+        for module in deferred_modules:
+            self.assertNotIn(module, times)
+
+    def test_import_budget(self):
+        times = min((import_times('-c', 'import wage.interface') for _ in range(3)),
+                    key=lambda t: t['wage.interface'])
+        self.assertLess(times['wage.interface'], import_budget)
+
+    def test_cold_start_budget(self):
+        baseline = min(run_time('-c', 'pass') for _ in range(3))
+        cold_start = min(run_time('-m', 'wage', '15', 'hour') for _ in range(3))
+        self.assertLess(cold_start - baseline, cold_start_budget)
+
+
+if __name__ == '__main__':
+    unittest.main()
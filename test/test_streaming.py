@@ -0,0 +1,108 @@
+import io
+import json
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from decimal import Decimal
+from unittest.mock import patch
+from wage import streaming
+from wage.interface import main
+
+
+class TestStreaming(unittest.TestCase):
+
+    csv_input = 'amount,period,hours\n15,hour,\n15,hour,1500\n31200,year,\n'
+
+    def test_guess_format(self):
+        self.assertEqual(streaming.guess_format('salaries.csv'), 'csv')
+        self.assertEqual(streaming.guess_format('salaries.jsonl'), 'jsonl')
+
+    def test_read_rows_csv(self):
+        rows = list(streaming.read_rows(io.StringIO(self.csv_input), 'csv'))
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1], {'amount': '15', 'period': 'hour', 'hours': '1500'})
+
+    def test_read_rows_jsonl(self):
+        fp = io.StringIO('{"amount": 15, "period": "hour"}\n\n{"amount": 1, "period": "day"}\n')
+        rows = list(streaming.read_rows(fp, 'jsonl'))
+        self.assertEqual(rows, [{'amount': 15, 'period': 'hour'}, {'amount': 1, 'period': 'day'}])
+
+    def test_read_rows_invalid_format(self):
+        with self.assertRaises(ValueError):
+            list(streaming.read_rows(io.StringIO(''), 'xml'))
+
+    def test_read_rows_lazy(self):
+        rows = streaming.read_rows(iter(['amount,period\n', '15,hour\n']), 'csv')
+        self.assertEqual(next(rows), {'amount': '15', 'period': 'hour'})
+
+    def test_convert_row(self):
+        row = streaming.convert_row({'amount': '15', 'period': 'hour', 'hours': '1500', 'days': ''})
+        self.assertEqual(row['hourly'], Decimal(15))
+        self.assertEqual(round(row['daily'], 2), Decimal('86.54'))
+        self.assertEqual(row['yearly'], Decimal(22500))
+
+    def test_convert_rows_invalid_raise(self):
+        rows = streaming.convert_rows([{'amount': '15a', 'period': 'hour'}])
+        with self.assertRaises(ValueError):
+            list(rows)
+
+    def test_convert_rows_invalid_skip(self):
+        skipped = []
+        rows = [{'amount': '15a', 'period': 'hour'}, {'period': 'hour'}, {'amount': '15', 'period': 'hour'}]
+        converted = list(streaming.convert_rows(rows, errors='skip', on_error=lambda *e: skipped.append(e[0])))
+        self.assertEqual(len(converted), 1)
+        self.assertEqual(skipped, [1, 2])
+
+    def test_convert_rows_out_of_range_skip(self):
+        skipped = []
+        rows = [{'amount': '1e999999', 'period': 'hour'}, {'amount': 'sNaN', 'period': 'hour'},
+                {'amount': '15', 'period': 'hour'}]
+        converted = list(streaming.convert_rows(rows, errors='skip', on_error=lambda *e: skipped.append(e)))
+        self.assertEqual(len(converted), 1)
+        self.assertEqual([number for number, _, _ in skipped], [1, 2])
+        self.assertEqual(streaming.error_message(skipped[0][2]), 'Value out of range: Overflow')
+        with self.assertRaisesRegex(ValueError, 'Invalid row 1: Value out of range'):
+            list(streaming.convert_rows(rows))
+
+    def test_convert_rows_invalid_jsonl_skip(self):
+        fp = io.StringIO('{"amount": 15, "period": "hour"}\n{"amount": 15,\n[1, 2]\n{"amount": 1, "period": "day"}\n')
+        skipped = []
+        rows = streaming.read_rows(fp, 'jsonl')
+        converted = list(streaming.convert_rows(rows, errors='skip', on_error=lambda *e: skipped.append(e[:2])))
+        self.assertEqual(len(converted), 2)
+        self.assertEqual(skipped, [(2, '{"amount": 15,\n'), (3, [1, 2])])
+
+    def test_main_batch_skip_reports_invalid_rows(self):
+        out, err = io.StringIO(), io.StringIO()
+        rows = 'amount,period\n1e999999,hour\n15,hour\n'
+        with redirect_stdout(out), redirect_stderr(err), patch('sys.stdin', io.StringIO(rows)):
+            main(['batch', 'errors=skip'])
+        self.assertEqual(len(out.getvalue().splitlines()), 2)
+        self.assertEqual(err.getvalue(), 'Skipped row 1: Value out of range: Overflow\n')
+
+    def test_write_rows_csv(self):
+        out = io.StringIO()
+        rows = streaming.convert_rows(streaming.read_rows(io.StringIO(self.csv_input)))
+        streaming.write_rows(rows, out, 'csv')
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], 'amount,period,hourly,daily,weekly,fortnightly,monthly,quarterly,semesterly,yearly')
+        self.assertEqual(lines[2], '15,hour,15.00,86.54,432.69,865.38,1875.00,5625.00,11250.00,22500.00')
+        self.assertEqual(len(lines), 4)
+
+    def test_write_rows_jsonl(self):
+        out = io.StringIO()
+        rows = streaming.convert_rows(streaming.read_rows(io.StringIO(self.csv_input)))
+        streaming.write_rows(rows, out, 'jsonl')
+        objs = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(objs), 3)
+        self.assertEqual(objs[1]['daily'], 86.54)
+        self.assertEqual(objs[2]['period'], 'year')
+
+    def test_main_batch(self):
+        out = io.StringIO()
+        with redirect_stdout(out), patch('sys.stdin', io.StringIO(self.csv_input)):
+            main(['batch', 'output=jsonl'])
+        self.assertEqual(len(out.getvalue().splitlines()), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
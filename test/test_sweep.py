@@ -0,0 +1,66 @@
+import unittest
+from wage import Salary
+
+try:
+    import numpy
+    from wage.sweep import sweep
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy not installed')
+class TestSweep(unittest.TestCase):
+
+    def test_single_salary_grid(self):
+        result = sweep(Salary(15, 'hour'), hours=range(1000, 2601, 10), weeks=range(48, 53))
+        self.assertEqual(result.values.shape, (161, 5, 8))
+        self.assertEqual(result.per_period('weekly').shape, (161, 5))
+        self.assertEqual(list(result.axes), ['hours', 'weeks'])
+        for i, hours in ((0, 1000), (108, 2080), (160, 2600)):
+            for j, weeks in enumerate(range(48, 53)):
+                expected = Salary(15, 'hour', hours=hours, weeks=weeks)
+                self.assertAlmostEqual(result.per_period('yearly')[i, j], expected.yearly.float)
+                self.assertAlmostEqual(result.per_period('weekly')[i, j], expected.weekly.float)
+
+    def test_population_matches_salaries(self):
+        salaries = [Salary(15, 'hour'), Salary(31200, 'year', days=200), Salary('2600.015', 'month', hours=1500)]
+        result = sweep(salaries, hours=[1950, 2080], days=[250])
+        self.assertEqual(result.values.shape, (3, 2, 1, 8))
+        rounded = result.rounded()
+        for s, salary in enumerate(salaries):
+            for h, hours in enumerate((1950, 2080)):
+                expected = Salary(salary.amount, salary.period, hours=hours, days=250)
+                self.assertEqual(rounded[s, h, 0].tolist(),
+                                 [float(round(amount.decimal, 2)) for amount in (
+                                     expected.hourly, expected.daily, expected.weekly, expected.fortnightly,
+                                     expected.monthly, expected.quarterly, expected.semesterly, expected.yearly)])
+
+    def test_unswept_parameters_keep_salary_calendar(self):
+        result = sweep([Salary(15, 'hour', weeks=50)], hours=[2080])
+        self.assertAlmostEqual(result.per_period('weekly')[0, 0], 31200 / 50)
+
+    def test_to_rows(self):
+        rows = list(sweep([Salary(15, 'hour'), Salary(20, 'hour')], hours=[1000, 2000], weeks=[50]).to_rows())
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[1], {'salary': 0, 'hours': 2000, 'weeks': 50, 'hourly': 15.0, 'daily': 115.38,
+                                   'weekly': 600.0, 'fortnightly': 1153.85, 'monthly': 2500.0,
+                                   'quarterly': 7500.0, 'semesterly': 15000.0, 'yearly': 30000.0})
+        self.assertEqual(rows[3]['salary'], 1)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            sweep(Salary(15, 'hour'))
+        with self.assertRaises(TypeError):
+            sweep(Salary(15, 'hour'), minutes=[1])
+        with self.assertRaises(TypeError):
+            sweep(Salary(15, 'hour'), years=[2])
+        with self.assertRaises(ValueError):
+            sweep(Salary(15, 'hour'), hours=[0, 2080])
+        with self.assertRaises(ValueError):
+            sweep(Salary(15, 'hour'), hours=['1a'])
+        with self.assertRaises(ValueError):
+            sweep(Salary(15, 'hour'), hours=[2080]).per_period('hours')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,2 +1,27 @@
-from .salary import Salary
-from .formatters import Numeric
+""" Wage calculator module
+
+Salary and Numeric are imported on first access, so `import wage` (and the
+`wage` command line entry point) only loads what it actually uses.
+"""
+from importlib import import_module
+
+__all__ = ['Salary', 'Numeric']
+
+_lazy_attributes = {
+    'Salary': '.salary',
+    'Numeric': '.formatters',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_attributes[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,291 @@
+""" Streaming, mergeable statistics of salary populations per pay period
+
+PopulationStats consumes Salary objects or raw rows one at a time and keeps,
+for each period (hourly ... yearly), the count, sum, min, max and mean plus
+a QuantileSketch for approximate percentiles and histograms. Memory use is
+bounded by the sketch size, not by the population size, and partial results
+(e.g. one per file or worker process) can be merged.
+
+Example:
+    stats = PopulationStats()
+    stats.update(streaming.read_rows(open('salaries.csv')))
+    stats['yearly'].quantile(0.9)
+    stats.to_dict()
+"""
+import math
+from .salary import Salary
+from .streaming import error_message, period_fields, row_dict, row_salary
+
+
+def _finite(value):
+    """ value as a float, raising ValueError when it is infinite or NaN """
+    number = float(value)
+    if not math.isfinite(number):
+        raise ValueError(f'Value not numeric: {value}')
+    return number
+
+
+class QuantileSketch:
+    """ Logarithmically bucketed sketch of a stream of numbers
+
+    Every value is counted in the bucket [gamma ** (k - 1), gamma ** k)
+    holding it, with gamma = (1 + accuracy) / (1 - accuracy), so quantiles
+    are answered within `accuracy` relative error. Buckets only exist for
+    magnitudes actually seen, e.g. about 1,300 at the default 1% accuracy
+    for every amount between $0.01 and $1,000,000,000. Beyond max_buckets,
+    the buckets closest to zero are collapsed together, trading accuracy
+    for the smallest magnitudes only.
+    """
+
+    __slots__ = ('accuracy', 'max_buckets', 'count', 'zeros', '_positive', '_negative', '_gamma', '_log_gamma')
+
+    def __init__(self, accuracy=0.01, max_buckets=2048):
+        """ QuantileSketch initialization
+
+        Arguments:
+            accuracy: optional: relative error of quantiles, between 0 and 1 (float)
+            max_buckets: optional: bucket count that triggers collapsing (int)
+        """
+        if not 0 < accuracy < 1:
+            raise ValueError(f'Invalid argument provided: {accuracy}')
+        self.accuracy = accuracy
+        self.max_buckets = max_buckets
+        self.count = 0
+        self.zeros = 0
+        self._positive = {}
+        self._negative = {}
+        self._gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f'QuantileSketch(<{self.count} values in {len(self._positive) + len(self._negative)} buckets>)'
+
+    def _key(self, magnitude):
+        return math.ceil(math.log(magnitude) / self._log_gamma)
+
+    def _value(self, key):
+        """ Representative value of a bucket, within accuracy of all its values """
+        return 2 * self._gamma ** key / (self._gamma + 1)
+
+    def add(self, value, count=1):
+        """ Count value (finite number) count times """
+        value = _finite(value)
+        if value > 0:
+            store = self._positive
+        elif value < 0:
+            store = self._negative
+            value = -value
+        else:
+            self.zeros += count
+            self.count += count
+            return
+        key = self._key(value)
+        store[key] = store.get(key, 0) + count
+        self.count += count
+        if len(store) > self.max_buckets:
+            self._collapse(store)
+
+    def _collapse(self, store):
+        keys = sorted(store)
+        excess = len(keys) - self.max_buckets
+        merged = sum(store.pop(key) for key in keys[:excess + 1])
+        store[keys[excess]] = merged
+
+    def merge(self, other):
+        """ Add every value counted by other, a sketch with the same accuracy """
+        if other.accuracy != self.accuracy:
+            raise ValueError('Cannot merge sketches with different accuracy')
+        for store, other_store in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in other_store.items():
+                store[key] = store.get(key, 0) + count
+            if len(store) > self.max_buckets:
+                self._collapse(store)
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def buckets(self):
+        """ Lazily yield (representative value, count) in ascending value order """
+        for key in sorted(self._negative, reverse=True):
+            yield -self._value(key), self._negative[key]
+        if self.zeros:
+            yield 0.0, self.zeros
+        for key in sorted(self._positive):
+            yield self._value(key), self._positive[key]
+
+    def quantile(self, q):
+        """ Approximate value at quantile q, between 0 and 1 (float), None when empty """
+        if not 0 <= q <= 1:
+            raise ValueError(f'Invalid argument provided: {q}')
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen > rank:
+                return value
+        return value
+
+
+class PeriodStats:
+    """ Count, sum, min, max, mean and quantile sketch of one period's amounts """
+
+    __slots__ = ('count', 'sum', 'min', 'max', 'sketch')
+
+    def __init__(self, accuracy=0.01):
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+        self.sketch = QuantileSketch(accuracy)
+
+    def __repr__(self):
+        return f'PeriodStats(count={self.count}, mean={self.mean}, min={self.min}, max={self.max})'
+
+    @property
+    def mean(self):
+        return self.sum / self.count if self.count else None
+
+    def add(self, value):
+        """ Count one amount (finite number) """
+        value = _finite(value)
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.sketch.add(value)
+
+    def merge(self, other):
+        """ Add every amount counted by other (PeriodStats) """
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        self.count += other.count
+        self.sum += other.sum
+        self.sketch.merge(other.sketch)
+        return self
+
+    def quantile(self, q):
+        """ Approximate amount at quantile q, between 0 and 1, within the
+        sketch accuracy and never outside [min, max] (float)
+        """
+        value = self.sketch.quantile(q)
+        if value is None:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        return min(max(value, self.min), self.max)
+
+    def histogram(self, bins=10):
+        """ Approximate counts of amounts in bins equal width bins between
+        min and max (list of (lower, upper, count))
+
+        Parameters:
+            bins: optional: number of bins (int)
+        """
+        if not self.count:
+            return []
+        width = (self.max - self.min) / bins
+        counts = [0] * bins
+        for value, count in self.sketch.buckets():
+            index = int((value - self.min) / width) if width else 0
+            counts[min(max(index, 0), bins - 1)] += count
+        return [(self.min + i * width, self.min + (i + 1) * width, count) for i, count in enumerate(counts)]
+
+    def to_dict(self, percentiles=(50, 90, 99)):
+        """ Serializable dictionary representation
+
+        Parameters:
+            percentiles: optional: percentiles to include, between 0 and 100 (sequence of numbers)
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.mean,
+            'percentiles': {f'p{p:g}': self.quantile(p / 100) for p in percentiles},
+        }
+
+
+class PopulationStats:
+    """ Per period statistics of a stream of salaries, see the module documentation """
+
+    fields = period_fields
+
+    def __init__(self, accuracy=0.01):
+        """ PopulationStats initialization
+
+        Arguments:
+            accuracy: optional: relative error of percentiles, between 0 and 1 (float)
+        """
+        self.accuracy = accuracy
+        self.periods = {field: PeriodStats(accuracy) for field in self.fields}
+
+    def __getitem__(self, field):
+        """ PeriodStats of a period field, e.g. 'yearly' """
+        return self.periods[field]
+
+    def __len__(self):
+        return self.periods['yearly'].count
+
+    def __repr__(self):
+        return f'PopulationStats(<{len(self)} salaries>)'
+
+    def add(self, item):
+        """ Count one salary
+
+        Parameters:
+            item: required: a Salary, a raw row dict ('amount', 'period' and
+                  optional calendar keywords) or a converted row with every
+                  period field, e.g. from streaming.convert_rows
+        """
+        if isinstance(item, Salary):
+            values = [getattr(item, field).decimal for field in self.fields]
+        else:
+            item = row_dict(item)
+            if 'yearly' not in item:
+                return self.add(row_salary(item))
+            values = [item[field] for field in self.fields]
+        # Checked up front, so an invalid row leaves every period untouched
+        values = [_finite(value) for value in values]
+        for field, value in zip(self.fields, values):
+            self.periods[field].add(value)
+
+    def update(self, items, errors='raise', on_error=None):
+        """ Count every salary of an iterable, see add
+
+        Parameters:
+            items: required: salaries or rows (iterable)
+            errors: optional: what to do with invalid rows (str) valid options: [raise|skip]
+            on_error: optional: called with (row number, row, error) for skipped rows (function)
+        """
+        if errors not in ('raise', 'skip'):
+            raise ValueError(f'Invalid argument provided: {errors}')
+        for number, item in enumerate(items, 1):
+            try:
+                self.add(item)
+            except (ArithmeticError, IndexError, KeyError, TypeError, ValueError) as err:
+                if errors == 'raise':
+                    raise ValueError(f'Invalid row {number}: {error_message(err)}') from err
+                if on_error is not None:
+                    on_error(number, item, err)
+        return self
+
+    def merge(self, other):
+        """ Add every salary counted by other (PopulationStats) """
+        for field in self.fields:
+            self.periods[field].merge(other.periods[field])
+        return self
+
+    def to_dict(self, percentiles=(50, 90, 99)):
+        """ Serializable dictionary of every period's statistics, see PeriodStats.to_dict """
+        return {field: self.periods[field].to_dict(percentiles) for field in self.fields}
@@ -0,0 +1,99 @@
+""" Asyncio conversion of salary streams without blocking the event loop
+
+    async for result in aconvert(items):
+        ...
+
+Items are read from an async (or regular) iterable by a background task,
+grouped into chunks and converted in an executor. At most `window` chunks
+are converted or waiting to be yielded at once and the reader stops when
+they are all taken, so a slow consumer slows the producer down instead of
+data being buffered without bound.
+"""
+import asyncio
+from collections import deque
+from .server import convert_many
+
+_done = object()
+_empty = object()
+
+
+async def _read(source, queue):
+    """ Put every item of source on queue, then _done """
+    try:
+        if hasattr(source, '__aiter__'):
+            async for item in source:
+                await queue.put(item)
+        else:
+            for item in source:
+                await queue.put(item)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Let the converted items through, the error is raised after them
+        await queue.put(_done)
+        raise
+    await queue.put(_done)
+
+
+async def aconvert(items, executor=None, window=4, chunk_size=64, convert=convert_many):
+    """ Convert items, yielding one result per item in input order
+
+    Parameters:
+        items: required: items to convert, by default dicts of 'amount',
+               'period' and optional calendar keywords (async iterable/iterable)
+        executor: optional: where conversions run (concurrent.futures.Executor)
+                  (default: the event loop's default thread pool). Use a
+                  ProcessPoolExecutor to convert on several cores.
+        window: optional: chunks in flight at most (int)
+        chunk_size: optional: items per chunk at most (int)
+        convert: optional: converts a list of items to a list of results,
+                 picklable for process pools (function) (default: a
+                 Salary.to_dict() or {'error': ...} per item, as served by
+                 wage serve)
+
+    Chunks hold whatever items are ready, up to chunk_size, so a slow input
+    stream is converted item by item instead of waiting for full chunks.
+    """
+    if window < 1 or chunk_size < 1:
+        raise ValueError(f'Invalid argument provided: {min(window, chunk_size)}')
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(window * chunk_size)
+    reader = asyncio.ensure_future(_read(items, queue))
+    pending = deque()
+    finished = False
+    try:
+        while not finished or pending:
+            while not finished and len(pending) < window:
+                chunk, finished = _take(queue, await queue.get() if not pending else _nowait(queue), chunk_size)
+                if not chunk:
+                    break
+                pending.append(loop.run_in_executor(executor, convert, chunk))
+            if pending:
+                for result in await pending.popleft():
+                    yield result
+        await reader
+    finally:
+        reader.cancel()
+        for future in pending:
+            future.cancel()
+
+
+def _take(queue, item, chunk_size):
+    """ Chunk of item and whatever else is queued, and whether the input ended """
+    chunk = []
+    while item is not _empty:
+        if item is _done:
+            return chunk, True
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            break
+        item = _nowait(queue)
+    return chunk, False
+
+
+def _nowait(queue):
+    """ Next queued item or _empty when the queue is empty """
+    try:
+        return queue.get_nowait()
+    except asyncio.QueueEmpty:
+        return _empty
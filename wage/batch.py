@@ -0,0 +1,184 @@
+import numpy as np
+from .paycalendar import PayCalendar
+from .salary import Salary
+
+
+class SalaryBatch:
+    """ Columnar, NumPy backed conversion of many salaries at once
+
+    Amounts are held as float64 for the raw conversions. Rounded results are
+    computed exactly on integers scaled by 10 ** scale, so they match the
+    scalar Salary results to the cent (ties round half to even, as Decimal
+    does) for amounts with up to `scale` decimal places, given as strings,
+    ints or Decimals. Floats are taken at their shortest decimal repr
+    while Salary converts their exact binary value, so ties may differ,
+    e.g. 2.675 per year rounds to 2.68 here and to 2.67 in Salary(2.675, 'year').
+    """
+
+    periods = tuple(Salary._period_yearly_defaults)
+    scale = 4
+
+    def __init__(self, amounts, periods, **kwargs):
+        """ SalaryBatch initialization
+
+        Arguments:
+            amounts: required: salary amounts (sequence/array of numbers)
+            periods: required: salary amount periods, one per amount, or a
+                     single period shared by every row (string/sequence/array)
+                     valid options: [hour|day|week|fortnight|month|quarter|semester|year]
+
+        Keyword arguments:
+            Same as Salary (hours, days, weeks, ...). Each value may be a
+            single number applied to every row or a sequence/array with one
+            override per row.
+            calendar: yearly occurrences to start from (PayCalendar) (default: PayCalendar())
+
+        When every row shares one calendar, conversions are a single multiply
+        by the calendar's precomputed ratio matrix.
+
+        Examples:
+            SalaryBatch([15, 31200], ['hour', 'year'])
+            SalaryBatch([15, 15], 'hour', hours=[2080, 1500])
+        """
+        self.amounts = self._handle_amounts(amounts)
+        self.period_codes = self._handle_periods(periods)
+        self.calendar = kwargs.pop('calendar', PayCalendar())
+        self.times_per_year = self._handle_kwargs(kwargs)
+        self._summary = None
+
+    def __len__(self):
+        return len(self.amounts)
+
+    def __repr__(self):
+        return f'SalaryBatch(<{len(self)} salaries>)'
+
+    def _handle_amounts(self, amounts):
+        try:
+            return np.asarray(amounts, dtype=np.float64).reshape(-1)
+        except (TypeError, ValueError):
+            raise ValueError('Amounts not numeric')
+
+    def _handle_periods(self, periods):
+        periods = np.asarray(periods)
+        if periods.dtype.kind in 'iu':
+            codes = periods.astype(np.intp)
+            if codes.size and (codes.min() < 0 or codes.max() >= len(self.periods)):
+                raise ValueError('Invalid period code provided')
+        else:
+            names, inverse = np.unique(periods.astype(str), return_inverse=True)
+            lookup = []
+            for name in names:
+                if name not in self.periods:
+                    raise ValueError(f'Invalid argument provided: {name}')
+                lookup.append(self.periods.index(name))
+            codes = np.asarray(lookup, dtype=np.intp)[inverse.reshape(periods.shape)]
+        return np.broadcast_to(codes, self.amounts.shape)
+
+    def _handle_kwargs(self, kwargs):
+        times = np.empty((len(self.amounts), len(self.periods)), dtype=np.float64)
+        times[:] = self.calendar.times
+        calendar_kwargs = {k: v for k, v in kwargs.items()
+                           if k[:-1] in Salary._period_yearly_defaults and k[:-1] != 'year'}
+        shared = {}
+        for k, v in calendar_kwargs.items():
+            try:
+                values = np.asarray(v, dtype=np.float64).astype(np.int64)
+            except (TypeError, ValueError):
+                raise ValueError(f'Value not numeric: {v}')
+            if values.size and values.min() <= 0:
+                raise ValueError(f'Invalid yearly occurrences: {k}')
+            times[:, self.periods.index(k[:-1])] = values
+            if values.ndim == 0:
+                shared[k] = int(values)
+        # A calendar is kept only while every row shares it
+        self.calendar = self.calendar.replace(**shared) if len(shared) == len(calendar_kwargs) else None
+        return times
+
+    def per_period(self, period):
+        """ Converted amounts for the given period (ndarray of float64)
+
+        Parameters:
+            period: required: the period to convert to (str)
+        """
+        return self.per_period_summary[:, self.periods.index(period)]
+
+    def rounded(self, decimals=2):
+        """ Every conversion rounded half to even to the given number of
+        decimal places (ndarray of float64, shape (n, 8))
+
+        Parameters:
+            decimals: optional: decimal places to keep, at most `scale` (int)
+        """
+        return self.quantized(decimals) / 10 ** decimals
+
+    def quantized(self, decimals=2):
+        """ Every conversion as an integer count of 10 ** -decimals units,
+        e.g. cents for the default (ndarray of int64, shape (n, 8))
+
+        Parameters:
+            decimals: optional: decimal places to keep, at most `scale` (int)
+        """
+        if not 0 <= decimals <= self.scale:
+            raise ValueError(f'Invalid argument provided: {decimals}')
+        rows = np.arange(len(self.amounts))
+        times = self.times_per_year.astype(np.int64)
+        units = np.rint(self.amounts * 10 ** self.scale).astype(np.int64)
+        numerator = (units * times[rows, self.period_codes])[:, np.newaxis]
+        denominator = times * 10 ** (self.scale - decimals)
+        quotient, remainder = np.divmod(numerator, denominator)
+        twice = remainder * 2
+        round_up = (twice > denominator) | ((twice == denominator) & (quotient % 2 == 1))
+        return quotient + round_up
+
+    @property
+    def per_period_summary(self):
+        """ Every conversion, one column per period (ndarray, shape (n, 8)) """
+        if self._summary is None:
+            if self.calendar is not None:
+                ratios = np.asarray(self.calendar.float_ratios)
+                self._summary = self.amounts[:, np.newaxis] * ratios[self.period_codes]
+            else:
+                rows = np.arange(len(self.amounts))
+                yearly = self.amounts * self.times_per_year[rows, self.period_codes]
+                self._summary = yearly[:, np.newaxis] / self.times_per_year
+        return self._summary
+
+    @property
+    def yearly(self):
+        """ Yearly amounts (ndarray) """
+        return self.per_period('year')
+
+    @property
+    def hourly(self):
+        """ Hourly amounts (ndarray) """
+        return self.per_period('hour')
+
+    @property
+    def daily(self):
+        """ Daily amounts (ndarray) """
+        return self.per_period('day')
+
+    @property
+    def weekly(self):
+        """ Weekly amounts (ndarray) """
+        return self.per_period('week')
+
+    @property
+    def fortnightly(self):
+        """ Fortnightly amounts (ndarray) """
+        return self.per_period('fortnight')
+
+    @property
+    def monthly(self):
+        """ Monthly amounts (ndarray) """
+        return self.per_period('month')
+
+    @property
+    def quarterly(self):
+        """ Quarterly amounts (ndarray) """
+        return self.per_period('quarter')
+
+    @property
+    def semesterly(self):
+        """ Semesterly amounts (ndarray) """
+        return self.per_period('semester')
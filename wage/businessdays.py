@@ -0,0 +1,198 @@
+""" Pay dates and working days from real business-day calendars
+
+PayCalendar defaults assume 260 working days and 2080 hours every year. A
+BusinessCalendar derives the actual figures of a given year from its
+weekend days, holidays and pay schedule:
+
+    business = BusinessCalendar('fortnightly', holidays=[date(2026, 12, 25), ...])
+    business.working_days(2026)   # 260 minus holidays falling on weekdays
+    business.pay_calendar(2026)   # PayCalendar(hours=..., days=..., fortnights=...)
+    Salary(15, 'hour', **business.occurrences(2026))
+    population.set_calendar(**business.occurrences(2026))
+
+Each year is computed once per BusinessCalendar and cached, and the
+resulting PayCalendar is interned, so any number of salaries share it.
+"""
+import calendar
+from datetime import date, timedelta
+from .paycalendar import PayCalendar
+
+schedules = ('weekly', 'fortnightly', 'semi-monthly', 'monthly')
+
+rolls = ('preceding', 'following')
+
+_steps = {
+    'weekly': 7,
+    'fortnightly': 14,
+}
+
+# PayCalendar period counted by the pay dates of a schedule, if any
+_schedule_periods = {
+    'weekly': 'weeks',
+    'fortnightly': 'fortnights',
+}
+
+_day = timedelta(days=1)
+
+
+class BusinessCalendar:
+    """ Working days and pay dates of a pay schedule, computed lazily per year """
+
+    def __init__(self, schedule='monthly', holidays=(), weekend=(5, 6), hours_per_day=8, anchor=date(1970, 1, 2),
+                 roll='preceding'):
+        """ BusinessCalendar initialization
+
+        Arguments:
+            schedule: optional: how often pay dates occur (str)
+                      valid options: [weekly|fortnightly|semi-monthly|monthly]
+            holidays: optional: non-working dates (iterable of datetime.date),
+                      or a function of the year returning them, e.g. for
+                      recurring holidays (function)
+            weekend: optional: non-working weekdays, Monday being 0 (iterable of int)
+            hours_per_day: optional: working hours per working day (int)
+            anchor: optional: any nominal pay date of a weekly or fortnightly
+                    schedule (datetime.date) (default: Friday 1970-01-02)
+            roll: optional: where pay dates falling on non-working days move
+                  (str) valid options: [preceding|following]
+
+        Semi-monthly pay dates are the 15th and the last day of each month,
+        monthly ones the last day of each month. A pay date belongs to the
+        year of its nominal date, even when rolled into a neighboring year.
+
+        Examples:
+            BusinessCalendar()
+            BusinessCalendar('weekly', holidays=[date(2026, 1, 1), date(2026, 12, 25)])
+            BusinessCalendar('semi-monthly', holidays=lambda year: [date(year, 1, 1)], roll='following')
+        """
+        if schedule not in schedules:
+            raise ValueError(f'Invalid argument provided: {schedule}')
+        if roll not in rolls:
+            raise ValueError(f'Invalid argument provided: {roll}')
+        if not isinstance(hours_per_day, int) or hours_per_day <= 0:
+            raise ValueError(f'Invalid argument provided: {hours_per_day}')
+        weekend = frozenset(weekend)
+        if not weekend <= set(range(7)) or len(weekend) == 7:
+            raise ValueError(f'Invalid argument provided: {sorted(weekend)}')
+        self.schedule = schedule
+        self.weekend = weekend
+        self.hours_per_day = hours_per_day
+        self.anchor = anchor
+        self.roll = roll
+        if callable(holidays):
+            self._holidays = holidays
+        else:
+            by_year = {}
+            for holiday in holidays:
+                by_year.setdefault(holiday.year, set()).add(holiday)
+            self._holidays = lambda year: by_year.get(year, ())
+        self._holiday_sets = {}
+        self._working_days = {}
+        self._pay_dates = {}
+        self._occurrences = {}
+
+    def __repr__(self):
+        return (f'BusinessCalendar({self.schedule!r}, weekend={tuple(sorted(self.weekend))}, '
+                f'hours_per_day={self.hours_per_day}, roll={self.roll!r})')
+
+    def holidays(self, year):
+        """ Holidays of year falling on working weekdays (frozenset of datetime.date), cached per year """
+        try:
+            return self._holiday_sets[year]
+        except KeyError:
+            pass
+        holidays = frozenset(day for day in self._holidays(year) if day.year == year and day.weekday() not in self.weekend)
+        return self._holiday_sets.setdefault(year, holidays)
+
+    def working_days(self, year):
+        """ Working days of year (tuple of datetime.date), cached per year """
+        try:
+            return self._working_days[year]
+        except KeyError:
+            pass
+        holidays = self.holidays(year)
+        day, end = date(year, 1, 1), date(year, 12, 31)
+        days = []
+        while day <= end:
+            if day.weekday() not in self.weekend and day not in holidays:
+                days.append(day)
+            day += _day
+        return self._working_days.setdefault(year, tuple(days))
+
+    def is_working_day(self, day):
+        """ Whether day is a working day (bool) """
+        return day.weekday() not in self.weekend and day not in self.holidays(day.year)
+
+    def _nominal_pay_dates(self, year):
+        """ Pay dates of year before rolling off non-working days (list of datetime.date) """
+        if self.schedule in _steps:
+            step = _steps[self.schedule]
+            offset = (date(year, 1, 1) - self.anchor).days % step
+            day = date(year, 1, 1) + timedelta(days=(step - offset) % step)
+            days = []
+            while day.year == year:
+                days.append(day)
+                day += timedelta(days=step)
+            return days
+        days = []
+        for month in range(1, 13):
+            if self.schedule == 'semi-monthly':
+                days.append(date(year, month, 15))
+            days.append(date(year, month, calendar.monthrange(year, month)[1]))
+        return days
+
+    def pay_dates(self, year):
+        """ Pay dates of year, rolled onto working days (tuple of datetime.date), cached per year """
+        try:
+            return self._pay_dates[year]
+        except KeyError:
+            pass
+        step = -_day if self.roll == 'preceding' else _day
+        days = []
+        for day in self._nominal_pay_dates(year):
+            while not self.is_working_day(day):
+                day += step
+            days.append(day)
+        return self._pay_dates.setdefault(year, tuple(days))
+
+    def iter_pay_dates(self, start, stop=None):
+        """ Lazily yield pay dates from year start up to, excluding, year stop
+
+        Parameters:
+            start: required: first year (int)
+            stop: optional: year to stop at, None to never stop (int)
+
+        Years are only computed as the generator reaches them.
+        """
+        year = start
+        while stop is None or year < stop:
+            yield from self.pay_dates(year)
+            year += 1
+
+    def occurrences(self, year):
+        """ PayCalendar keyword arguments for year (dict)
+
+        Holds days and hours from the working days of year and, for weekly
+        and fortnightly schedules, weeks or fortnights from its pay dates.
+        Pass them to Salary, Population.set_calendar or PayCalendar.
+        """
+        try:
+            return dict(self._occurrences[year])
+        except KeyError:
+            pass
+        days = len(self.working_days(year))
+        occurrences = {'hours': days * self.hours_per_day, 'days': days}
+        if self.schedule in _schedule_periods:
+            occurrences[_schedule_periods[self.schedule]] = len(self.pay_dates(year))
+        return dict(self._occurrences.setdefault(year, occurrences))
+
+    def pay_calendar(self, year, base=None):
+        """ Interned PayCalendar of year, see occurrences
+
+        Parameters:
+            year: required: the year (int)
+            base: optional: calendar whose other yearly occurrences are kept (PayCalendar)
+                  (default: PayCalendar())
+        """
+        if base is None:
+            base = PayCalendar()
+        return base.replace(**self.occurrences(year))
@@ -0,0 +1,95 @@
+""" Shared conversion cache for populations with repeated salaries
+
+Every Salary caches its own conversions. With a ConversionCache installed,
+salaries with the same amount, period, calendar and backend share a single
+set of cached conversions instead, so a rate repeated across thousands of
+employees is converted once:
+
+    from wage.cache import ConversionCache
+    Salary.conversion_cache = ConversionCache(maxsize=4096)
+    ...
+    Salary.conversion_cache.stats()
+
+Salaries sharing an entry share its Numeric results, which are read-only as
+with the per Salary cache. Evicting an entry doesn't affect salaries already
+holding it, only later lookups.
+"""
+import threading
+from collections import OrderedDict
+
+policies = ('lru', 'fifo')
+
+
+class ConversionCache:
+    """ Bounded, thread safe map of (amount, period, calendar) to cached conversions """
+
+    def __init__(self, maxsize=4096, policy='lru'):
+        """ ConversionCache initialization
+
+        Arguments:
+            maxsize: optional: entries kept before evicting (int)
+            policy: optional: which entry to evict (str) valid options: [lru|fifo]
+                    lru evicts the least recently looked up entry, fifo the
+                    oldest one, which is cheaper when lookups rarely repeat
+        """
+        if maxsize < 1:
+            raise ValueError(f'Invalid argument provided: {maxsize}')
+        if policy not in policies:
+            raise ValueError(f'Invalid argument provided: {policy}')
+        self.maxsize = maxsize
+        self.policy = policy
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f'ConversionCache(maxsize={self.maxsize}, policy={self.policy!r}, <{len(self)} entries>)'
+
+    def lookup(self, amount, period, calendar):
+        """ Shared conversion dictionary of a salary, created empty on a miss
+
+        Parameters:
+            amount: required: the salary amount (Numeric)
+            period: required: the salary amount period (str)
+            calendar: required: the salary yearly occurrences (PayCalendar)
+        """
+        # Decimal('15') == Decimal('15.00'), but their conversions print differently
+        key = (type(amount), amount.value.as_tuple(), period, calendar)
+        with self._lock:
+            try:
+                entry = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                entry = self._entries[key] = {}
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+                return entry
+            self.hits += 1
+            if self.policy == 'lru':
+                self._entries.move_to_end(key)
+            return entry
+
+    def clear(self):
+        """ Drop every entry and reset the counters """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """ Dictionary of hits, misses, evictions, size, maxsize and hit_rate """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
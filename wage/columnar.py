@@ -0,0 +1,248 @@
+""" Binary columnar file format for salary populations
+
+Converting a CSV of salaries means parsing every row again on every run.
+A columnar file is written once and then memory mapped, so opening it is
+instant regardless of size, columns are handed out as zero-copy NumPy
+views, and processes reading the same file share its pages.
+
+Layout (little endian, every section aligned to 8 bytes):
+    header (64 bytes):
+        magic b'WAGECOL\\0', format version (uint32), padding (uint32),
+        rows (uint64), calendars (uint64), and the byte offsets (uint64) of
+        the amounts, calendar_ids, period_codes and calendars sections
+    amounts: rows x int64, amounts in cents
+    calendar_ids: rows x uint32, index into the calendars section
+    period_codes: rows x uint8, index into PayCalendar.periods
+    calendars: calendars x 8 x int64, PayCalendar.times of each calendar
+
+Example:
+    with ColumnarWriter('salaries.wagec') as writer:
+        writer.write_rows(streaming.read_rows(open('salaries.csv')))
+    with ColumnarFile('salaries.wagec') as columns:
+        batch = columns.batch()
+"""
+import mmap
+import struct
+import tempfile
+import numpy as np
+from .batch import SalaryBatch
+from .fixedpoint import FixedPoint
+from .paycalendar import PayCalendar
+from .parsing import parse_amount
+from .streaming import error_message, row_dict
+
+magic = b'WAGECOL\0'
+version = 1
+
+_header = struct.Struct('<8sII6Q')
+_amount_dtype = np.dtype('<i8')
+_amount_range = np.iinfo(_amount_dtype)
+_calendar_id_dtype = np.dtype('<u4')
+_period_code_dtype = np.dtype('<u1')
+_times_dtype = np.dtype('<i8')
+
+
+def _padding(size):
+    return b'\0' * (-size % 8)
+
+
+class ColumnarWriter:
+    """ Write salaries to a columnar file, see the module documentation
+
+    Rows are appended in chunks of any size; amounts are written straight
+    to the file and the smaller columns are spooled to temporary files
+    until close, so memory use doesn't grow with the number of rows.
+    """
+
+    def __init__(self, path):
+        """ ColumnarWriter initialization
+
+        Arguments:
+            path: required: file to create or overwrite (str/path)
+        """
+        self.path = path
+        self.rows = 0
+        self._calendars = {}
+        self._fp = open(path, 'wb')
+        self._fp.write(b'\0' * _header.size)
+        self._calendar_ids = tempfile.TemporaryFile()
+        self._period_codes = tempfile.TemporaryFile()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def calendar_id(self, calendar):
+        """ Id of calendar in this file, adding it on first use (int) """
+        try:
+            return self._calendars[calendar]
+        except KeyError:
+            return self._calendars.setdefault(calendar, len(self._calendars))
+
+    def write(self, amounts, period_codes, calendar_ids=0):
+        """ Append a chunk of rows from arrays
+
+        Arguments:
+            amounts: required: amounts in cents (sequence/array of int)
+            period_codes: required: index into PayCalendar.periods per row,
+                          or one shared by every row (int/sequence/array)
+            calendar_ids: optional: id returned by calendar_id per row, or
+                          one shared by every row (int/sequence/array) (default: 0)
+        """
+        amounts = np.asarray(amounts, dtype=_amount_dtype).reshape(-1)
+        period_codes = np.broadcast_to(np.asarray(period_codes), amounts.shape)
+        calendar_ids = np.broadcast_to(np.asarray(calendar_ids), amounts.shape)
+        if period_codes.size and (period_codes.min() < 0 or period_codes.max() >= len(PayCalendar.periods)):
+            raise ValueError('Invalid period code provided')
+        if calendar_ids.size and (calendar_ids.min() < 0 or calendar_ids.max() >= max(len(self._calendars), 1)):
+            raise ValueError('Invalid calendar id provided')
+        if not self._calendars:
+            self.calendar_id(PayCalendar())
+        self._fp.write(amounts.tobytes())
+        self._period_codes.write(period_codes.astype(_period_code_dtype).tobytes())
+        self._calendar_ids.write(calendar_ids.astype(_calendar_id_dtype).tobytes())
+        self.rows += len(amounts)
+
+    def write_rows(self, rows, errors='raise', on_error=None, chunk_size=65536):
+        """ Append row dicts, e.g. from streaming.read_rows
+
+        Each row needs 'amount' and 'period' fields and may give any
+        calendar keyword accepted by Salary (hours, days, weeks, ...).
+        Other fields, e.g. a name, are ignored.
+        Amounts are rounded half to even to the cent and must fit in int64
+        cents (about $92 quadrillion).
+
+        Parameters:
+            rows: required: row dicts to write (iterable)
+            errors: optional: what to do with invalid rows (str) valid options: [raise|skip]
+            on_error: optional: called with (row number, row, error) for skipped rows (function)
+            chunk_size: optional: rows buffered per write (int)
+        """
+        if errors not in ('raise', 'skip'):
+            raise ValueError(f'Invalid argument provided: {errors}')
+        periods = PayCalendar.periods
+        amounts, period_codes, calendar_ids = [], [], []
+        for number, row in enumerate(rows, 1):
+            try:
+                row = row_dict(row)
+                kwargs = {k: v for k, v in row.items()
+                          if k[:-1] in periods and k != 'years' and v not in (None, '')}
+                amount = parse_amount(row['amount'], FixedPoint.scale)
+                if not _amount_range.min <= amount <= _amount_range.max:
+                    raise ValueError(f"Value out of range: {row['amount']}")
+                period_code = periods.index(row['period'])
+                calendar_id = self.calendar_id(PayCalendar(**kwargs))
+            except (ArithmeticError, KeyError, TypeError, ValueError) as err:
+                if errors == 'raise':
+                    raise ValueError(f'Invalid row {number}: {error_message(err)}') from err
+                if on_error is not None:
+                    on_error(number, row, err)
+                continue
+            amounts.append(amount)
+            period_codes.append(period_code)
+            calendar_ids.append(calendar_id)
+            if len(amounts) >= chunk_size:
+                self.write(amounts, period_codes, calendar_ids)
+                amounts, period_codes, calendar_ids = [], [], []
+        if amounts:
+            self.write(amounts, period_codes, calendar_ids)
+
+    def close(self):
+        """ Write the remaining sections and the header """
+        if self._fp.closed:
+            return
+        try:
+            if not self._calendars:
+                self.calendar_id(PayCalendar())
+            fp = self._fp
+            offsets = [_header.size]
+            for spool in (self._calendar_ids, self._period_codes):
+                fp.write(_padding(fp.tell()))
+                offsets.append(fp.tell())
+                spool.seek(0)
+                while True:
+                    data = spool.read(1 << 20)
+                    if not data:
+                        break
+                    fp.write(data)
+            fp.write(_padding(fp.tell()))
+            offsets.append(fp.tell())
+            times = np.array([calendar.times for calendar in self._calendars], dtype=_times_dtype)
+            fp.write(times.tobytes())
+            fp.seek(0)
+            fp.write(_header.pack(magic, version, 0, self.rows, len(self._calendars), *offsets))
+        finally:
+            self._fp.close()
+            self._calendar_ids.close()
+            self._period_codes.close()
+
+
+class ColumnarFile:
+    """ Memory mapped, read only view of a columnar file
+
+    amounts, calendar_ids and period_codes are zero-copy NumPy views of the
+    mapping; they remain valid only while the file is open.
+    """
+
+    def __init__(self, path):
+        """ ColumnarFile initialization
+
+        Arguments:
+            path: required: file written by ColumnarWriter (str/path)
+        """
+        self.path = path
+        with open(path, 'rb') as fp:
+            header = fp.read(_header.size)
+            if len(header) < _header.size or header[:len(magic)] != magic:
+                raise ValueError(f'Not a columnar salary file: {path}')
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        (_, file_version, _, self.rows, calendar_count,
+         amounts_offset, calendar_ids_offset, period_codes_offset, calendars_offset) = _header.unpack(header)
+        if file_version != version:
+            raise ValueError(f'Unsupported columnar file version: {file_version}')
+        buffer = memoryview(self._mmap)
+        self.amounts = np.frombuffer(buffer, _amount_dtype, self.rows, amounts_offset)
+        self.calendar_ids = np.frombuffer(buffer, _calendar_id_dtype, self.rows, calendar_ids_offset)
+        self.period_codes = np.frombuffer(buffer, _period_code_dtype, self.rows, period_codes_offset)
+        times = np.frombuffer(buffer, _times_dtype, calendar_count * len(PayCalendar.periods), calendars_offset)
+        self.times = times.reshape(calendar_count, len(PayCalendar.periods))
+        self.calendars = tuple(PayCalendar.from_times(row) for row in self.times.tolist())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.rows
+
+    def __repr__(self):
+        return f'ColumnarFile({self.path!r}, <{self.rows} salaries>)'
+
+    def close(self):
+        """ Release the mapping; views handed out before must not be used after """
+        self.amounts = self.calendar_ids = self.period_codes = self.times = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views are still referenced elsewhere, the mapping is released with them
+            pass
+
+    def batch(self, start=None, stop=None):
+        """ SalaryBatch of the rows in [start, stop), all rows by default
+
+        Parameters:
+            start: optional: first row (int)
+            stop: optional: row to stop before (int)
+        """
+        rows = slice(start, stop)
+        amounts = self.amounts[rows] / 100
+        period_codes = self.period_codes[rows]
+        if len(self.calendars) == 1:
+            return SalaryBatch(amounts, period_codes, calendar=self.calendars[0])
+        times = self.times[self.calendar_ids[rows]]
+        kwargs = {f'{period}s': times[:, i] for i, period in enumerate(PayCalendar.periods)}
+        return SalaryBatch(amounts, period_codes, **kwargs)
@@ -0,0 +1,127 @@
+""" Compiled money formats and their registry
+
+A MoneyFormat compiles its locale rules (symbol and its placement, digit
+grouping and decimal separators, decimal places) into a format function
+once, so formatting a value is a single str.format call, plus one
+str.translate for locales whose separators differ from Python's.
+
+    get_format('de_DE').format(1234.5)  # '1.234,50 €'
+    Numeric.money_format = get_format('de_DE')  # used by Numeric.dollars
+"""
+from decimal import Decimal
+
+
+# Integer units below this format exactly through a float division
+_exact_float_units = 2 ** 51
+
+
+def _translated(format_value, table):
+    """ format_value with its output's separators translated through table """
+    def translated(value):
+        return format_value(value).translate(table)
+    return translated
+
+
+class MoneyFormat:
+    """ Compiled formatting rules of one currency and locale """
+
+    __slots__ = ('symbol', 'decimals', 'group', 'point', 'position', 'space', 'format', '_prefix', '_suffix',
+                 '_table')
+
+    def __init__(self, symbol='$', decimals=2, group=',', point='.', position='prefix', space=False):
+        """ MoneyFormat initialization
+
+        Arguments:
+            symbol: optional: currency symbol (str)
+            decimals: optional: decimal places (int)
+            group: optional: thousands separator, '' for none (str)
+            point: optional: decimal separator (str)
+            position: optional: where the symbol goes (str) valid options: [prefix|suffix]
+            space: optional: put a space between symbol and number (bool)
+
+        Examples:
+            MoneyFormat()  # 1234.5 -> '$1,234.50'
+            MoneyFormat('€', group='.', point=',', position='suffix', space=True)  # '1.234,50 €'
+        """
+        if position not in ('prefix', 'suffix'):
+            raise ValueError(f'Invalid argument provided: {position}')
+        if decimals < 0:
+            raise ValueError(f'Invalid argument provided: {decimals}')
+        self.symbol = symbol
+        self.decimals = decimals
+        self.group = group
+        self.point = point
+        self.position = position
+        self.space = space
+        separator = ' ' if space else ''
+        self._prefix = symbol + separator if position == 'prefix' else ''
+        self._suffix = separator + symbol if position == 'suffix' else ''
+        self._table = None if (group, point) == (',', '.') else str.maketrans({',': group, '.': point})
+        spec = (',' if group else '') + f'.{decimals}f'
+        # A bound str.format of the whole template is the fastest way to format
+        template = self._prefix.replace('{', '{{').replace('}', '}}') + '{:' + spec + '}'
+        template += self._suffix.replace('{', '{{').replace('}', '}}')
+        if self._table is None:
+            self.format = template.format
+        else:
+            self.format = _translated(template.format, self._table)
+
+    def __repr__(self):
+        return (f'MoneyFormat({self.symbol!r}, decimals={self.decimals}, group={self.group!r}, '
+                f'point={self.point!r}, position={self.position!r}, space={self.space})')
+
+    def format_many(self, values):
+        """ Format every number of a sequence or array (list of str)
+
+        Arrays are turned into a list with tolist first: formatting native
+        floats is far faster than formatting NumPy scalars one at a time.
+        """
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        return list(map(self.format, values))
+
+    def format_units(self, units, scale):
+        """ Format an integer number of 10 ** -scale units, e.g. cents, without
+        converting it to a Decimal when scale matches decimals
+        """
+        if scale != self.decimals:
+            return self.format(Decimal(units).scaleb(-scale))
+        if -_exact_float_units < units < _exact_float_units:
+            # units / 10 ** scale is then within half a unit of the exact value, so it formats exactly
+            return self.format(units / 10 ** scale)
+        whole, fraction = divmod(abs(units), 10 ** scale)
+        number = f'{whole:,}' if self.group else str(whole)
+        if self._table is not None:
+            number = number.translate(self._table)
+        if scale:
+            number += f'{self.point}{fraction:0{scale}d}'
+        return f'{self._prefix}{"-" if units < 0 else ""}{number}{self._suffix}'
+
+
+formats = {
+    'en_US': MoneyFormat('$'),
+    'en_GB': MoneyFormat('£'),
+    'de_DE': MoneyFormat('€', group='.', point=',', position='suffix', space=True),
+    'fr_FR': MoneyFormat('€', group='\u202f', point=',', position='suffix', space=True),
+    'de_CH': MoneyFormat('CHF', group='\u2019', point='.', space=True),
+    'ja_JP': MoneyFormat('¥', decimals=0),
+}
+
+default_format = formats['en_US']
+
+
+def register(name, money_format):
+    """ Make a MoneyFormat available by name, replacing any existing one """
+    if not isinstance(money_format, MoneyFormat):
+        raise TypeError(f'Invalid argument provided: {money_format}')
+    formats[name] = money_format
+
+
+def get_format(money_format):
+    """ Registered MoneyFormat by name, MoneyFormat instances are returned as is """
+    if isinstance(money_format, MoneyFormat):
+        return money_format
+    try:
+        return formats[money_format]
+    except KeyError:
+        raise ValueError(f'Invalid argument provided: {money_format}')
@@ -0,0 +1,128 @@
+from decimal import Decimal, ROUND_HALF_EVEN
+from . import instrumentation
+from .currency import get_format
+from .formatters import Numeric
+
+
+class FixedPoint(Numeric):
+    """ Numeric storing its value as an integer number of 10 ** -scale units
+
+    The default scale of 2 stores integer cents. Subclass and set scale to
+    use a different fixed precision.
+
+    Rounding policy:
+        - values are quantized to the scale on construction, ties rounding
+          half to even (e.g. 15.125 -> 15.12, 15.135 -> 15.14)
+        - multiplying by an integer is exact
+        - dividing by an integer rounds the exact quotient half to even to
+          the nearest unit, e.g. 31200.00 / 2080 -> 15.00 and
+          22500.00 / 260 -> 86.54 (86.538461...)
+
+    Salary converts every period from the exact yearly amount, so rounding
+    is applied once per conversion and never compounds.
+    """
+
+    __slots__ = ('_units',)
+
+    scale = 2
+
+    @classmethod
+    def from_units(cls, units):
+        """ Build directly from an integer number of units, e.g. cents """
+        if instrumentation.enabled:
+            instrumentation.record('numeric.init')
+        obj = cls.__new__(cls)
+        obj._units = units
+        obj._dollars = None
+        return obj
+
+    def __repr__(self):
+        return f'{type(self).__name__}({repr(self.decimal)})'
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return self.from_units(self._units * other)
+        return type(self)(self.value * other)
+
+    def __truediv__(self, other):
+        if isinstance(other, int):
+            return self.from_units(_divide_half_even(self._units, other))
+        return type(self)(self.value / other)
+
+    @property
+    def units(self):
+        """ Value as an integer number of 10 ** -scale units (int) """
+        return self._units
+
+    @property
+    def value(self):
+        return Decimal(self._units).scaleb(-self.scale)
+
+    @value.setter
+    def value(self, value):
+        value = Decimal(value)
+        if not value.is_finite():
+            raise ValueError(f'Value not numeric: {value}')
+        self._units = int(value.scaleb(self.scale).to_integral_value(rounding=ROUND_HALF_EVEN))
+        self._dollars = None
+
+    @property
+    def dollars(self):
+        money_format = self.money_format
+        if self._dollars is None or self._dollars[0] is not money_format:
+            self._dollars = (money_format, money_format.format_units(self._units, self.scale))
+        return self._dollars[1]
+
+    def format_money(self, money_format=None):
+        if money_format is None or money_format is self.money_format:
+            return self.dollars
+        return get_format(money_format).format_units(self._units, self.scale)
+
+    def summarize(self, calendar, period, money_format=None):
+        """ to_dict() of the value per period converted to every period of calendar
+
+        Parameters:
+            calendar: required: yearly occurrences to convert with (PayCalendar)
+            period: required: the period of the value (str)
+            money_format: optional: format of dollars (MoneyFormat/str) (default: money_format)
+
+        Equal to converting through the yearly amount with * and / (exact
+        multiply, one half to even division per period), but computed on
+        integers in one pass without building a FixedPoint per period.
+        """
+        yearly = self._units * calendar[period]
+        format_units = (self.money_format if money_format is None else get_format(money_format)).format_units
+        scale = self.scale
+        factor = 10 ** scale
+        summary = {}
+        for target, times in zip(calendar.periods, calendar.times):
+            quotient, remainder = divmod(yearly, times)
+            twice = remainder * 2
+            if twice > times or (twice == times and quotient % 2 == 1):
+                quotient += 1
+            summary[target] = {'dollars': format_units(quotient, scale), 'float': quotient / factor}
+        return summary
+
+    @property
+    def float(self):
+        return self._units / 10 ** self.scale
+
+    @property
+    def int(self):
+        units = 10 ** self.scale
+        return self._units // units if self._units >= 0 else -(-self._units // units)
+
+    @property
+    def decimal(self):
+        return self.value
+
+
+def _divide_half_even(numerator, denominator):
+    """ Integer division rounding the exact quotient half to even """
+    quotient, remainder = divmod(numerator, denominator)
+    twice = remainder * 2
+    if denominator < 0:
+        twice, denominator = -twice, -denominator
+    if twice > denominator or (twice == denominator and quotient % 2 == 1):
+        quotient += 1
+    return quotient
@@ -1,19 +1,46 @@
-import json
 from decimal import Decimal, InvalidOperation
+from . import instrumentation
+from .currency import default_format, get_format
+
+
+_json_encoder = None
+
+
+def json_encoder():
+    """ Shared json.JSONEncoder, json is only imported on first use """
+    global _json_encoder
+    if _json_encoder is None:
+        import json
+        _json_encoder = json.JSONEncoder()
+    return _json_encoder
 
 
 class Numeric:
     """ Object to store and convert a numeric value to various other formats
+
+    The dollars format is computed on first access and cached, along with
+    the format used, until value is reassigned. It uses the money_format
+    class attribute (a wage.currency.MoneyFormat, US dollars by default),
+    e.g. Numeric.money_format = get_format('de_DE'); to_dict, serialize and
+    format_money also take a format per call.
     """
 
+    __slots__ = ('_value', '_dollars')
+
+    money_format = default_format
+
     def __init__(self, value):
+        if instrumentation.enabled:
+            instrumentation.record('numeric.init')
         if isinstance(value, Numeric):
-            self.value = Decimal(value.decimal)
+            self.value = value.value
         else:
             try:
                 self.value = Decimal(value)
             except (InvalidOperation):
-                raise ValueError(f'Value not numeric: {value}')
+                # Money strings, e.g. '$12,345.00', parsed with the class money format
+                from .parsing import parse_decimal
+                self.value = parse_decimal(value, self.money_format)
 
     def __repr__(self):
         return f'Numeric({repr(self.decimal)})'
@@ -21,9 +48,18 @@ class Numeric:
     def __str__(self):
         return f'{self.decimal}'
 
+    def __mul__(self, other):
+        return type(self)(self.value * other)
+
+    def __truediv__(self, other):
+        return type(self)(self.value / other)
+
     def __iter__(self):
-        for k, v in self.__dict__.items():
-            yield k, v
+        yield 'value', self.value
+        yield 'dollars', self.dollars
+        yield 'float', self.float
+        yield 'int', self.int
+        yield 'decimal', self.decimal
 
     @property
     def __dict__(self):
@@ -40,18 +76,62 @@ class Numeric:
         """ Convert number value to Dollars, e.g.: 12345 -> "$12,345.00" """
         return f'${value:,.2f}'
 
-    def serialize(self):
-        obj = self.__dict__
-        del(obj['value'], obj['int'], obj['decimal'])
-        return json.dumps(obj)
+    @classmethod
+    def format_dollars_many(cls, values):
+        """ Convert a sequence or array of number values to a list of Dollars strings,
+        see MoneyFormat.format_many
+        """
+        return cls.money_format.format_many(values)
+
+    def format_money(self, money_format=None):
+        """ Value formatted with a MoneyFormat or registered format name, see wage.currency
+
+        Parameters:
+            money_format: optional: format to use (MoneyFormat/str) (default: money_format)
+        """
+        if money_format is None or money_format is self.money_format:
+            return self.dollars
+        return get_format(money_format).format(self._value)
+
+    def to_dict(self, money_format=None):
+        """ Serializable dictionary representation (dollars and float)
+
+        Parameters:
+            money_format: optional: format of dollars (MoneyFormat/str) (default: money_format)
+        """
+        if money_format is None:
+            return {'dollars': self.dollars, 'float': self.float}
+        return {'dollars': self.format_money(money_format), 'float': self.float}
+
+    def serialize(self, money_format=None):
+        """ Serialize to json, see to_dict """
+        if not instrumentation.enabled:
+            return json_encoder().encode(self.to_dict(money_format))
+        start = instrumentation.clock()
+        out = json_encoder().encode(self.to_dict(money_format))
+        instrumentation.record('numeric.serialize', instrumentation.clock() - start, len(out))
+        return out
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._dollars = None
 
     @property
     def dollars(self):
-        return self.format_dollars(self.value)
+        money_format = self.money_format
+        if self._dollars is None or self._dollars[0] is not money_format:
+            # Formatted again when the class money format was changed since
+            self._dollars = (money_format, money_format.format(self._value))
+        return self._dollars[1]
 
     @property
     def float(self):
-        return float(self.value)
+        return float(self._value)
 
     @property
     def int(self):
@@ -59,4 +139,4 @@ class Numeric:
 
     @property
     def decimal(self):
-        return Decimal(self.value)
+        return self._value
@@ -0,0 +1,118 @@
+""" Opt-in counters and timers for the conversion and serialization hot paths
+
+Instrumentation is disabled by default. Hooks only check the module level
+`enabled` flag, so nothing is counted, timed or allocated until it is
+switched on, either globally:
+
+    from wage import instrumentation
+    instrumentation.enable()
+    ...
+    instrumentation.snapshot()
+
+or for a block of code:
+
+    with instrumentation.profile() as stats:
+        ...
+    stats.snapshot()
+
+Recorded names:
+    numeric.init: Numeric constructions (count)
+    salary.per_period.<period>: Salary.per_period calls (count, seconds)
+    salary.serialize, salary.serialize_by_period, ...: serialize calls
+        (count, seconds, bytes produced)
+    numeric.serialize: Numeric.serialize calls (count, seconds, bytes)
+    interface.salary_report: report renders (count, seconds, bytes)
+"""
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+enabled = False
+
+clock = perf_counter
+
+
+class Stats:
+    """ Thread safe count, elapsed seconds and bytes per recorded name """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def record(self, name, seconds=0.0, size=0):
+        """ Add one occurrence of name
+
+        Parameters:
+            name: required: what happened (str)
+            seconds: optional: time it took (float)
+            size: optional: bytes it produced (int)
+        """
+        with self._lock:
+            entry = self._records.get(name)
+            if entry is None:
+                entry = self._records[name] = [0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] += size
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+    def snapshot(self):
+        """ Dictionary of {name: {'count', 'seconds', 'bytes'}} """
+        with self._lock:
+            return {name: {'count': count, 'seconds': seconds, 'bytes': size}
+                    for name, (count, seconds, size) in sorted(self._records.items())}
+
+    def to_json(self):
+        import json
+        return json.dumps(self.snapshot())
+
+
+stats = Stats()
+
+
+def record(name, seconds=0.0, size=0):
+    """ Record one occurrence of name in the global stats, see Stats.record """
+    stats.record(name, seconds, size)
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+def reset():
+    stats.reset()
+
+
+def snapshot():
+    return stats.snapshot()
+
+
+def to_json():
+    return stats.to_json()
+
+
+@contextmanager
+def profile(reset=True):
+    """ Enable instrumentation for the duration of a with block
+
+    Parameters:
+        reset: optional: clear previously recorded stats first (bool)
+    """
+    global enabled
+    previous = enabled
+    if reset:
+        stats.reset()
+    enabled = True
+    try:
+        yield stats
+    finally:
+        enabled = previous
@@ -1,27 +1,42 @@
 import sys
 from .salary import Salary
+from . import instrumentation
 
 
-def salary_report(salary):
-    periods = [
-        'hourly',
-        'daily',
-        'weekly',
-        'fortnightly',
-        'monthly',
-        'quarterly',
-        'semesterly',
-        'yearly'
-    ]
-
-    out_str = ""
-    for period in periods:
-        amount = getattr(salary, period)
-        out_str += f'{period.title():15}: {amount.dollars}\n'
+_report_labels = tuple(f'{period.title():15}: ' for period in (
+    'hourly',
+    'daily',
+    'weekly',
+    'fortnightly',
+    'monthly',
+    'quarterly',
+    'semesterly',
+    'yearly'
+))
+
+
+def salary_report(salary, money_format=None):
+    """ Text report of every period's amount, formatted with money_format
+    (MoneyFormat or registered name, see wage.currency) (default: Numeric.money_format)
+    """
+    start = instrumentation.clock() if instrumentation.enabled else None
+    out_str = ''.join(f'{label}{amount.format_money(money_format)}\n' for label, amount in zip(_report_labels, (
+        salary.hourly,
+        salary.daily,
+        salary.weekly,
+        salary.fortnightly,
+        salary.monthly,
+        salary.quarterly,
+        salary.semesterly,
+        salary.yearly
+    )))
+    if start is not None:
+        instrumentation.record('interface.salary_report', instrumentation.clock() - start, len(out_str))
     return out_str
 
 
-def main(args=sys.argv[1:]):
+def parse_args(args):
+    """ Split arguments into positional arguments and key=value keyword arguments """
     salary_args = []
     salary_kwargs = {}
     for arg in args:
@@ -31,8 +46,201 @@ def main(args=sys.argv[1:]):
             k = arg.split('=')[0]
             v = arg.split('=')[1]
             salary_kwargs[k] = v
-    salary = Salary(*salary_args, **salary_kwargs)
-    print(salary_report(salary))
+    return salary_args, salary_kwargs
+
+
+def build_salary(args):
+    """ Build a Salary from command line style arguments, e.g. ['15', 'hour', 'hours=1500'] """
+    salary_args, salary_kwargs = parse_args(args)
+    return Salary(*salary_args, **salary_kwargs)
+
+
+def report_skipped(number, row, err):
+    """ Print a row skipped with errors=skip to stderr """
+    from .streaming import error_message
+    print(f'Skipped row {number}: {error_message(err)}', file=sys.stderr)
+
+
+def stdio(args, stdin=None, stdout=None):
+    """ Answer one conversion request per input line until end of input
+
+    Usage:
+        wage --stdio [format=json|report]
+
+    Each input line holds the same arguments as a single wage invocation,
+    e.g. "15 hour hours=1500". The json format (default) writes one line of
+    Salary.serialize() output, or {"error": "..."}, per request. The report
+    format writes the salary report followed by an empty line. Output is
+    flushed after every response.
+    """
+    import json
+    import shlex
+    from .streaming import error_message
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    _, stdio_kwargs = parse_args(args)
+    fmt = stdio_kwargs.get('format', 'json')
+    if fmt not in ('json', 'report'):
+        raise ValueError(f'Invalid argument provided: {fmt}')
+    for line in stdin:
+        try:
+            salary = build_salary(shlex.split(line))
+            response = salary.serialize() if fmt == 'json' else salary_report(salary)
+        except (ArithmeticError, IndexError, TypeError, ValueError) as err:
+            message = error_message(err)
+            response = json.dumps({'error': message}) if fmt == 'json' else f'Error: {message}\n'
+        stdout.write(response)
+        stdout.write('\n')
+        stdout.flush()
+
+
+def batch(args):
+    """ Convert salary rows read from a file or stdin, writing rows to stdout
+
+    Usage:
+        wage batch [path|-] [format=csv|jsonl] [output=csv|jsonl] [errors=raise|skip]
+                   [workers=N] [chunk_size=BYTES]
+
+    Passing workers converts a file (not stdin) across N worker processes.
+    """
+    from . import parallel, streaming
+    batch_args, batch_kwargs = parse_args(args)
+    path = batch_args[0] if batch_args else '-'
+    fmt = batch_kwargs.get('format', 'csv' if path == '-' else streaming.guess_format(path))
+    output = batch_kwargs.get('output', 'csv')
+    errors = batch_kwargs.get('errors', 'raise')
+
+    if 'workers' in batch_kwargs:
+        if path == '-':
+            raise ValueError('workers requires an input file path')
+        parallel.convert_file(
+            path, sys.stdout, fmt, output,
+            workers=int(batch_kwargs['workers']),
+            chunk_size=int(batch_kwargs.get('chunk_size', parallel.default_chunk_size)),
+            errors=errors,
+            on_error=report_skipped)
+        return
+
+    fp = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        rows = streaming.read_rows(fp, fmt)
+        converted = streaming.convert_rows(rows, errors=errors, on_error=report_skipped)
+        streaming.write_rows(converted, sys.stdout, output)
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+
+def report(args):
+    """ Write a report of salary rows read from a file or stdin to stdout
+
+    Usage:
+        wage report [path|-] [format=csv|jsonl] [output=table|markdown|csv|text] [label=FIELD] [locale=NAME]
+
+    label names an input field (e.g. name) shown in the first column.
+    """
+    from itertools import tee
+    from . import report as reports, streaming
+    report_args, report_kwargs = parse_args(args)
+    path = report_args[0] if report_args else '-'
+    fmt = report_kwargs.get('format', 'csv' if path == '-' else streaming.guess_format(path))
+    output = report_kwargs.get('output', 'table')
+    fp = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        rows = streaming.read_rows(fp, fmt)
+        labels = None
+        if 'label' in report_kwargs:
+            rows, label_rows = tee(rows)
+            labels = (streaming.row_dict(row).get(report_kwargs['label'], '') for row in label_rows)
+        salaries = (streaming.row_salary(row) for row in rows)
+        reports.render(salaries, sys.stdout, output, labels, money_format=report_kwargs.get('locale'))
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+
+def stats(args):
+    """ Print per period statistics of salary rows read from a file or stdin as json
+
+    Usage:
+        wage stats [path|-] [format=csv|jsonl] [errors=raise|skip] [percentiles=50,90,99]
+    """
+    import json
+    from . import aggregate, streaming
+    stats_args, stats_kwargs = parse_args(args)
+    path = stats_args[0] if stats_args else '-'
+    fmt = stats_kwargs.get('format', 'csv' if path == '-' else streaming.guess_format(path))
+    try:
+        percentiles = [float(p) for p in stats_kwargs.get('percentiles', '50,90,99').split(',')]
+        if not all(0 <= p <= 100 for p in percentiles):
+            raise ValueError
+    except ValueError:
+        raise ValueError(f"Invalid argument provided: {stats_kwargs['percentiles']}")
+
+    fp = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        population = aggregate.PopulationStats()
+        population.update(streaming.read_rows(fp, fmt), stats_kwargs.get('errors', 'raise'), report_skipped)
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+    print(json.dumps(population.to_dict(percentiles), indent=2))
+
+
+def pack(args):
+    """ Write salary rows read from a file or stdin to a columnar file
+
+    Usage:
+        wage pack [path|-] output.wagec [format=csv|jsonl] [errors=raise|skip]
+    """
+    from . import columnar, streaming
+    pack_args, pack_kwargs = parse_args(args)
+    if not pack_args:
+        raise ValueError('pack requires an output file path')
+    path = pack_args[0] if len(pack_args) > 1 else '-'
+    fmt = pack_kwargs.get('format', 'csv' if path == '-' else streaming.guess_format(path))
+
+    fp = sys.stdin if path == '-' else open(path, newline='')
+    try:
+        with columnar.ColumnarWriter(pack_args[-1]) as writer:
+            writer.write_rows(streaming.read_rows(fp, fmt), pack_kwargs.get('errors', 'raise'), report_skipped)
+    finally:
+        if fp is not sys.stdin:
+            fp.close()
+
+
+def serve(args):
+    """ Run the local HTTP/JSON conversion service
+
+    Usage:
+        wage serve [host=127.0.0.1] [port=8080] [workers=N] [executor=process|thread]
+    """
+    from . import server
+    _, serve_kwargs = parse_args(args)
+    print(f"Serving on http://{serve_kwargs.get('host', '127.0.0.1')}:{serve_kwargs.get('port', 8080)}",
+          file=sys.stderr)
+    server.serve(
+        host=serve_kwargs.get('host', '127.0.0.1'),
+        port=int(serve_kwargs.get('port', 8080)),
+        workers=int(serve_kwargs['workers']) if 'workers' in serve_kwargs else None,
+        executor=serve_kwargs.get('executor', 'process'))
+
+
+def main(args=sys.argv[1:]):
+    if args and args[0] == 'batch':
+        return batch(args[1:])
+    if args and args[0] == 'report':
+        return report(args[1:])
+    if args and args[0] == 'stats':
+        return stats(args[1:])
+    if args and args[0] == 'pack':
+        return pack(args[1:])
+    if args and args[0] == 'serve':
+        return serve(args[1:])
+    if args and args[0] == '--stdio':
+        return stdio(args[1:])
+    _, kwargs = parse_args(args)
+    print(salary_report(build_salary(args), kwargs.get('locale')))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,139 @@
+import csv
+import io
+import itertools
+import locale
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from . import streaming
+
+default_chunk_size = 8 * 1024 * 1024
+
+
+def _record_end(fp, quoted):
+    """ Read up to the end of the current record, returning whether a quoted field is still open
+
+    A line break only ends a csv record outside quoted fields, i.e. after an
+    even number of quote characters, as escaped quotes ("") come in pairs.
+    """
+    while True:
+        line = fp.readline()
+        quoted ^= line.count(b'"') % 2 == 1
+        if not quoted or not line:
+            return quoted
+
+
+def chunk_ranges(path, chunk_size=default_chunk_size, start=0, fmt='csv'):
+    """ Split a file into (start, end) byte ranges that begin on record boundaries
+
+    Parameters:
+        path: required: the file to split (str)
+        chunk_size: optional: approximate bytes per range (int)
+        start: optional: byte offset of the first range, on a record boundary (int)
+        fmt: optional: input format (str) valid options: [csv|jsonl]
+
+    csv files are read through once to keep quoted fields spanning several
+    lines within one range.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as fp:
+        while start < size:
+            if fmt == 'csv':
+                fp.seek(start)
+                quoted = fp.read(chunk_size).count(b'"') % 2 == 1
+            else:
+                fp.seek(min(start + chunk_size, size))
+                quoted = False
+            if fp.tell() < size:
+                _record_end(fp, quoted)
+            end = fp.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def convert_range(path, start, end, fmt='csv', output='csv', fieldnames=None, errors='raise', encoding=None):
+    """ Convert the rows in one byte range of a file (runs in a worker process)
+
+    Returns a tuple of the converted output text, a list of (row number,
+    row, error message) for invalid rows and the number of rows read. Row
+    numbers count from 1 within the range. With errors='raise', conversion
+    stops at the first invalid row.
+    """
+    with open(path, 'rb') as fp:
+        fp.seek(start)
+        text = io.StringIO(fp.read(end - start).decode(encoding or locale.getpreferredencoding(False)), newline='')
+    if fmt == 'csv':
+        rows = csv.DictReader(text, fieldnames=fieldnames)
+    else:
+        rows = streaming.read_rows(text, fmt)
+    rows = list(rows)
+    invalid = []
+
+    def collect_error(number, row, err):
+        invalid.append((number, row, streaming.error_message(err)))
+
+    out = io.StringIO()
+    converted = streaming.convert_rows(rows, errors='skip', on_error=collect_error)
+    if errors == 'raise':
+        converted = itertools.takewhile(lambda row: not invalid, converted)
+    streaming.write_rows(converted, out, output, header=False)
+    return out.getvalue(), invalid, len(rows)
+
+
+def convert_file(path, fp, fmt='csv', output='csv', workers=None, chunk_size=default_chunk_size,
+                 errors='raise', on_error=None, encoding=None):
+    """ Convert a salary file across a process pool, writing output in input order
+
+    Parameters:
+        path: required: the file to convert (str)
+        fp: required: text file object to write to (file)
+        fmt: optional: input format (str) valid options: [csv|jsonl]
+        output: optional: output format (str) valid options: [csv|jsonl]
+        workers: optional: worker processes (int) (default: os.cpu_count())
+        chunk_size: optional: approximate bytes per chunk of work (int)
+        errors: optional: what to do with invalid rows (str) valid options: [raise|skip]
+        on_error: optional: called with (row number, row, error message) for skipped rows (function)
+        encoding: optional: text encoding of the file, ASCII compatible (str) (default: as open())
+
+    Row numbers count rows across the whole file, as streaming.convert_rows does.
+    """
+    if errors not in ('raise', 'skip'):
+        raise ValueError(f'Invalid argument provided: {errors}')
+    encoding = encoding or locale.getpreferredencoding(False)
+    fieldnames = None
+    start = 0
+    if fmt == 'csv':
+        with open(path, 'rb') as header:
+            _record_end(header, False)
+            start = header.tell()
+            header.seek(0)
+            first = header.read(start).decode(encoding)
+        fieldnames = next(csv.reader(io.StringIO(first, newline='')))
+    streaming.write_rows([], fp, output)
+
+    workers = workers or os.cpu_count() or 1
+    rows_before = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        window = workers * 2
+        pending = deque()
+        for range_start, range_end in chunk_ranges(path, chunk_size, start, fmt):
+            pending.append(executor.submit(
+                convert_range, path, range_start, range_end, fmt, output, fieldnames, errors, encoding))
+            if len(pending) >= window:
+                rows_before = _write_result(pending.popleft().result(), fp, errors, on_error, rows_before)
+        while pending:
+            rows_before = _write_result(pending.popleft().result(), fp, errors, on_error, rows_before)
+
+
+def _write_result(result, fp, errors, on_error, rows_before):
+    """ Write one range's output and report its invalid rows, returning the rows read so far """
+    text, invalid, count = result
+    fp.write(text)
+    for number, row, message in invalid:
+        if errors == 'raise':
+            raise ValueError(f'Invalid row {rows_before + number}: {message}')
+        if on_error is not None:
+            on_error(rows_before + number, row, message)
+    return rows_before + count
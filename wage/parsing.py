@@ -0,0 +1,203 @@
+""" Bulk parsing of raw amounts into fixed-point values
+
+Accepts ints, floats, Decimals, Numerics, plain number strings and money
+strings such as "$12,345.00", "-$1.50", "1.234,50 €" (with a matching
+MoneyFormat) or accounting style negatives like "(1,234.00)".
+
+parse_amounts converts a whole column at once and reports invalid values
+per row instead of raising, so one bad row doesn't abort the batch:
+
+    units, errors = parse_amounts(['15', '$12,345.00', 'n/a'])
+    # units == [1500, 1234500, None]
+    # errors == [(2, 'n/a', 'Value not numeric: n/a')]
+"""
+import math
+import numbers
+import re
+from decimal import Context, Decimal, InvalidOperation, ROUND_HALF_EVEN
+from .currency import default_format, get_format
+
+# Currency symbols recognized besides the money format's own, and ISO codes (e.g. USD)
+_symbols = '$£€¥₹₩₽¢'
+
+# Units are bounded to 38 digits, the precision of the widest common database
+# decimal columns, instead of growing into arbitrarily large ints, and are
+# rounded in a context precise enough for them whatever the current one
+max_digits = 38
+_max_units = 10 ** max_digits
+_context = Context(prec=max_digits, rounding=ROUND_HALF_EVEN)
+_quanta = {}
+
+_patterns = {}
+
+_non_digits = re.compile(r'\D')
+
+# Spaces, including the no-break and thin spaces used by formatted amounts
+_space = r'[\s\u00a0\u2009\u202f]'
+
+
+def _pattern(money_format):
+    """ Compiled amount expression for a money format's separators, built once per format """
+    key = (money_format.group, money_format.point, money_format.symbol)
+    try:
+        return _patterns[key]
+    except KeyError:
+        pass
+    group, point = money_format.group, money_format.point
+    symbol = '(?:[A-Z]{3}|[' + re.escape(_symbols) + ']|' + re.escape(money_format.symbol) + ')'
+    # Any whitespace is accepted where the format groups digits with a space
+    separator = _space if group.isspace() else re.escape(group)
+    whole = r'\d+' if not group else r'\d{1,3}(?:' + separator + r'\d{3})+|\d+'
+    space = _space + '*'
+    pattern = re.compile(
+        space + r'(?P<open>\()?' + space + r'(?P<sign>[-+])?' + space + symbol + '?' + space
+        + r'(?P<sign2>[-+])?' + space + r'(?P<whole>' + whole + r')?(?:' + re.escape(point) + r'(?P<fraction>\d*))?'
+        + space + symbol + '?' + space + r'(?P<close>\))?' + space, re.ASCII)
+    return _patterns.setdefault(key, pattern)
+
+
+def _split(text, money_format):
+    """ (negative, whole digits, fraction digits) of a money string, or None when invalid """
+    match = _pattern(money_format).fullmatch(text)
+    if match is None:
+        return None
+    open_, sign, sign2, whole, fraction, close = match.group('open', 'sign', 'sign2', 'whole', 'fraction', 'close')
+    if (whole is None and not fraction) or (open_ is None) != (close is None) or (sign and sign2):
+        return None
+    if money_format.group:
+        whole = _non_digits.sub('', whole) if whole else '0'
+    return (open_ is not None) != ((sign or sign2) == '-'), whole or '0', fraction or ''
+
+
+def parse_decimal(value, money_format=None):
+    """ Exact Decimal of a number or money string
+
+    Parameters:
+        value: required: amount to parse (str/number)
+        money_format: optional: separators to expect (MoneyFormat/str) (default: en_US)
+    """
+    if isinstance(value, str):
+        parts = _split(value, get_format(money_format or default_format))
+        if parts is not None:
+            negative, whole, fraction = parts
+            return Decimal(f'{"-" if negative else ""}{whole}.{fraction or "0"}')
+    elif isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        value = Decimal(value)
+        if value.is_finite():
+            return value
+    raise ValueError(f'Value not numeric: {value}')
+
+
+def _units(value, scale, money_format, factor):
+    """ Integer 10 ** -scale units of value, or None when invalid """
+    kind = type(value)
+    if kind is int:
+        return _bounded(value * factor)
+    if kind is str:
+        return _string_units(value, scale, money_format, factor)
+    if kind is float:
+        if not math.isfinite(value):
+            return None
+        value = Decimal(value)
+    elif kind is not Decimal:
+        return _other_units(value, scale, factor)
+    return _round(value, scale)
+
+
+def _other_units(value, scale, factor):
+    """ Integer 10 ** -scale units of other numbers (e.g. NumPy scalars) and Numerics, or None when invalid """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, numbers.Integral):
+        return _bounded(int(value) * factor)
+    if isinstance(value, numbers.Real):
+        value = float(value)
+        return _round(Decimal(value), scale) if math.isfinite(value) else None
+    units = getattr(value, 'units', None)
+    if units is not None and getattr(value, 'scale', None) == scale:
+        return _bounded(units)
+    value = getattr(value, 'value', None)
+    if not isinstance(value, Decimal):
+        return None
+    return _round(value, scale)
+
+
+def _string_units(text, scale, money_format, factor):
+    """ Integer 10 ** -scale units of a number or money string, or None when invalid """
+    if money_format.point == '.':
+        # Plain number strings are parsed fastest by Decimal itself
+        try:
+            return _round(Decimal(text), scale)
+        except ArithmeticError:
+            pass
+    parts = _split(text, money_format)
+    if parts is None:
+        return None
+    negative, whole, fraction = parts
+    if len(whole) > max_digits:
+        return None
+    if len(fraction) <= scale:
+        units = int(whole) * factor + (int(fraction.ljust(scale, '0')) if scale else 0)
+    else:
+        units = _round(Decimal(f'{whole}.{fraction}'), scale)
+    return -units if negative else units
+
+
+def _bounded(units):
+    """ units, or None when beyond max_digits digits """
+    return units if -_max_units < units < _max_units else None
+
+
+def _round(value, scale):
+    """ Decimal value rounded half to even to integer 10 ** -scale units, or None
+    when not finite or beyond max_digits digits
+    """
+    if not value.is_finite() or (value and value.adjusted() + scale >= max_digits):
+        return None
+    try:
+        quantum = _quanta[scale]
+    except KeyError:
+        quantum = _quanta[scale] = Decimal(1).scaleb(-scale)
+    try:
+        return int(value.quantize(quantum, context=_context).scaleb(scale, _context))
+    except ArithmeticError:
+        return None
+
+
+def parse_amounts(values, scale=2, money_format=None):
+    """ Parse a column of raw amounts into integer 10 ** -scale units, e.g. cents
+
+    Parameters:
+        values: required: raw amounts (iterable/ndarray of str/int/float/Decimal/Numeric)
+        scale: optional: decimal places kept, rounding half to even (int)
+        money_format: optional: separators of money strings (MoneyFormat/str) (default: en_US)
+
+    Returns (units, errors): units holds one int per value, None where the
+    value is invalid, and errors one (index, value, message) per invalid
+    value. Values of max_digits (38) digits of units or more are invalid.
+    """
+    money_format = get_format(money_format or default_format)
+    factor = 10 ** scale
+    if hasattr(values, 'tolist'):
+        # One conversion to native numbers instead of a NumPy scalar per value
+        values = values.tolist()
+    units = []
+    errors = []
+    append = units.append
+    for index, value in enumerate(values):
+        result = _units(value, scale, money_format, factor)
+        if result is None:
+            errors.append((index, value, f'Value not numeric: {value}'))
+        append(result)
+    return units, errors
+
+
+def parse_amount(value, scale=2, money_format=None):
+    """ Parse one raw amount into integer 10 ** -scale units, see parse_amounts
+
+    Raises ValueError when the value is invalid.
+    """
+    result = _units(value, scale, get_format(money_format or default_format), 10 ** scale)
+    if result is None:
+        raise ValueError(f'Value not numeric: {value}')
+    return result
@@ -0,0 +1,143 @@
+from decimal import Decimal
+
+
+class PayCalendar:
+    """ Immutable, interned set of yearly occurrences for each pay period
+
+    Calendars with equal values are the same object, so any number of
+    salaries sharing a calendar share one instance and its precomputed
+    period to period conversion ratios.
+    """
+
+    __slots__ = ('times', '_ratios', '_float_ratios', '_index')
+
+    _period_yearly_defaults = {
+        'hour': 2080,
+        'day': 260,
+        'week': 52,
+        'fortnight': 26,
+        'month': 12,
+        'quarter': 4,
+        'semester': 2,
+        'year': 1,
+    }
+
+    periods = tuple(_period_yearly_defaults)
+
+    _instances = {}
+
+    def __new__(cls, **kwargs):
+        """ PayCalendar initialization
+
+        Keyword arguments:
+            kwargs['hours']: hours in year (int) (default: 2080)
+            kwargs['days']: days in year (int) (default: 260)
+            kwargs['weeks']: weeks in year (int) (default: 52)
+            kwargs['fortnights']: fortnights in year (int) (default: 26)
+            kwargs['months']: months in year (int) (default: 12)
+            kwargs['quarters']: quarters in year (int) (default: 4)
+            kwargs['semesters']: semesters in year (int) (default: 2)
+            kwargs['years']: years in year (int) (default: 1)
+
+        Examples:
+            PayCalendar()
+            PayCalendar(hours=1500)
+            PayCalendar(hours=1500) is PayCalendar(hours='1500')  # True
+        """
+        times = list(cls._period_yearly_defaults.values())
+        for k, v in kwargs.items():
+            if k[:-1] not in cls._period_yearly_defaults:
+                raise TypeError(f'Invalid argument provided: {k}')
+            times[cls.periods.index(k[:-1])] = int(v)
+        return cls.from_times(times)
+
+    @classmethod
+    def from_times(cls, times):
+        """ Interned calendar for yearly occurrences listed in period order """
+        times = tuple(times)
+        try:
+            return cls._instances[times]
+        except KeyError:
+            pass
+        if len(times) != len(cls.periods) or not all(isinstance(t, int) and t > 0 for t in times):
+            raise ValueError(f'Invalid yearly occurrences: {times}')
+        obj = object.__new__(cls)
+        object.__setattr__(obj, 'times', times)
+        object.__setattr__(obj, '_index', dict(zip(cls.periods, times)))
+        object.__setattr__(obj, '_ratios', None)
+        object.__setattr__(obj, '_float_ratios', None)
+        return cls._instances.setdefault(times, obj)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        return (type(self).from_times, (self.times,))
+
+    def __repr__(self):
+        out_str = 'PayCalendar('
+        out_str += ', '.join(f'{period}s={times}' for period, times in self._index.items()
+                             if times != self._period_yearly_defaults[period])
+        out_str += ')'
+        return out_str
+
+    def __getitem__(self, period):
+        """ Yearly occurrences of period (int) """
+        return self._index[period]
+
+    def replace(self, **kwargs):
+        """ Interned calendar with the given yearly occurrences changed """
+        current = {f'{period}s': times for period, times in self._index.items()}
+        current.update(kwargs)
+        return type(self)(**current)
+
+    def changed_periods(self, other):
+        """ Periods whose yearly occurrences differ from other (list of str) """
+        if other is self:
+            return []
+        return [period for period, times, other_times in zip(self.periods, self.times, other.times)
+                if times != other_times]
+
+    @property
+    def times_per_year(self):
+        """ Dictionary representation of times per year """
+        return dict(self._index)
+
+    @property
+    def ratios(self):
+        """ Period to period conversion matrix (tuple of tuples of Decimal)
+
+        ratios[i][j] converts an amount per periods[i] to an amount per
+        periods[j] with a single multiplication.
+        """
+        if self._ratios is None:
+            object.__setattr__(self, '_ratios', tuple(
+                tuple(Decimal(source) / Decimal(target) for target in self.times) for source in self.times))
+        return self._ratios
+
+    @property
+    def float_ratios(self):
+        """ Period to period conversion matrix as floats, see ratios """
+        if self._float_ratios is None:
+            object.__setattr__(self, '_float_ratios', tuple(
+                tuple(source / target for target in self.times) for source in self.times))
+        return self._float_ratios
+
+    def ratio(self, source, target):
+        """ Conversion ratio from an amount per source period to per target period (Decimal)
+
+        Parameters:
+            source: required: the period converted from (str)
+            target: required: the period converted to (str)
+        """
+        return self.ratios[self.periods.index(source)][self.periods.index(target)]
+
+    def convert(self, amount, source, target):
+        """ Convert amount per source period to amount per target period
+
+        Parameters:
+            amount: required: the amount to convert (Decimal/Numeric)
+            source: required: the period converted from (str)
+            target: required: the period converted to (str)
+        """
+        return amount * self.ratio(source, target)
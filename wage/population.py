@@ -0,0 +1,100 @@
+""" What-if modelling of calendar changes across a population of salaries
+
+Each Salary caches its conversions and knows which of them depend on which
+yearly occurrences: the yearly amount depends on the occurrences of the
+salary's own period, and every other conversion on the yearly amount and
+its target period. Population applies a calendar change to every salary in
+place, so only dependent conversions are recomputed, e.g. changing hours
+recomputes every conversion of hour based salaries but only the hourly
+amount of the others, and no Salary is rebuilt.
+
+Example:
+    population = Population(salaries)
+    with population.scenario(hours=1950):
+        population.per_period('yearly')
+"""
+from contextlib import contextmanager
+from .streaming import period_fields
+
+
+class Population:
+    """ Collection of salaries sharing calendar what-if scenarios """
+
+    def __init__(self, salaries=()):
+        """ Population initialization
+
+        Arguments:
+            salaries: optional: salaries to model (iterable of Salary)
+        """
+        self.salaries = list(salaries)
+
+    def __len__(self):
+        return len(self.salaries)
+
+    def __iter__(self):
+        return iter(self.salaries)
+
+    def __getitem__(self, index):
+        return self.salaries[index]
+
+    def __repr__(self):
+        return f'Population(<{len(self)} salaries>)'
+
+    def append(self, salary):
+        self.salaries.append(salary)
+
+    def extend(self, salaries):
+        self.salaries.extend(salaries)
+
+    @property
+    def calendars(self):
+        """ Calendar of every salary, in order (list of PayCalendar) """
+        return [salary.calendar for salary in self.salaries]
+
+    @calendars.setter
+    def calendars(self, calendars):
+        for salary, calendar in zip(self.salaries, calendars):
+            salary.calendar = calendar
+
+    def set_calendar(self, **kwargs):
+        """ Change yearly occurrences of every salary in place
+
+        Keyword arguments:
+            Same as PayCalendar (hours, days, weeks, ...)
+
+        Each distinct calendar in the population is replaced once and only
+        conversions depending on the changed periods are recomputed, on next
+        access. Returns the number of salaries whose yearly amount changed.
+        """
+        replaced = {}
+        rebased = 0
+        for salary in self.salaries:
+            calendar = salary.calendar
+            try:
+                new, changed = replaced[calendar]
+            except KeyError:
+                new = calendar.replace(**kwargs)
+                changed = set(new.changed_periods(calendar))
+                replaced[calendar] = new, changed
+            if new is not calendar:
+                salary.calendar = new
+                rebased += salary.period in changed
+        return rebased
+
+    @contextmanager
+    def scenario(self, **kwargs):
+        """ Apply set_calendar for the duration of a with block, restoring
+        every salary's calendar afterwards
+        """
+        previous = self.calendars
+        self.set_calendar(**kwargs)
+        try:
+            yield self
+        finally:
+            self.calendars = previous
+
+    def per_period(self, field):
+        """ Converted amount of every salary for a period field, e.g. 'yearly' (list of Numeric) """
+        if field not in period_fields:
+            raise ValueError(f'Invalid argument provided: {field}')
+        return [getattr(salary, field) for salary in self.salaries]
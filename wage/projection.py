@@ -0,0 +1,238 @@
+""" Vectorized multi-year compensation projections
+
+    raises = [Raise(date(2026, 7, 1), percent=3, every=1), Raise(date(2027, 1, 1), amount=1000)]
+    result = project(salaries, raises, start=2026, stop=2029)
+    result.values    # ndarray, shape (len(salaries), pay dates), gross pay per pay date
+    result.totals()  # budget per pay date
+
+A raise schedule turns a base yearly amount into a yearly amount per pay
+date of the form base * scale + offset, with scale and offset depending
+only on the schedule. They are computed once per distinct schedule, so
+every employee and pay date is projected in a single broadcast instead of
+building a Salary per cell. Projections too large for memory are written in
+chunks to a memory mapped .npy file.
+"""
+from datetime import date
+import numpy as np
+from .batch import SalaryBatch
+from .businessdays import BusinessCalendar
+from .paycalendar import PayCalendar
+
+_year = PayCalendar.periods.index('year')
+
+
+class Raise:
+    """ A raise of the yearly amount taking effect on a date, optionally recurring """
+
+    __slots__ = ('effective', 'percent', 'amount', 'compound', 'every')
+
+    def __init__(self, effective, percent=0, amount=0, compound=True, every=None):
+        """ Raise initialization
+
+        Arguments:
+            effective: required: date from which pay dates include the raise (datetime.date)
+            percent: optional: percentage raise (int/float)
+            amount: optional: flat raise of the yearly amount (int/float)
+            compound: optional: apply percent to the current yearly amount,
+                      including earlier raises, rather than to the base amount (bool)
+            every: optional: years between recurrences, None for a one-off raise (int)
+
+        Examples:
+            Raise(date(2026, 7, 1), percent=3, every=1)  # 3% every July 1st, compounding
+            Raise(date(2027, 1, 1), amount=1000)  # $1,000 more per year from 2027
+            Raise(date(2026, 1, 1), percent=2, compound=False, every=1)  # 2% of the base amount yearly
+        """
+        if every is not None and (not isinstance(every, int) or every < 1):
+            raise ValueError(f'Invalid argument provided: {every}')
+        for value in (percent, amount):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f'Value not numeric: {value}')
+        self.percent = float(percent)
+        self.amount = float(amount)
+        self.effective = effective
+        self.compound = compound
+        self.every = every
+
+    def __repr__(self):
+        return (f'Raise({self.effective!r}, percent={self.percent:g}, amount={self.amount:g}, '
+                f'compound={self.compound}, every={self.every})')
+
+    def dates(self, until):
+        """ Lazily yield the dates the raise takes effect on, up to and including until """
+        day, years = self.effective, 0
+        while day <= until:
+            yield day
+            if self.every is None:
+                return
+            years += self.every
+            try:
+                day = self.effective.replace(year=self.effective.year + years)
+            except ValueError:
+                # February 29th in a common year
+                day = date(self.effective.year + years, 2, 28)
+
+    def apply(self, scale, offset):
+        """ (scale, offset) after the raise, given yearly amounts of base * scale + offset """
+        if self.compound:
+            factor = 1 + self.percent / 100
+            scale, offset = scale * factor, offset * factor
+        else:
+            scale += self.percent / 100
+        return scale, offset + self.amount
+
+
+def _coefficients(raises, ordinals, until):
+    """ Scale and offset of the yearly amount at every pay date (two ndarrays of float64) """
+    scale = np.ones(len(ordinals))
+    offset = np.zeros(len(ordinals))
+    current = (1.0, 0.0)
+    events = sorted(((day, i) for i, raise_ in enumerate(raises) for day in raise_.dates(until)))
+    for day, i in events:
+        current = raises[i].apply(*current)
+        start = np.searchsorted(ordinals, day.toordinal())
+        scale[start:], offset[start:] = current
+    return scale, offset
+
+
+def _base_amounts(salaries):
+    """ Yearly amount of every salary (ndarray of float64) """
+    if isinstance(salaries, SalaryBatch):
+        return salaries.yearly
+    periods = PayCalendar.periods
+    return np.array([float(salary.amount.value) * salary.calendar.float_ratios[periods.index(salary.period)][_year]
+                     for salary in salaries], dtype=np.float64)
+
+
+def _schedules(raises, count):
+    """ Distinct raise schedules and the schedule index of every salary """
+    raises = list(raises)
+    if all(isinstance(raise_, Raise) for raise_ in raises):
+        return [raises], np.zeros(count, dtype=np.intp)
+    if len(raises) != count:
+        raise ValueError(f'Expected {count} raise schedules, got {len(raises)}')
+    distinct = {}
+    index = np.empty(count, dtype=np.intp)
+    for row, schedule in enumerate(raises):
+        schedule = tuple(schedule)
+        if not all(isinstance(raise_, Raise) for raise_ in schedule):
+            raise TypeError(f'Invalid argument provided: {schedule}')
+        index[row] = distinct.setdefault(schedule, len(distinct))
+    return [list(schedule) for schedule in distinct], index
+
+
+class Projection:
+    """ Gross pay of salaries at every pay date of a period of years
+
+    values has shape (salaries, pay dates). It is a memory mapped .npy file
+    when the projection was written to a path, which np.load(path,
+    mmap_mode='r') opens again later. years holds the year each pay date
+    belongs to, which differs from its own year when it was rolled off a
+    non-working day into a neighboring year.
+    """
+
+    def __init__(self, values, dates, years, chunk_size=65536):
+        self.values = values
+        self.dates = dates
+        self.years = years
+        self.chunk_size = chunk_size
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return f'Projection(<{len(self)} salaries x {len(self.dates)} pay dates>)'
+
+    def _chunks(self):
+        for start in range(0, len(self.values), self.chunk_size):
+            yield start, np.asarray(self.values[start:start + self.chunk_size])
+
+    def rounded(self, decimals=2):
+        """ Every amount rounded half to even (ndarray of float64, loaded into memory) """
+        return np.round(self.values, decimals)
+
+    def totals(self):
+        """ Total gross pay at every pay date (ndarray of float64), summed chunk by chunk """
+        totals = np.zeros(len(self.dates))
+        for _, chunk in self._chunks():
+            totals += chunk.sum(axis=0)
+        return totals
+
+    def yearly_totals(self):
+        """ Total gross pay per year (dict of int to float) """
+        years = np.asarray(self.years)
+        totals = self.totals()
+        return {int(year): float(totals[years == year].sum()) for year in np.unique(years)}
+
+    def to_rows(self, decimals=2):
+        """ Lazily yield one dict per salary, e.g. for a CSV: the salary index and
+        the rounded amount at every pay date, keyed by its ISO date
+        """
+        keys = [day.isoformat() for day in self.dates]
+        for start, chunk in self._chunks():
+            for row, amounts in enumerate(np.round(chunk, decimals).tolist(), start):
+                obj = {'salary': row}
+                obj.update(zip(keys, amounts))
+                yield obj
+
+
+def project(salaries, raises=(), start=None, stop=None, schedule='monthly', path=None, chunk_size=65536):
+    """ Project gross pay of salaries at every pay date of years start to stop
+
+    Arguments:
+        salaries: required: salaries to project (iterable of Salary/Population/SalaryBatch)
+        raises: optional: one raise schedule shared by every salary (iterable of Raise),
+                or one schedule per salary (iterable of iterables of Raise)
+        start: optional: first year (int) (default: current year)
+        stop: optional: year to stop at, excluded (int) (default: start + 1)
+        schedule: optional: pay dates (str/BusinessCalendar) valid options:
+                  [weekly|fortnightly|semi-monthly|monthly]
+        path: optional: write values to this .npy file, memory mapped, instead of memory (str)
+        chunk_size: optional: salaries computed at once (int)
+
+    Gross pay at a pay date is the yearly amount in effect on that date,
+    raises included, divided by the number of pay dates of its year, so
+    weekly pay is lower in 53 pay week years.
+
+    Examples:
+        project(salaries, [Raise(date(2026, 7, 1), percent=3, every=1)], 2026, 2031)
+        project(population, schedules, 2026, 2028, schedule=BusinessCalendar('fortnightly', holidays))
+        project(salaries, raises, 2026, 2036, 'weekly', path='forecast.npy')
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Invalid argument provided: {chunk_size}')
+    if start is None:
+        start = date.today().year
+    if stop is None:
+        stop = start + 1
+    if stop <= start:
+        raise ValueError(f'Invalid argument provided: {stop}')
+    business = schedule if isinstance(schedule, BusinessCalendar) else BusinessCalendar(schedule)
+    dates, years, divisors = [], [], []
+    for year in range(start, stop):
+        pay_dates = business.pay_dates(year)
+        dates.extend(pay_dates)
+        years.extend([year] * len(pay_dates))
+        divisors.extend([len(pay_dates)] * len(pay_dates))
+    ordinals = np.array([day.toordinal() for day in dates])
+    divisors = np.array(divisors, dtype=np.float64)
+
+    if not isinstance(salaries, SalaryBatch):
+        salaries = list(salaries)
+    base = _base_amounts(salaries)
+    schedules, index = _schedules(raises, len(base))
+    coefficients = [_coefficients(schedule_raises, ordinals, max(dates)) for schedule_raises in schedules]
+    scales = np.stack([scale for scale, _ in coefficients]) / divisors
+    offsets = np.stack([offset for _, offset in coefficients]) / divisors
+
+    shape = (len(base), len(dates))
+    if path is None:
+        values = np.empty(shape)
+    else:
+        values = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=shape)
+    for first in range(0, len(base), chunk_size):
+        rows = slice(first, first + chunk_size)
+        codes = index[rows]
+        values[rows] = base[rows, np.newaxis] * scales[codes] + offsets[codes]
+    if path is not None:
+        values.flush()
+    return Projection(values, tuple(dates), tuple(years), chunk_size)
@@ -0,0 +1,138 @@
+""" Render reports for many salaries to a file object
+
+Reports are rendered in chunks: the converted amounts of a chunk of salaries
+are formatted column by column, joined into one string and written at once,
+so output streams with bounded memory and no per-salary string building.
+
+Formats:
+    table: aligned columns with a header, one row per salary
+    markdown: a Markdown table, one row per salary
+    csv: comma separated amounts with a header, one row per salary
+    text: the single salary report of the command line, once per salary
+
+Example:
+    render(salaries, sys.stdout, 'table', labels=names)
+"""
+import csv
+import io
+from itertools import islice
+from .currency import get_format
+from .formatters import Numeric
+from .interface import salary_report
+from .streaming import period_fields
+
+formats = ('table', 'markdown', 'csv', 'text')
+
+titles = tuple(field.title() for field in period_fields)
+
+
+def _columns(salaries, fmt, labels=None, money_format=None):
+    """ Formatted cells of the labels and every period field for a chunk of salaries (list of lists of str) """
+    columns = []
+    if labels is not None:
+        columns.append([label.replace('|', '\\|') for label in labels] if fmt == 'markdown' else labels)
+    for field in period_fields:
+        values = [getattr(salary, field).value for salary in salaries]
+        if fmt == 'csv':
+            columns.append([f'{value:.2f}' for value in values])
+        else:
+            columns.append(money_format.format_many(values))
+    return columns
+
+
+def column_widths(salaries, labels=None, money_format=None):
+    """ Width of each column needed to align every salary's cells (list of int)
+
+    Only the smallest and largest amount of each period is formatted.
+    """
+    money_format = get_format(money_format or Numeric.money_format)
+    widths = [max((len(str(label)) for label in labels), default=0)] if labels is not None else []
+    salaries = list(salaries) if not hasattr(salaries, '__len__') else salaries
+    for title, field in zip(titles, period_fields):
+        values = [getattr(salary, field).value for salary in salaries]
+        width = len(title)
+        if values:
+            width = max(width, *(len(money_format.format(value)) for value in (min(values), max(values))))
+        widths.append(width)
+    return widths
+
+
+def render(salaries, fp, fmt='table', labels=None, chunk_size=4096, widths=None, money_format=None):
+    """ Write a report of every salary to a file object as it goes
+
+    Parameters:
+        salaries: required: salaries to report (iterable of Salary)
+        fp: required: text file object to write to (file)
+        fmt: optional: report format (str) valid options: [table|markdown|csv|text]
+        labels: optional: a label per salary, e.g. employee names, shown in
+                the first column, or on the line above each text report (iterable)
+        chunk_size: optional: salaries formatted per write (int)
+        widths: optional: column widths for table and markdown, see column_widths (list of int)
+        money_format: optional: amount format for table, markdown and text,
+                      see wage.currency (MoneyFormat/str) (default: Numeric.money_format)
+
+    Table and markdown columns are aligned to widths. When not given, they
+    are computed up front if salaries (and labels) are sequences, otherwise
+    from the first chunk; wider cells in later chunks are not truncated.
+    """
+    if fmt not in formats:
+        raise ValueError(f'Invalid argument provided: {fmt}')
+    money_format = get_format(money_format or Numeric.money_format)
+    if fmt in ('table', 'markdown') and widths is None:
+        if hasattr(salaries, '__len__') and (labels is None or hasattr(labels, '__len__')):
+            widths = column_widths(salaries, labels, money_format)
+    salaries = iter(salaries)
+    labels = iter(labels) if labels is not None else None
+    header = ['Name'] if labels is not None else []
+    header += titles
+    first = True
+    while True:
+        chunk = list(islice(salaries, chunk_size))
+        chunk_labels = [str(label) for label in islice(labels, len(chunk))] if labels is not None else None
+        if not chunk and not first:
+            break
+        if fmt == 'text':
+            if chunk_labels is None:
+                fp.write(''.join(salary_report(salary, money_format) + '\n' for salary in chunk))
+            else:
+                fp.write(''.join(f'{label}\n{salary_report(salary, money_format)}\n'
+                                 for label, salary in zip(chunk_labels, chunk)))
+        else:
+            columns = _columns(chunk, fmt, chunk_labels, money_format)
+            if first and widths is None and fmt != 'csv':
+                widths = [max(len(title), *map(len, cells)) if cells else len(title)
+                          for title, cells in zip(header, columns)]
+            fp.write(_render_rows(fmt, header if first else None, columns, widths, chunk_labels is not None))
+        first = False
+        if len(chunk) < chunk_size:
+            break
+
+
+def _render_rows(fmt, header, columns, widths, labelled):
+    rows = zip(*columns)
+    if fmt == 'csv':
+        out = io.StringIO()
+        writer = csv.writer(out, lineterminator='\n')
+        if header is not None:
+            writer.writerow(header)
+        writer.writerows(rows)
+        return out.getvalue()
+    # The label column is left aligned, amounts are right aligned
+    aligns = ['<' if labelled and i == 0 else '>' for i in range(len(widths))]
+    templates = [f'{{:{align}{width}}}' for align, width in zip(aligns, widths)]
+    if fmt == 'table':
+        row_template = '  '.join(templates) + '\n'
+        lines = []
+        if header is not None:
+            lines.append(row_template.format(*header))
+            lines.append('  '.join('-' * width for width in widths) + '\n')
+    else:
+        row_template = '| ' + ' | '.join(templates) + ' |\n'
+        lines = []
+        if header is not None:
+            lines.append(row_template.format(*header))
+            lines.append('| ' + ' | '.join((':' + '-' * (width - 1)) if align == '<' else ('-' * (width - 1) + ':')
+                                           for align, width in zip(aligns, widths)) + ' |\n')
+    format_row = row_template.format
+    lines.extend(format_row(*row) for row in rows)
+    return ''.join(lines)
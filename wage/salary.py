@@ -1,22 +1,60 @@
-import json
 from operator import mul, truediv
-from .formatters import Numeric
+from . import instrumentation
+from .currency import get_format
+from .fixedpoint import FixedPoint
+from .formatters import Numeric, json_encoder
+from .paycalendar import PayCalendar
+
+
+def _dumps(name, build):
+    """ Encode the object returned by build to json, recorded as name when instrumented """
+    if not instrumentation.enabled:
+        return json_encoder().encode(build())
+    start = instrumentation.clock()
+    out = json_encoder().encode(build())
+    instrumentation.record(name, instrumentation.clock() - start, len(out))
+    return out
+
+
+def _yearly_occurrences_property(period):
+    """ Property reading/writing one period of the salary's PayCalendar """
+    def fget(self):
+        return self._calendar[period]
+
+    def fset(self, value):
+        self.calendar = self._calendar.replace(**{f'{period}s': value})
+
+    return property(fget, fset, doc=f'{period.title()}s in year (int)')
 
 
 class Salary:
     """ Class for calculation and conversion of salary by time period """
 
-    _period_yearly_defaults = {
-        'hour': 2080,
-        'day': 260,
-        'week': 52,
-        'fortnight': 26,
-        'month': 12,
-        'quarter': 4,
-        'semester': 2,
-        'year': 1,
+    __slots__ = ('_amount', '_period', '_calendar', '_cache')
+
+    _period_yearly_defaults = PayCalendar._period_yearly_defaults
+
+    _backends = {
+        'decimal': Numeric,
+        'fixed': FixedPoint,
     }
 
+    default_backend = 'decimal'
+
+    # Optional cache shared by every Salary (wage.cache.ConversionCache)
+    conversion_cache = None
+
+    _default_calendar = PayCalendar()
+
+    hours_in_year = _yearly_occurrences_property('hour')
+    days_in_year = _yearly_occurrences_property('day')
+    weeks_in_year = _yearly_occurrences_property('week')
+    fortnights_in_year = _yearly_occurrences_property('fortnight')
+    months_in_year = _yearly_occurrences_property('month')
+    quarters_in_year = _yearly_occurrences_property('quarter')
+    semesters_in_year = _yearly_occurrences_property('semester')
+    years_in_year = _yearly_occurrences_property('year')
+
     def __init__(self, *args, **kwargs):
         """ Salary initialization
 
@@ -33,14 +71,40 @@ class Salary:
             kwargs['months']: custom months in year (int) (default: 12)
             kwargs['quarters']: custom quarters in year (int) (default: 4)
             kwargs['semesters']: custom semesters in year (int) (default: 2)
+            kwargs['calendar']: yearly occurrences to start from (PayCalendar) (default: PayCalendar())
+            kwargs['backend']: arithmetic backend (string) (default: Salary.default_backend)
+                               valid options: [decimal|fixed]
 
         Examples:
             Salary(15, 'hour')
             Salary(31200, 'year')
             Salary(15, 'hour', hours=1040, days=130, weeks=26)
+            Salary(15, 'hour', calendar=PayCalendar(hours=1500))
+            Salary(15, 'hour', **BusinessCalendar().occurrences(2026))  # wage.businessdays
+            Salary(15, 'hour', backend='fixed')
+
+        The decimal backend stores amounts as Decimal (Numeric). The fixed
+        backend stores integer cents (FixedPoint), which is faster but rounds
+        amounts to the cent, see FixedPoint for its rounding policy. Set
+        Salary.default_backend to change the backend globally.
+
+        Converted amounts are cached and the cache is cleared whenever amount
+        or period is reassigned. Reassigning calendar or an *_in_year
+        attribute only drops the conversions depending on the changed
+        periods. Cached Numeric results are shared between calls and should
+        be treated as read-only.
+
+        Set Salary.conversion_cache to a wage.cache.ConversionCache to share
+        converted amounts between salaries with equal amount, period and
+        calendar.
+
+        Yearly occurrences are held by an interned PayCalendar shared by every
+        Salary with the same values, so large populations only pay for
+        distinct calendars.
         """
+        self._cache = None
         self._init_yearly_occurrences()
-        self._handle_args(args)
+        self._handle_args(args, kwargs.get('backend', self.default_backend))
         self._handle_kwargs(kwargs)
 
     def __repr__(self):
@@ -50,6 +114,10 @@ class Salary:
             value = getattr(self, f'{key}s_in_year')
             if value != self._period_yearly_defaults[key]:
                 out_str += f', {key}s={value}'
+        if type(self.amount) is not self._backends[self.default_backend]:
+            for backend, numeric in self._backends.items():
+                if type(self.amount) is numeric:
+                    out_str += f", backend='{backend}'"
         out_str += ')'
         return out_str
 
@@ -69,19 +137,69 @@ class Salary:
         obj['times_per_year'] = self.times_per_year
         return obj
 
+    @property
+    def amount(self):
+        """ Salary amount (Numeric) """
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = value
+        self._cache = None
+
+    @property
+    def calendar(self):
+        """ Yearly occurrences of each period (PayCalendar) """
+        return self._calendar
+
+    @calendar.setter
+    def calendar(self, value):
+        if not isinstance(value, PayCalendar):
+            raise ValueError(f'Invalid argument provided: {value}')
+        previous, self._calendar = self._calendar, value
+        if self._cache is not None:
+            self._invalidate_periods(value.changed_periods(previous))
+
+    def _invalidate_periods(self, periods):
+        """ Drop cached conversions depending on the yearly occurrences of periods
+
+        A change to the salary's own period changes the yearly amount and so
+        every conversion; any other period only invalidates its own.
+        """
+        if not periods:
+            return
+        if self._period in periods:
+            self._cache = None
+            return
+        cache = self._cache
+        if self.conversion_cache is not None:
+            # The conversions may be shared with other salaries
+            cache = self._cache = dict(cache)
+        cache.pop('per_period_summary', None)
+        for period in periods:
+            cache.pop(period, None)
+
+    @property
+    def period(self):
+        """ Salary amount period (str) """
+        return self._period
+
+    @period.setter
+    def period(self, value):
+        self._period = value
+        self._cache = None
+
     def _init_yearly_occurrences(self):
-        self.hours_in_year = self._period_yearly_defaults['hour']
-        self.days_in_year = self._period_yearly_defaults['day']
-        self.weeks_in_year = self._period_yearly_defaults['week']
-        self.fortnights_in_year = self._period_yearly_defaults['fortnight']
-        self.months_in_year = self._period_yearly_defaults['month']
-        self.quarters_in_year = self._period_yearly_defaults['quarter']
-        self.semesters_in_year = self._period_yearly_defaults['semester']
-        self.years_in_year = self._period_yearly_defaults['year']
-
-    def _handle_args(self, args):
+        self._calendar = self._default_calendar
+
+    def _handle_args(self, args, backend='decimal'):
+        try:
+            numeric = self._backends[backend]
+        except KeyError:
+            raise ValueError(f'Invalid argument provided: {backend}')
+
         try:
-            self.amount = Numeric(args[0])
+            self.amount = numeric(args[0])
         except (IndexError, ValueError) as err:
             raise err
 
@@ -94,9 +212,25 @@ class Salary:
             raise err
 
     def _handle_kwargs(self, kwargs):
+        if 'calendar' in kwargs:
+            # Only a PayCalendar, never a string from the command line or a data row
+            if not isinstance(kwargs['calendar'], PayCalendar):
+                raise ValueError(f"Invalid argument provided: {kwargs['calendar']}")
+            self._calendar = kwargs['calendar']
+        calendar_kwargs = {}
         for k, v in kwargs.items():
             if k[:-1] in self._period_yearly_defaults and k[:-1] != 'year':
-                setattr(self, f'{k}_in_year', int(v))
+                calendar_kwargs[k] = v
+        if calendar_kwargs:
+            self._calendar = self._calendar.replace(**calendar_kwargs)
+
+    def _get_cache(self):
+        if self._cache is None:
+            if self.conversion_cache is None:
+                self._cache = {}
+            else:
+                self._cache = self.conversion_cache.lookup(self._amount, self._period, self._calendar)
+        return self._cache
 
     def per_period(self, amount, period, operation=truediv):
         """ Calculate amount per given period using operation callback function
@@ -105,88 +239,165 @@ class Salary:
             amount: required: the amount to base calculation on (Decimal/Numeric)
             period: required: the period to use for the calculation (str)
             operation: optional: which operator to use against (amount, period) (function)
+
+        Numeric amounts keep their backend, e.g. a FixedPoint amount returns
+        a FixedPoint result.
         """
-        return Numeric(operation(amount, getattr(self, f'{period}s_in_year')))
+        start = instrumentation.clock() if instrumentation.enabled else None
+        result = operation(amount, self._calendar[period])
+        result = result if isinstance(result, Numeric) else Numeric(result)
+        if start is not None:
+            instrumentation.record(f'salary.per_period.{period}', instrumentation.clock() - start)
+        return result
+
+    def _per_period_cached(self, period):
+        """ Yearly amount converted to given period, cached until invalidated """
+        cache = self._get_cache()
+        try:
+            return cache[period]
+        except KeyError:
+            amount = cache[period] = self.per_period(self.yearly, period)
+            return amount
 
-    def serialize_by_period(self, period):
-        """ Serialize converted amount by specified period to json
+    def to_dict(self, money_format=None):
+        """ Serializable dictionary representation of Salary instance
+
+        Parameters:
+            money_format: optional: format of every dollars amount (MoneyFormat/str)
+                          (default: Numeric.money_format)
+        """
+        money_format = self._amount.money_format if money_format is None else get_format(money_format)
+        obj = {}
+        obj['amount'] = self.amount.to_dict(money_format)
+        obj['period'] = self.period
+        obj['per_period_summary'] = self._summary(money_format)
+        obj['times_per_year'] = self.times_per_year
+        return obj
+
+    def to_dict_by_period(self, period):
+        """ Serializable dictionary representation of converted amount by specified period
 
         Parameters:
             period: required: the period to use for the calculation (str)
         """
         obj = {}
-        obj['amount'] = json.loads(self.per_period(self.yearly.decimal, period).serialize())
+        obj['amount'] = self._per_period_cached(period).to_dict()
         obj['period'] = period
-        obj['times_per_year'] = getattr(self, f'{period}s_in_year')
-        return json.dumps(obj)
+        obj['times_per_year'] = self._calendar[period]
+        return obj
+
+    def serialize_by_period(self, period):
+        """ Serialize converted amount by specified period to json
+
+        Parameters:
+            period: required: the period to use for the calculation (str)
+        """
+        return _dumps('salary.serialize_by_period', lambda: self.to_dict_by_period(period))
 
     def serialize_per_period_summary(self):
         """ Serialize all converted amounts per period to json
         """
-        return json.dumps(self.per_period_summary)
+        return _dumps('salary.serialize_per_period_summary', lambda: self.per_period_summary)
 
     def serialize_times_per_year(self):
         """ Serialize all yearly occurrences to json """
-        return json.dumps(self.times_per_year)
+        return _dumps('salary.serialize_times_per_year', lambda: self.times_per_year)
 
-    def serialize(self):
-        """ Serialize summary representation of Salary instance to json """
-        obj = self.__dict__
-        obj['amount'] = json.loads(self.amount.serialize())
-        return json.dumps(obj)
+    def serialize(self, money_format=None):
+        """ Serialize summary representation of Salary instance to json, see to_dict """
+        return _dumps('salary.serialize', lambda: self.to_dict(money_format))
 
     @property
     def yearly(self):
         """ Yearly amount (Numeric) """
-        return self.per_period(self.amount.decimal, self.period, operation=mul)
+        cache = self._get_cache()
+        try:
+            return cache['yearly']
+        except KeyError:
+            amount = cache['yearly'] = self.per_period(self.amount, self.period, operation=mul)
+            return amount
 
     @property
     def hourly(self):
         """ Hourly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'hour')
+        return self._per_period_cached('hour')
 
     @property
     def daily(self):
         """ Daily amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'day')
+        return self._per_period_cached('day')
 
     @property
     def weekly(self):
         """ Weekly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'week')
+        return self._per_period_cached('week')
 
     @property
     def fortnightly(self):
         """ Fortnightly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'fortnight')
+        return self._per_period_cached('fortnight')
 
     @property
     def monthly(self):
         """ Monthly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'month')
+        return self._per_period_cached('month')
 
     @property
     def quarterly(self):
         """ Quarterly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'quarter')
+        return self._per_period_cached('quarter')
 
     @property
     def semesterly(self):
         """ Semesterly amount (Numeric) """
-        return self.per_period(self.yearly.decimal, 'semester')
+        return self._per_period_cached('semester')
 
     @property
     def times_per_year(self):
         """ Dictionary representation of times per year """
-        obj = {}
-        for period in self._period_yearly_defaults:
-            obj[period] = getattr(self, f'{period}s_in_year')
-        return obj
+        return self._calendar.times_per_year
 
     @property
     def per_period_summary(self):
         """ Dictionary representation of per period summary """
-        obj = {}
-        for period in self._period_yearly_defaults:
-            obj[period] = json.loads(self.per_period(self.yearly.decimal, period).serialize())
-        return obj
+        return self._summary(self._amount.money_format)
+
+    def _summary(self, money_format):
+        """ Per period summary formatted with money_format, cached along with the format """
+        cache = self._get_cache()
+        cached = cache.get('per_period_summary')
+        if cached is not None and cached[0] is money_format:
+            summary = cached[1]
+        else:
+            if isinstance(self._amount, FixedPoint) and not instrumentation.enabled:
+                # Integer fast path, see FixedPoint.summarize
+                summary = self._amount.summarize(self._calendar, self._period, money_format)
+            else:
+                # The class format is passed as None, so each amount's cached dollars are used
+                numeric_format = None if money_format is self._amount.money_format else money_format
+                summary = {}
+                for period in self._period_yearly_defaults:
+                    summary[period] = self._per_period_cached(period).to_dict(numeric_format)
+            cache['per_period_summary'] = (money_format, summary)
+        return {period: dict(amount) for period, amount in summary.items()}
+
+
+def dump_salaries(salaries, fp):
+    """ Write the serialized form of each salary to a file object, one per line
+
+    Each line is identical to Salary.serialize(). Salaries are encoded one at
+    a time, so no combined string is built for the whole population.
+
+    Parameters:
+        salaries: required: salaries to serialize (iterable of Salary)
+        fp: required: text file object to write to (file)
+    """
+    encode = json_encoder().encode
+    write = fp.write
+    for salary in salaries:
+        start = instrumentation.clock() if instrumentation.enabled else None
+        line = encode(salary.to_dict())
+        write(line)
+        write('\n')
+        if start is not None:
+            instrumentation.record('salary.dump_salaries', instrumentation.clock() - start, len(line) + 1)
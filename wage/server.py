@@ -0,0 +1,284 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+from .salary import Salary
+
+reasons = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    411: 'Length Required',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+
+def convert(item):
+    """ Convert one request item ({'amount', 'period', **calendar kwargs}) to a result dict """
+    try:
+        kwargs = {k: v for k, v in item.items() if k not in ('amount', 'period')}
+        return Salary(item.get('amount'), item.get('period'), **kwargs).to_dict()
+    except ArithmeticError:
+        # Decimal signals, e.g. Overflow converting an amount of 1e999999999
+        return {'error': f'Value out of range: {item.get("amount")}'}
+    except (AttributeError, IndexError, TypeError, ValueError) as err:
+        return {'error': str(err) or type(err).__name__}
+
+
+def convert_many(items):
+    """ Convert a list of request items, see convert (runs in a worker) """
+    return [convert(item) for item in items]
+
+
+class Batcher:
+    """ Coalesce concurrent single conversions into one worker job
+
+    Items submitted within delay seconds of each other, up to size items,
+    are converted together, so a burst of small requests costs one round
+    trip to the worker pool instead of one each.
+    """
+
+    def __init__(self, server, size=64, delay=0.001):
+        self.server = server
+        self.size = size
+        self.delay = delay
+        self._pending = []
+        self._flush_handle = None
+        # Running batches, referenced so they can't be garbage collected
+        self._tasks = set()
+
+    def submit(self, item):
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.size:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.delay, self.flush)
+        return future
+
+    def flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending):
+        try:
+            results = await self.server.run_in_pool([item for item, _ in pending])
+        except Exception as err:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), result in zip(pending, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class Server:
+    """ Local HTTP/JSON conversion service
+
+    Endpoints:
+        GET  /health
+        GET  /convert?amount=15&period=hour[&hours=1500...]
+        POST /convert          {"amount": 15, "period": "hour", "hours": 1500}
+        POST /convert/batch    [{"amount": 15, "period": "hour"}, ...]
+
+    Connections are kept alive between requests (HTTP/1.1). Conversions
+    run in a bounded worker pool; at most max_pending jobs wait for it,
+    beyond which requests are answered 503.
+    """
+
+    def __init__(self, host='127.0.0.1', port=8080, workers=None, executor='process',
+                 max_pending=1024, max_body=16 * 1024 * 1024, batch_size=64, batch_delay=0.001):
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 1
+        self.executor_type = executor
+        self.max_pending = max_pending
+        self.max_body = max_body
+        self.batcher = Batcher(self, batch_size, batch_delay)
+        self._executor = None
+        self._slots = None
+        self._server = None
+        # Handler task of every open connection, by its writer
+        self._connections = {}
+
+    async def start(self):
+        if self.executor_type == 'process':
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        elif self.executor_type == 'thread':
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        else:
+            raise ValueError(f'Invalid argument provided: {self.executor_type}')
+        self._slots = asyncio.Semaphore(self.max_pending)
+        self._server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections end their handlers on end of input,
+            # rather than leaving them to be cancelled with the event loop
+            for writer in list(self._connections):
+                writer.close()
+            if self._connections:
+                await asyncio.wait(list(self._connections.values()))
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def run_in_pool(self, items):
+        if self._slots.locked():
+            raise OverflowError('Too many pending conversions')
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, convert_many, items)
+
+    async def handle(self, reader, writer):
+        self._connections[writer] = asyncio.current_task()
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                method, target, version, headers = self.parse_head(head)
+                keep_alive = self.keep_alive(version, headers)
+                length, error = self.content_length(headers)
+                if error is not None:
+                    # The request body can't be skipped, so the connection ends here
+                    self.write_response(writer, error[0], error[1], False)
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length)
+                status, payload = await self.respond(method, target, body)
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            del self._connections[writer]
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    def parse_head(head):
+        lines = head.decode('latin-1').split('\r\n')
+        try:
+            method, target, version = lines[0].split(' ', 2)
+        except ValueError:
+            method, target, version = '', '', 'HTTP/1.0'
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                k, v = line.split(':', 1)
+                headers[k.strip().lower()] = v.strip()
+        return method, target, version, headers
+
+    @staticmethod
+    def keep_alive(version, headers):
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            return connection != 'close'
+        return connection == 'keep-alive'
+
+    def content_length(self, headers):
+        """ Request body length and an error response (status, body) or None """
+        if 'transfer-encoding' in headers:
+            return 0, (411, {'error': 'Content-Length required'})
+        try:
+            length = int(headers.get('content-length', 0))
+        except ValueError:
+            return 0, (400, {'error': 'Invalid Content-Length'})
+        if length < 0:
+            return 0, (400, {'error': 'Invalid Content-Length'})
+        if length > self.max_body:
+            return 0, (413, {'error': 'Request body too large'})
+        return length, None
+
+    async def respond(self, method, target, body):
+        """ Response (status, body) to a request, 500 on unexpected errors """
+        url = urlsplit(target)
+        route = self.routes.get(url.path)
+        if route is None:
+            return 404, {'error': f'Not found: {url.path}'}
+        try:
+            status, result = await route(self, method, url, body)
+        except ValueError as err:
+            return 400, {'error': f'Invalid JSON: {err}'}
+        except OverflowError as err:
+            return 503, {'error': str(err)}
+        except Exception as err:
+            return 500, {'error': str(err) or type(err).__name__}
+        if status == 200 and isinstance(result, dict) and 'error' in result:
+            return 400, result
+        return status, result
+
+    async def health(self, method, url, body):
+        return 200, {'status': 'ok'}
+
+    async def convert_one(self, method, url, body):
+        if method == 'GET':
+            item = dict(parse_qsl(url.query))
+        elif method == 'POST':
+            item = json.loads(body)
+        else:
+            return 405, {'error': f'Method not allowed: {method}'}
+        if not isinstance(item, dict):
+            return 400, {'error': 'Expected a JSON object'}
+        return 200, await self.batcher.submit(item)
+
+    async def convert_batch(self, method, url, body):
+        if method != 'POST':
+            return 405, {'error': f'Method not allowed: {method}'}
+        items = json.loads(body)
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return 400, {'error': 'Expected a JSON array of objects'}
+        return 200, await self.run_in_pool(items)
+
+    routes = {
+        '/health': health,
+        '/convert': convert_one,
+        '/convert/batch': convert_batch,
+    }
+
+    @staticmethod
+    def write_response(writer, status, body, keep_alive):
+        payload = json.dumps(body).encode()
+        writer.write(
+            f'HTTP/1.1 {status} {reasons[status]}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(payload)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+            f'\r\n'.encode('latin-1') + payload)
+
+
+def serve(host='127.0.0.1', port=8080, workers=None, executor='process', **kwargs):
+    """ Run the conversion service until interrupted, see Server """
+    server = Server(host, port, workers, executor, **kwargs)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
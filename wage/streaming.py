@@ -0,0 +1,129 @@
+import csv
+import json
+from .salary import Salary
+
+period_fields = (
+    'hourly',
+    'daily',
+    'weekly',
+    'fortnightly',
+    'monthly',
+    'quarterly',
+    'semesterly',
+    'yearly',
+)
+
+formats = ('csv', 'jsonl')
+
+
+def guess_format(path):
+    """ Guess input format from a file name, defaulting to csv """
+    if path.endswith(('.jsonl', '.ndjson', '.json')):
+        return 'jsonl'
+    return 'csv'
+
+
+def read_rows(fp, fmt='csv'):
+    """ Lazily read salary rows (dicts) from a file object
+
+    Parameters:
+        fp: required: text file object to read from (file)
+        fmt: optional: input format (str) valid options: [csv|jsonl]
+
+    Each row needs 'amount' and 'period' fields; any calendar keyword
+    accepted by Salary (hours, days, weeks, ...) may be given as well.
+    Malformed JSON Lines are yielded as the raw line, see row_dict.
+    """
+    if fmt == 'csv':
+        yield from csv.DictReader(fp)
+    elif fmt == 'jsonl':
+        for line in fp:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # Left to row_dict, so the line fails as one invalid row
+                    yield line
+    else:
+        raise ValueError(f'Invalid argument provided: {fmt}')
+
+
+def row_dict(row):
+    """ The dict of a row from read_rows, raising ValueError for malformed or non-object JSON Lines """
+    if isinstance(row, str):
+        row = json.loads(row)
+    if not isinstance(row, dict):
+        raise ValueError(f'Invalid argument provided: {row}')
+    return row
+
+
+def error_message(err):
+    """ Message reported for an invalid row or conversion error """
+    if isinstance(err, ArithmeticError):
+        # Decimal signals, e.g. Overflow, only print as a list of classes
+        return f'Value out of range: {type(err).__name__}'
+    return str(err) or type(err).__name__
+
+
+def row_salary(row):
+    """ Build a Salary from a row dict """
+    row = row_dict(row)
+    kwargs = {k: v for k, v in row.items() if k not in ('amount', 'period') and v not in (None, '')}
+    return Salary(row.get('amount'), row.get('period'), **kwargs)
+
+
+def convert_row(row):
+    """ Convert a row dict to a dict of the input and every period amount """
+    row = row_dict(row)
+    salary = row_salary(row)
+    out = {'amount': row['amount'], 'period': row['period']}
+    for field in period_fields:
+        out[field] = getattr(salary, field).decimal
+    return out
+
+
+def convert_rows(rows, errors='raise', on_error=None):
+    """ Lazily convert row dicts, see convert_row
+
+    Parameters:
+        rows: required: row dicts to convert (iterable)
+        errors: optional: what to do with invalid rows (str) valid options: [raise|skip]
+        on_error: optional: called with (row number, row, error) for skipped rows (function)
+    """
+    if errors not in ('raise', 'skip'):
+        raise ValueError(f'Invalid argument provided: {errors}')
+    for number, row in enumerate(rows, 1):
+        try:
+            yield convert_row(row)
+        except (ArithmeticError, AttributeError, IndexError, KeyError, TypeError, ValueError) as err:
+            if errors == 'raise':
+                raise ValueError(f'Invalid row {number}: {error_message(err)}') from err
+            if on_error is not None:
+                on_error(number, row, err)
+
+
+def write_rows(rows, fp, fmt='csv', header=True):
+    """ Write converted rows to a file object as they arrive
+
+    Parameters:
+        rows: required: converted row dicts (iterable)
+        fp: required: text file object to write to (file)
+        fmt: optional: output format (str) valid options: [csv|jsonl]
+        header: optional: write a csv header row first (bool)
+    """
+    fields = ('amount', 'period') + period_fields
+    if fmt == 'csv':
+        writer = csv.writer(fp, lineterminator='\n')
+        if header:
+            writer.writerow(fields)
+        for row in rows:
+            writer.writerow([row['amount'], row['period']] + [f'{row[f]:.2f}' for f in period_fields])
+    elif fmt == 'jsonl':
+        for row in rows:
+            obj = {'amount': row['amount'], 'period': row['period']}
+            for field in period_fields:
+                obj[field] = float(round(row[field], 2))
+            fp.write(json.dumps(obj))
+            fp.write('\n')
+    else:
+        raise ValueError(f'Invalid argument provided: {fmt}')
@@ -0,0 +1,113 @@
+""" Vectorized sensitivity sweeps of salaries over calendar parameters
+
+    result = sweep(salaries, hours=range(1000, 2601, 10), weeks=range(48, 53))
+    result.per_period('hourly')  # ndarray, shape (len(salaries), 161, 5)
+
+Every cell of the grid, for every salary, is converted in one SalaryBatch
+pass instead of constructing a Salary per cell.
+"""
+import numpy as np
+from .batch import SalaryBatch
+from .paycalendar import PayCalendar
+from .salary import Salary
+from .streaming import period_fields
+
+
+class Sweep:
+    """ Conversions of salaries over a grid of calendar parameters
+
+    values has shape (salaries, *grid, periods): one axis per salary, one
+    per swept parameter in the order given, and one per period field.
+    When a single Salary was swept, the salary axis is left out.
+    """
+
+    def __init__(self, batch, shape, axes, single=False):
+        self.batch = batch
+        self.shape = shape
+        self.axes = axes
+        self.single = single
+
+    def __repr__(self):
+        grid = ', '.join(f'{name}={len(values)}' for name, values in self.axes.items())
+        return f'Sweep(<{self.shape[0]} salaries x {grid}>)'
+
+    def _reshape(self, array):
+        array = array.reshape(self.shape + array.shape[1:])
+        return array[0] if self.single else array
+
+    @property
+    def values(self):
+        """ Every conversion (ndarray of float64, see Sweep) """
+        return self._reshape(self.batch.per_period_summary)
+
+    def rounded(self, decimals=2):
+        """ Every conversion rounded half to even, see SalaryBatch.rounded """
+        return self._reshape(self.batch.rounded(decimals))
+
+    def per_period(self, field):
+        """ Conversions for one period field, e.g. 'hourly' (ndarray, shape of values without the period axis) """
+        if field not in period_fields:
+            raise ValueError(f'Invalid argument provided: {field}')
+        return self.values[..., period_fields.index(field)]
+
+    def to_rows(self, decimals=2):
+        """ Lazily yield one dict per salary and grid cell, e.g. for a CSV or a DataFrame
+
+        Each row holds the salary index, the swept parameter values and the
+        rounded conversions for every period field.
+        """
+        rounded = self.batch.rounded(decimals).tolist()
+        names = list(self.axes)
+        cells = np.stack(np.meshgrid(*self.axes.values(), indexing='ij'), axis=-1).reshape(-1, len(names)).tolist()
+        for row, amounts in enumerate(rounded):
+            salary, cell = divmod(row, len(cells))
+            obj = {'salary': salary}
+            obj.update(zip(names, cells[cell]))
+            obj.update(zip(period_fields, amounts))
+            yield obj
+
+
+def sweep(salaries, **grid):
+    """ Convert salaries for every combination of calendar parameters
+
+    Arguments:
+        salaries: required: salary or salaries to sweep (Salary/iterable of Salary)
+
+    Keyword arguments:
+        Calendar parameters to sweep, as accepted by Salary (hours, days,
+        weeks, ...), each a sequence of yearly occurrences, e.g.
+        hours=range(1000, 2601, 10). Parameters not swept keep each
+        salary's own value.
+
+    Examples:
+        sweep(Salary(15, 'hour'), hours=range(1000, 2601, 10), weeks=range(48, 53))
+        sweep(population, hours=[1950, 2080])
+    """
+    single = isinstance(salaries, Salary)
+    salaries = [salaries] if single else list(salaries)
+    if not grid:
+        raise ValueError('No calendar parameters to sweep')
+    axes = {}
+    for name, values in grid.items():
+        if name[:-1] not in PayCalendar.periods or name == 'years':
+            raise TypeError(f'Invalid argument provided: {name}')
+        try:
+            values = np.asarray(values, dtype=np.float64).astype(np.int64).reshape(-1)
+        except (TypeError, ValueError):
+            raise ValueError(f'Value not numeric: {values}')
+        if not len(values) or values.min() <= 0:
+            raise ValueError(f'Invalid yearly occurrences: {name}')
+        axes[name] = values
+    shape = (len(salaries),) + tuple(len(values) for values in axes.values())
+    cells = int(np.prod(shape[1:]))
+
+    amounts = np.repeat(np.array([float(salary.amount.value) for salary in salaries]), cells)
+    periods = np.repeat(np.array([PayCalendar.periods.index(salary.period) for salary in salaries],
+                                 dtype=np.intp), cells)
+    times = np.array([salary.calendar.times for salary in salaries], dtype=np.int64)
+    times = np.repeat(times.reshape(-1, len(PayCalendar.periods)), cells, axis=0)
+    mesh = np.meshgrid(*axes.values(), indexing='ij')
+    for name, values in zip(axes, mesh):
+        times[:, PayCalendar.periods.index(name[:-1])] = np.tile(values.reshape(-1), len(salaries))
+    kwargs = {f'{period}s': times[:, i] for i, period in enumerate(PayCalendar.periods) if period != 'year'}
+    return Sweep(SalaryBatch(amounts, periods, **kwargs), shape, axes, single)